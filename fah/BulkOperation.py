@@ -0,0 +1,168 @@
+################################################################################
+#                                                                              #
+#                    Folding@Home Client Control (FAHControl)                  #
+#                   Copyright (C) 2016-2020 foldingathome.org                  #
+#                  Copyright (C) 2010-2016 Stanford University                 #
+#                                                                              #
+#      This program is free software: you can redistribute it and/or modify    #
+#      it under the terms of the GNU General Public License as published by    #
+#       the Free Software Foundation, either version 3 of the License, or      #
+#                      (at your option) any later version.                     #
+#                                                                              #
+#        This program is distributed in the hope that it will be useful,       #
+#         but WITHOUT ANY WARRANTY; without even the implied warranty of       #
+#         MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the        #
+#                  GNU General Public License for more details.                #
+#                                                                              #
+#       You should have received a copy of the GNU General Public License      #
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.    #
+#                                                                              #
+################################################################################
+
+import time
+
+debug = False
+
+
+def slots_paused(slots, value):
+    return all([slot['status'] == 'PAUSED' for slot in slots])
+
+
+def slots_unpaused(slots, value):
+    return not [slot for slot in slots if slot['status'] == 'PAUSED']
+
+
+def slots_finishing(slots, value):
+    return all([slot['status'] in ('FINISHING', 'PAUSED') for slot in slots])
+
+
+def power_set(options, value):
+    return options.get('power') == value
+
+
+# Action name -> (command, reply type, check, verb)
+# The reply is requested right after the command, the check decides if the
+# command has taken effect.
+bulk_actions = {
+    'unpause': ('unpause', 'slots', slots_unpaused, 'Folding'),
+    'pause': ('pause', 'slots', slots_paused, 'Pausing'),
+    'finish': ('finish', 'slots', slots_finishing, 'Finishing'),
+    'power': ('option power %s', 'options', power_set, 'Setting power on'),
+    }
+
+
+class BulkOperation:
+    '''Sends one command to many clients and tracks when each has applied it.
+
+    The commands are queued on the clients' connections without waiting for
+    replies.  Each command is followed by a request for slot info or options
+    and a client succeeds when that, or any later, reply shows the change.
+    Clients which are offline fail at once, those which don't reply in time
+    fail on timeout.
+
+    Clients are anything with name, conn, is_online() and expect().
+    '''
+
+    def __init__(self, clients, action, value = None, timeout = 10):
+        if action not in bulk_actions:
+            raise Exception('Unknown bulk action "%s"' % action)
+
+        self.clients = list(clients)
+        self.action = action
+        self.value = value
+        self.timeout = timeout
+        self.command, self.reply, self.check, self.verb = bulk_actions[action]
+        if '%' in self.command: self.command %= value
+
+        self.pending = set()
+        self.succeeded = set()
+        self.failed = {} # client -> reason
+        self.start_time = None
+        self.end_time = None
+
+
+    def get_request(self, client):
+        if self.reply == 'options': return client.get_options_cmd()
+        return 'slot-info'
+
+
+    def start(self):
+        self.start_time = time.time()
+
+        for client in self.clients:
+            if not client.is_online():
+                self.failed[client] = 'offline'
+                continue
+
+            self.pending.add(client)
+            client.expect(self.reply, self.make_callback(client))
+            client.conn.forget_frames() # Decode the reply even if unchanged
+            client.conn.queue_commands([self.command,
+                                        self.get_request(client)])
+
+        self.update()
+
+
+    def make_callback(self, client):
+        def callback(data): return self.process_reply(client, data)
+        return callback
+
+
+    def process_reply(self, client, data):
+        '''Returns True once the client no longer needs replies.'''
+        if client not in self.pending: return True
+
+        try:
+            if not self.check(data, self.value): return False
+        except Exception as e:
+            if debug: print('%s: bad %s reply: %s' % (client, self.reply, e))
+            return False
+
+        self.pending.discard(client)
+        self.succeeded.add(client)
+        if not self.pending: self.end_time = time.time()
+        return True
+
+
+    def update(self):
+        '''Fails clients which did not apply the command in time.'''
+        if not self.pending: return
+        if time.time() < self.start_time + self.timeout: return
+
+        for client in self.pending:
+            if client.is_online(): self.failed[client] = 'no reply'
+            else: self.failed[client] = 'disconnected'
+
+        self.pending.clear()
+        self.end_time = time.time()
+
+
+    def is_done(self): return not self.pending
+
+
+    def get_status(self):
+        '''Returns a one line summary of the progress or result.'''
+        total = len(self.clients)
+        text = '%s %d client%s: %d done' % (
+            self.verb, total, '' if total == 1 else 's', len(self.succeeded))
+
+        if self.failed:
+            reasons = {}
+            for reason in self.failed.values():
+                reasons[reason] = reasons.get(reason, 0) + 1
+
+            text += ', %d failed (%s)' % (len(self.failed), ', '.join(
+                        ['%d %s' % (count, reason)
+                         for reason, count in sorted(reasons.items())]))
+
+        if self.pending: text += ', %d waiting' % len(self.pending)
+        elif self.end_time is not None:
+            text += ' in %.1fs' % (self.end_time - self.start_time)
+
+        return text
+
+
+    def get_failures(self):
+        '''Returns (client name, reason) of the failed clients by name.'''
+        return sorted([(str(client), reason)
+                       for client, reason in self.failed.items()])
@@ -21,7 +21,6 @@
 
 import traceback
 import time
-import re
 import copy
 import collections
 import gtk
@@ -32,27 +31,66 @@ import signal
 import os
 import shlex
 
-from fah import *
+from fah import Connection, ClientConfig, SlotConfig, coalesce_messages
+from fah import count_slots, format_slot_counts, get_next_eta, format_eta
+from fah import get_unit_errors, make_work_units
 from fah.util import status_to_color, make_row, get_home_dir
 
 debug = False
 
+# Seconds between updates when the client is selected or folding, when it is
+# not folding and when the window is hidden or minimized
+update_rates = {
+    'active': {'heartbeat': 4, 'ppd': 5, 'options': 1, 'queue-info': 4,
+               'slot-info': 1},
+    'idle':   {'heartbeat': 10, 'ppd': 30, 'options': 10, 'queue-info': 15,
+               'slot-info': 10},
+    'hidden': {'heartbeat': 30, 'ppd': 60, 'options': 60, 'queue-info': 60,
+               'slot-info': 60},
+    }
+
+# Minimum seconds between the slot and queue updates of clients which are not
+# selected.  These keep the fleet columns and the cached state shown when the
+# client is selected current.
+summary_rates = {'queue-info': 30, 'slot-info': 15}
+
+
+def format_byte_rate(rate):
+    for unit in ('B', 'KiB', 'MiB'):
+        if rate < 1024 or unit == 'MiB': break
+        rate /= 1024.0
+    if unit == 'B': return '%d B/s' % rate
+    return '%.1f %s/s' % (rate, unit)
+
+
+def parse_tags(text):
+    '''Returns the sorted, unique tags in a comma or space separated list.'''
+    return sorted(set(text.replace(',', ' ').split()))
+
 
 class Client:
-    def __init__(self, app, name, address, port, password):
+    def __init__(self, app, name, address, port, password, tags = ''):
         if debug: print('Client.__init__()')
 
         self.name = name
         self.address = address
         self.port = port
         self.password = password
+        self.tags = parse_tags(tags)
 
         self.set_updated(False)
         self.selected = False
         self.ppd = 0
-        self.power = ''
+        self.rate_mode = 'active'
+        self.byte_rate = 0
+        self.last_byte_count = 0
+        self.last_byte_time = 0
 
         self.error_messages = set()
+        self.expected = {} # Message type -> callbacks, see expect()
+        self.summary = app.fleet.add()
+        self.unit_errors = 0
+        self.last_error = ''
 
         if not name: self.name = self.get_address()
 
@@ -61,26 +99,16 @@ class Client:
         self.option_names = map(lambda name: name.replace('_', '-'), names)
         self.option_names.append('power') # Folding power
 
-        # Init commands
-        self.inactive_cmds = [
-            'updates clear',
-            'updates add 0 4 $heartbeat',
-            'updates add 1 5 $ppd',
-            ]
-
-        self.active_cmds = self.inactive_cmds + [
-            'updates add 2 1 $(options %s *)' % ' '.join(self.option_names),
-            'updates add 3 4 $queue-info',
-            'updates add 4 1 $slot-info',
-            'info',
-            'log-updates start',
-            'configured',
-            ]
-
         # Objects
         self.config = ClientConfig()
-        self.conn = Connection(self.address, self.port, self.password)
-        self.conn.set_init_commands(self.inactive_cmds)
+        self.conn = Connection(self.address, self.port, self.password,
+                               poller = app.network.poller,
+                               scheduler = app.network.scheduler,
+                               resolver = app.network.resolver)
+        self.conn.set_init_commands(self.get_init_cmds())
+        self.last_status = self.get_status()
+        app.fleet.update(self.summary, status = self.last_status)
+        app.network.add(self.conn, self)
 
 
     # Class special functions
@@ -98,12 +126,68 @@ class Client:
 
     def get_status(self):
         status = self.conn.get_status()
-        if status == 'Online' and not self.is_updated() and self.selected:
-            return 'Updating'
+        if status == 'Online':
+            if self.conn.is_congested(): return 'Congested'
+            if not self.is_updated() and self.selected: return 'Updating'
         return status
 
 
     def get_selected_slot(self, app): return self.config.get_selected_slot(app)
+    def get_tags(self): return ' '.join(self.tags)
+
+
+    def get_options_cmd(self):
+        return 'options %s *' % ' '.join(self.option_names)
+
+
+    def get_update_cmds(self):
+        '''Every client sends heartbeats, PPD and a slow summary of its slots
+        and units.  Only the selected client also sends its options and
+        updates its slots and units at the full rate.'''
+        rates = update_rates[self.rate_mode]
+        cmds = [
+            'updates add 0 %d $heartbeat' % rates['heartbeat'],
+            'updates add 1 %d $ppd' % rates['ppd'],
+            ]
+
+        if self.selected:
+            cmds += [
+                'updates add 2 %d $(%s)' % (
+                    rates['options'], self.get_options_cmd()),
+                'updates add 3 %d $queue-info' % rates['queue-info'],
+                'updates add 4 %d $slot-info' % rates['slot-info'],
+                ]
+
+        else:
+            cmds += [
+                'updates add 3 %d $queue-info' % max(
+                    rates['queue-info'], summary_rates['queue-info']),
+                'updates add 4 %d $slot-info' % max(
+                    rates['slot-info'], summary_rates['slot-info']),
+                ]
+
+        return cmds
+
+
+    def get_init_cmds(self):
+        cmds = ['updates clear'] + self.get_update_cmds() + ['info']
+        if self.selected: cmds += ['log-updates start', 'configured']
+        else: cmds.append(self.get_options_cmd()) # Once, to fill the cache
+        return cmds
+
+
+    def is_folding(self):
+        if self.units_updated: return self.config.get_running()
+
+        try:
+            return 0 < float(self.ppd)
+        except: return False
+
+
+    def get_rate_mode(self, app):
+        if not app.is_window_shown(): return 'hidden'
+        if self.selected or self.is_folding(): return 'active'
+        return 'idle'
 
 
     # Setters
@@ -112,6 +196,9 @@ class Client:
         self.conn.port = self.port = port
 
 
+    def set_tags(self, tags): self.tags = parse_tags(tags)
+
+
     def set_password(self, password):
         if self.conn.is_connected():
             self.conn.queue_command('option password "%s"' % password)
@@ -125,12 +212,16 @@ class Client:
 
     def set_selected(self, selected):
         if self.selected != selected:
+            self.selected = selected
+
+            # The cached state is shown at once and refreshed by the updates
+            # subscribed to below, the log restarts from the beginning
             if selected:
-                self.set_updated(False)
-                self.conn.set_init_commands(self.active_cmds)
-            else: self.conn.set_init_commands(self.inactive_cmds)
+                if self.rate_mode == 'idle': self.set_rate_mode('active')
+            elif self.conn.is_connected():
+                self.conn.queue_command('log-updates stop')
 
-            self.selected = selected
+            self.conn.set_init_commands(self.get_init_cmds())
 
 
     def set_updated(self, updated):
@@ -158,20 +249,36 @@ class Client:
         app.client_entries['address'].set_sensitive(self.name != 'local')
         app.client_entries['port'].set_value(self.port)
         app.client_entries['password'].set_text(self.password)
+        app.client_entries['tags'].set_text(self.get_tags())
         if self.is_updated():
-            self.config.update_options(app)
+            self.config.update_options(app, True)
             self.config.update_slots_ui(app)
 
     def get_row(self, app):
         status = self.get_status()
+        summary = self.summary
+        eta = summary['eta']
+        if eta is not None: eta = format_eta(eta - time.time())
+
         keys = {'name': self.name, 'status': status,
                 'status_color': status_to_color(status),
-                'address': self.get_address()}
+                'address': self.get_address(),
+                'rate': format_byte_rate(self.byte_rate),
+                'ppd': '%d' % summary['ppd'] if summary['ppd'] else '',
+                'slots': format_slot_counts(summary['slots']),
+                'eta': eta or '', 'error': summary['error']}
         return list(make_row(app.client_cols, keys))
 
 
     def update_status_ui(self, app):
+        # Repeated options frames are dropped, so set every option widget from
+        # the cache, including the folding power
+        self.config.update_options(app, True)
         self.config.update_status_ui(app)
+        self.config.update_user_info(app)
+        self.config.update_ppd(app, self.ppd)
+        self.config.update_info(app)
+        self.config.log_add_lines(app)
 
 
     def reset_status_ui(self, app):
@@ -202,7 +309,8 @@ class Client:
     # Save functions
     def save(self, db):
         db.insert('clients', name = self.name, address = self.address,
-                  port = self.port, password = self.password)
+                  port = self.port, password = self.password,
+                  tags = self.get_tags())
 
 
     def save_options(self, options):
@@ -253,21 +361,18 @@ class Client:
 
         self.save_options(options)
         self.save_slots(slots)
+        self.conn.forget_frames() # Reload even if nothing changed
 
         self.conn.queue_command('save')
         self.conn.queue_command('updates reset')
 
 
-    def set_power(self, power):
-        power = power.lower().replace(' ', '_')
-        if power != self.power:
-            self.power = power
-            self.conn.queue_command('option power ' + power)
-
-
     # Message processing
     def process_options(self, app, data):
+        unchanged = self.options_updated and data == self.config.options
         self.options_updated = True
+        if unchanged: return
+
         self.config.options = data
         if self.selected:
             self.config.update_options(app)
@@ -282,6 +387,9 @@ class Client:
 
 
     def process_slots(self, app, data):
+        app.fleet.update(self.summary, slots = count_slots(data))
+        self.update_error(app)
+
         self.slots_updated = True
         slots = []
         for slot in data: slots.append(SlotConfig(**slot))
@@ -290,15 +398,17 @@ class Client:
 
 
     def process_units(self, app, data):
+        units = make_work_units(data)
+        self.unit_errors = get_unit_errors(units)
+        app.fleet.update(self.summary, eta = get_next_eta(units))
+        self.update_error(app)
+
         self.units_updated = True
-        self.config.update_queue(data)
+        self.config.update_queue(units)
         if self.selected: self.config.update_status_ui(app)
 
 
     def process_log_update(self, app, data):
-        # Remove color codes
-        data = re.sub(r'\033\[\d\d?m', '', data)
-
         self.config.log_add(app, data)
 
 
@@ -311,8 +421,17 @@ class Client:
         self.ppd = ppd
         if self.selected: self.config.update_ppd(app, ppd)
 
+        try:
+            ppd = float(ppd)
+        except (TypeError, ValueError): ppd = 0.0
+        app.fleet.update(self.summary, ppd = ppd)
+
 
     def process_error(self, app, data):
+        self.last_error = str(data)
+        self.update_error(app)
+        if not self.selected: return
+
         msg = 'On client "%s" %s:%d: %s' % (
             self.name, self.address, self.port, data)
 
@@ -325,71 +444,139 @@ class Client:
 
         app.set_status(msg)
 
+    def update_error(self, app):
+        error = self.last_error
+        failed = self.summary['slots'].get('FAILED', 0)
+
+        if not error and failed:
+            error = '%d failed slot%s' % (failed, 's'[failed == 1:])
+        if not error and self.unit_errors:
+            error = '%d failed unit%s' % (
+                self.unit_errors, 's'[self.unit_errors == 1:])
+
+        app.fleet.update(self.summary, error = error)
+
+
     def process_configured(self, app, configured):
         if configured: return
         app.configure_dialog.show()
 
 
+    def expect(self, type, callback):
+        '''Calls callback(data) with each message of the given type until it
+        returns True.  Unlike the process functions this works whether or not
+        the client is selected.'''
+        self.expected.setdefault(type, []).append(callback)
+
+
+    def process_expected(self, type, data):
+        callbacks = self.expected.get(type)
+        if not callbacks: return
+
+        callbacks = [cb for cb in callbacks if not cb(data)]
+        if callbacks: self.expected[type] = callbacks
+        else: del self.expected[type]
+
+
     def process_message(self, app, type, data):
         if debug: print('message: %s %s' % (type, data))
 
-        if type == 'heartbeat': return
-        if type == 'ppd': self.process_ppd(app, data)
+        if self.expected: self.process_expected(type, data)
 
-        if not self.selected: return
+        if type == 'heartbeat': return
 
-        if type == 'options': self.process_options(app, data)
+        # Kept for every client, for the fleet columns and the cache
+        if type == 'ppd': self.process_ppd(app, data)
+        elif type == 'options': self.process_options(app, data)
         elif type == 'info': self.process_info(app, data)
         elif type == 'slots': self.process_slots(app, data)
         elif type == 'units': self.process_units(app, data)
-        elif type == 'log-restart': self.process_log_restart(app, data)
-        elif type == 'log-update': self.process_log_update(app, data)
         elif type == 'error': self.process_error(app, data)
+
+        if not self.selected: return
+
+        if type == 'log-restart': self.process_log_restart(app, data)
+        elif type == 'log-update': self.process_log_update(app, data)
         elif type == 'configured': self.process_configured(app, data)
         # Ignore other message types
 
 
-    def update(self, app):
-        prevStatus = self.get_status()
+    def process_messages(self, app, messages):
+        fleet_version = app.fleet.version
 
-        try:
-            self.conn.update()
+        # Stale snapshots would only be overwritten, skip them
+        for version, type, data in coalesce_messages(messages):
+            try:
+                self.process_message(app, type, data)
+            except Exception:
+                traceback.print_exc()
 
-            for version, type, data in self.conn.messages:
-                try:
-                    self.process_message(app, type, data)
-                except Exception as e:
-                    traceback.print_exc()
+        # Only repaint the row if the summary changed
+        if fleet_version != app.fleet.version: self.update_row(app)
 
-            self.conn.messages = []
 
-        except Exception as e:
-            print(e)
+    def set_rate_mode(self, mode):
+        self.rate_mode = mode
 
-        # If client status has changed update UI
-        newStatus = self.get_status()
-        if prevStatus != newStatus:
-            list = app.client_list
-            iter = list.get_iter_first()
-            while iter is not None:
-                name, status = app.client_list.get(iter, 0, 1)
+        # Allow a few missed heartbeats before timing out
+        self.conn.set_timeout(max(10, 2.5 * update_rates[mode]['heartbeat']))
+
+
+    def update_rates(self, app):
+        mode = self.get_rate_mode(app)
+        if mode == self.rate_mode: return
+        self.set_rate_mode(mode)
+
+        # Replace the existing updates wo/ restarting the log etc.
+        self.conn.init_commands = self.get_init_cmds()
+        if self.conn.is_connected():
+            self.conn.queue_commands(self.get_update_cmds())
+
+
+    def update_byte_rate(self):
+        """Returns True if the displayed rate changed."""
+        now = time.time()
+        if now < self.last_byte_time + 1: return False
+
+        count = self.conn.bytes_read + self.conn.bytes_written
+        last = format_byte_rate(self.byte_rate)
+
+        if self.last_byte_time:
+            rate = (count - self.last_byte_count) / (now - self.last_byte_time)
+            self.byte_rate = 0.5 * self.byte_rate + 0.5 * rate
 
-                if name == self.name:
-                    # Update client status and colors
-                    color = status_to_color(newStatus)
-                    path = list.get_path(iter)
-                    list.set(iter, 1, newStatus)
-                    list.set(iter, 2, color)
-                    list.row_changed(path, iter)
-                    break
+        self.last_byte_count = count
+        self.last_byte_time = now
 
-                iter = list.iter_next(iter)
+        return last != format_byte_rate(self.byte_rate)
 
-            if not self.is_online(): self.set_updated(False)
+
+    def update_row(self, app):
+        # Applied by app.update_client_rows() once per tick
+        app.changed_clients.add(self)
+
+
+    def update(self, app):
+        # Messages are delivered by app.network, only check status here
+        self.update_rates(app)
+        update_row = self.update_byte_rate()
+
+        newStatus = self.get_status()
+        if self.last_status != newStatus:
+            self.last_status = newStatus
+            update_row = True
+            app.fleet.update(self.summary, status = newStatus)
+
+            if not self.is_online():
+                self.set_updated(False)
+                self.last_error = ''
+                self.update_error(app)
 
             # Update client status label
             if self.selected: app.update_client_status()
 
+        if update_row: self.update_row(app)
+
 
     def reconnect(self):
         self.conn.close()
@@ -401,11 +588,12 @@ class Client:
         # Avoid broken pipe on OSX
         if sys.platform == 'darwin':
             try:
-                if self.conn.is_connected():
-                    self.conn.queue_command('quit')
-                    self.conn.write_some()
+                with self.conn.lock:
+                    if self.conn.is_connected():
+                        self.conn.queue_command('quit')
+                        self.conn.write_some()
 
             except Exception as e:
                 print(e)
 
-        self.conn.close()
+        self.conn.close(stop = True)
@@ -22,13 +22,12 @@
 import sys
 import gtk
 import traceback
-import re
 
 from fah.util import parse_bool
-from fah.util import status_to_color
-from fah.util import get_span_markup
 from fah.util import get_widget_str_value
 from fah.util import set_widget_str_value
+from fah.util import LogStore
+from fah.util import LogAssembler
 from fah import SlotConfig
 
 
@@ -47,6 +46,63 @@ def get_option_mods(old_options, new_options):
 
     return changes
 
+
+def set_list_row(model, entry, values):
+    '''Sets the columns of a row which differ from values with one model
+    change.  entry is the row's [iter, values] and is updated.'''
+    iter, old_values = entry
+    if values is old_values: return # Same parsed record
+
+    changes = []
+    for col in range(len(values)):
+        if values[col] != old_values[col]: changes += [col, values[col]]
+
+    if changes:
+        model.set(iter, *changes)
+        entry[1] = values
+
+
+def sync_list_model(model, index, rows):
+    '''Makes model contain rows, a list of (key, values), with the fewest
+    changes.  index maps key -> [iter, values] for the rows previously synced
+    with it and is updated.  A model last synced with a different index is
+    rebuilt.'''
+
+    if getattr(model, 'sync_index', None) is not index:
+        model.clear()
+        index.clear()
+        model.sync_index = index
+
+    # Deleted
+    keys = set([key for key, values in rows])
+    for key in index.keys():
+        if key not in keys: model.remove(index.pop(key)[0])
+
+    # Modified and added
+    for key, values in rows:
+        entry = index.get(key)
+        if entry is None:
+            index[key] = [model.append(values), values]
+
+        else: set_list_row(model, entry, values)
+
+    # Order
+    order = [model.get_path(index[key][0])[0] for key, values in rows]
+    if order != range(len(order)): model.reorder(order)
+
+
+def get_list_iter(model, index, key):
+    '''Returns the iter of the row synced with index under key or None.'''
+    if getattr(model, 'sync_index', None) is index:
+        entry = index.get(key)
+        if entry is not None: return entry[0]
+
+
+def reset_list_model(model):
+    model.clear()
+    model.sync_index = None
+
+
 def get_buffer_text(buffer):
     return buffer.get_text(buffer.get_start_iter(), buffer.get_end_iter())
 
@@ -73,15 +129,17 @@ class ClientConfig:
         self.last_updated = 0
         self.queue = []
         self.queue_map = {}
+        self.queue_rows = {}
         self.slots = []
+        self.slot_rows = {}
         self.options = {}
         self.core_options = {}
         self.info = []
-        self.log = []
+        self.log = LogStore()
+        self.log_lines = LogAssembler()
         self.log_append_count = 0
         self.tooltip = ''
-        self.last_log_filter = ''
-        self.log_filter_re = None
+        self.log_filter = (False, None, None) # severity, unit, slot
         self.updating = False
 
 
@@ -92,11 +150,6 @@ class ClientConfig:
         return name in self.options and self.options[name] is not None
 
 
-    def get_prcg(self, row):
-        return '%s (%s, %s, %s)' % (
-            row['project'], row['run'], row['clone'], row['gen'])
-
-
     def update_power(self, app):
         power = self.get('power').lower()
         for i in range(len(app.folding_power_levels)):
@@ -111,10 +164,11 @@ class ClientConfig:
 
 
     def update_queue(self, queue):
+        '''queue is a list of WorkUnits sorted by ID.'''
         self.queue = queue
         self.queue_map = {}
-        for values in self.queue:
-            self.queue_map[values['id']] = values
+        for unit in self.queue:
+            self.queue_map[unit.id] = unit
 
 
     def update_user_info(self, app):
@@ -144,52 +198,23 @@ class ClientConfig:
                 if slot.id == id: return slot
 
     def update_queue_ui(self, app):
-        if not self.queue:
-            app.queue_list.clear()
-            return
-
-        # Save selections
-        selected = self.get_selected_queue_entry(app)
-        selected_row = None
-        log_filter_selected = get_active_combo_column(app.log_unit, 1)
-        log_filter_row = None
+        rows = [(unit.id, unit.row) for unit in self.queue]
 
-        # Clear queue wo/ updating log filter
+        # Update rows in place wo/ updating log filter, this keeps the
+        # selections and scroll position
         self.updating = True
         try:
-            app.queue_list.clear()
+            sync_list_model(app.queue_list, self.queue_rows, rows)
         finally:
             self.updating = False
 
-        # Reload queue list
-        for values in sorted(self.queue, lambda x, y: cmp(x['id'], y['id'])):
-            unit_id = values['unit']
-            queue_id = values['id']
-            status = values['state'].title()
-            color = status_to_color(status)
-            status = get_span_markup(status, color)
-            progress = values['percentdone']
-            percent = float(progress[:-1])
-            eta = values['eta']
-            if eta == '0.00 secs': eta = 'Unknown'
-            credit = values['creditestimate']
-            if float(credit) == 0: credit = 'Unknown'
-
-            prcg = self.get_prcg(values)
-            iter = app.queue_list.append([unit_id, queue_id, status, color,
-                                          progress, percent, eta, credit, prcg])
-
-            if queue_id == selected: selected_row = iter
-            if queue_id == log_filter_selected: log_filter_row = iter
-
         # Select the first item if nothing is selected
-        if selected_row is None: selected_row = app.queue_list.get_iter_first()
-        if log_filter_row is None:
-            log_filter_row = app.queue_list.get_iter_first()
-
-        # Restore selections
-        app.queue_tree.get_selection().select_iter(selected_row)
-        app.log_unit.set_active_iter(log_filter_row)
+        first = app.queue_list.get_iter_first()
+        if first is None: return
+        if self.get_selected_queue_entry(app) is None:
+            app.queue_tree.get_selection().select_iter(first)
+        if app.log_unit.get_active_iter() is None:
+            app.log_unit.set_active_iter(first)
 
 
     def update_work_unit_info(self, app):
@@ -200,10 +225,10 @@ class ClientConfig:
         # Get selected queue entry
         selected = self.get_selected_queue_entry(app)
         if selected is None: return
-        entry = self.queue_map[selected]
+        unit = self.queue_map[selected]
 
         # Load info
-        for name, value in entry.items():
+        for name, value in unit.values.items():
             if name in app.queue_widgets:
                 if (name in ['basecredit', 'creditestimate', 'ppd'] and \
                         float(value) == 0) or value == '<invalid>' or \
@@ -213,21 +238,15 @@ class ClientConfig:
                 set_widget_str_value(widget, value)
 
         # Status
-        status = entry['state'].title()
-        color = status_to_color(status)
-        status = get_span_markup(status, color)
-        widget = app.queue_widgets['state']
-        widget.set_markup(status)
+        app.queue_widgets['state'].set_markup(unit.markup)
 
         # Links
         base = 'https://apps.foldingathome.org'
-        uri = base + '/project.py?p=%s' % entry['project']
+        uri = base + '/project.py?p=%s' % unit.prcg[0]
         app.queue_widgets['project'].set_uri(uri)
 
         # PRCG
-        prcg = '%s (%s, %s, %s)' % (
-            entry['project'], entry['run'], entry['clone'], entry['gen'])
-        set_widget_str_value(app.queue_widgets['prcg'], prcg)
+        set_widget_str_value(app.queue_widgets['prcg'], unit.get_prcg())
 
 
     def select_slot(self, app):
@@ -235,28 +254,23 @@ class ClientConfig:
         slot = self.get_selected_slot(app)
         if slot is None: return
 
-        # Get associated queue ID
-        first_id = None
-        first_running_id = None
-        for entry in self.queue:
-            if int(entry['slot']) == slot.id:
-                if first_id is None: first_id = entry['unit']
-                if entry['state'].upper() in ['RUNNING', 'FINISHING'] and \
-                        first_running_id is None:
-                    first_running_id = entry['unit']
-
-        if first_running_id is not None: unit_id = first_running_id
-        else: unit_id = first_id
-
-        if unit_id is not None:
-            # Find unit_id in the queue list entry and select row
-            list = app.queue_list
-            iter = list.get_iter_first()
-            while iter is not None:
-                if list.get_value(iter, 0) == unit_id:
-                    app.queue_tree.get_selection().select_iter(iter)
-                    break
-                iter = list.iter_next(iter)
+        # Get associated queue entry
+        first = None
+        first_running = None
+        for unit in self.queue:
+            if unit.slot == slot.id:
+                if first is None: first = unit
+                if unit.is_active() and first_running is None:
+                    first_running = unit
+
+        if first_running is not None: unit = first_running
+        else: unit = first
+
+        if unit is not None:
+            # Select the unit's queue list row
+            iter = get_list_iter(app.queue_list, self.queue_rows, unit.id)
+            if iter is not None:
+                app.queue_tree.get_selection().select_iter(iter)
 
             # Update the UI
             self.update_work_unit_info(app)
@@ -268,18 +282,14 @@ class ClientConfig:
         selected = self.get_selected_queue_entry(app)
         if selected is None: return
 
-         # Get associated slot ID
-        entry = self.queue_map[selected]
-        slot = int(entry['slot'])
+        # Get associated slot ID
+        slot = self.queue_map[selected].slot
 
         # Find and select the slot
-        list = app.slot_status_list
-        iter = list.get_iter_first()
-        while iter is not None:
-            if int(list.get_value(iter, 0)) == slot:
-                app.slot_status_tree.get_selection().select_iter(iter)
-                break
-            iter = list.iter_next(iter)
+        iter = get_list_iter(app.slot_status_list, self.slot_rows,
+                             '%02d' % slot)
+        if iter is not None:
+            app.slot_status_tree.get_selection().select_iter(iter)
 
         # Update the UI
         self.update_work_unit_info(app)
@@ -353,36 +363,46 @@ class ClientConfig:
         port.show_all()
 
 
-    def update_options(self, app):
-        used = set()
+    def update_options(self, app, full = False):
+        '''Sets the option widgets.  If they show this client's options only
+        the options which changed since are set, unless full is True.'''
+        config, shown = app.shown_options
+        full = full or config is not self
+        options = self.options
 
-        for name, widget in app.client_option_widgets.items():
-            name = name.replace('_', '-')
-            used.add(name)
+        if full: changed = set(options)
+        else:
+            changed = set([name for name in set(shown) | set(options)
+                           if shown.get(name) != options.get(name)])
+            if not changed: return
+
+        app.shown_options = (self, dict(options))
+
+        for name, setter in app.client_option_setters.items():
+            if name not in changed or name not in options: continue
 
             try:
-                set_widget_str_value(widget, self.options[name])
+                setter(options[name])
 
             except Exception as e: # Don't let one bad widget kill everything
                 print('WARNING: failed to set widget "%s": %s' % (name, e))
 
         # Setup passkey and password entries
-        app.passkey_validator.set_good()
-        app.password_validator.set_good()
-        app.proxy_pass_validator.set_good()
+        for name, validator in (('passkey', app.passkey_validator),
+                                ('password', app.password_validator),
+                                ('proxy-pass', app.proxy_pass_validator)):
+            if full or name in changed: validator.set_good()
 
         # Set folding power
-        if 'power' in self.options:
-            used.add('power')
-            self.update_power(app)
+        if 'power' in changed and 'power' in options: self.update_power(app)
 
         # Set proxy options
-        if 'proxy-enable' in self.options:
+        if 'proxy-enable' in changed and 'proxy-enable' in options:
             proxy_enable = parse_bool(self.get('proxy-enable'))
             app.proxy_frame.set_sensitive(proxy_enable)
             app.proxy_auth_frame.set_sensitive(proxy_enable)
 
-        if self.have('proxy'):
+        if 'proxy' in changed and self.have('proxy'):
             proxy = self.get('proxy')
             if ':' in proxy: proxy_addr, proxy_port = proxy.split(':', 1)
             else: proxy_addr, proxy_port = proxy, '8080'
@@ -390,69 +410,49 @@ class ClientConfig:
             set_widget_str_value(app.proxy_port, proxy_port)
 
         # Set core priority radio button
-        core_idle = not self.have('core-priority') or \
-            self.get('core-priority') == 'idle'
-        app.client_option_widgets['core_priority'].set_active(core_idle)
-        app.core_priority_low.set_active(not core_idle)
+        if full or 'core-priority' in changed:
+            core_idle = not self.have('core-priority') or \
+                self.get('core-priority') == 'idle'
+            app.client_option_widgets['core_priority'].set_active(core_idle)
+            app.core_priority_low.set_active(not core_idle)
 
         # Extra core options
-        app.core_option_list.clear()
-        if self.have('extra-core-args'):
-            used.add('extra-core-args')
+        used = set(app.client_option_setters)
+        if 'power' in options: used.add('power')
+        if self.have('extra-core-args'): used.add('extra-core-args')
 
-            args = self.get('extra-core-args').split()
-            for arg in args: app.core_option_list.append([arg])
+        if full or 'extra-core-args' in changed:
+            app.core_option_list.clear()
+            if self.have('extra-core-args'):
+                args = self.get('extra-core-args').split()
+                for arg in args: app.core_option_list.append([arg])
 
         # Remaining options
-        app.option_list.clear()
-        for name, value in self.options.items():
-            if name not in used:
-                app.option_list.append([name, value])
+        if full or changed - used:
+            app.option_list.clear()
+            for name, value in options.items():
+                if name not in used:
+                    app.option_list.append([name, value])
 
 
     def update_status_slots(self, app):
-        # Save selection
-        selected = get_selected_tree_column(app.slot_status_tree, 0)
-        if selected is not None: selected = selected
-        selected_row = None
-        log_filter_selected = get_active_combo_column(app.log_slot, 0)
-        log_filter_row = None
-
-        # Clear list wo/ updating log filter
+        rows = [(slot.row[0], slot.row) for slot in self.slots]
+
+        # Update rows in place wo/ updating log filter
         self.updating = True
         try:
-            app.slot_status_list.clear()
+            sync_list_model(app.slot_status_list, self.slot_rows, rows)
         finally:
             self.updating = False
 
-        # Reload list
-        for slot in self.slots:
-            id = '%02d' % slot.id
-            status = slot.status.title()
-            color = status_to_color(status)
-            if status == 'Paused' and slot.reason:
-                status += ':' + slot.reason
-            status = get_span_markup(status, color)
-            description = slot.description.replace('"', '')
-            iter = app.slot_status_list.append((id, status, color, description))
-
-            if id == selected: selected_row = iter
-            if id == log_filter_selected: log_filter_row = iter
-
-        # Selected the first item if nothing is selected
-        if selected_row is None:
-            selected_row = app.slot_status_list.get_iter_first()
-            if selected_row is not None:
-                app.slot_status_tree.get_selection().select_iter(selected_row)
-                self.select_slot(app)
-        if log_filter_row is None:
-            log_filter_row = app.slot_status_list.get_iter_first()
-
-        # Restore selections
-        if selected_row is not None:
-            app.slot_status_tree.get_selection().select_iter(selected_row)
-        if log_filter_row is not None:
-            app.log_slot.set_active_iter(log_filter_row)
+        # Select the first item if nothing is selected
+        first = app.slot_status_list.get_iter_first()
+        if first is None: return
+        if get_selected_tree_column(app.slot_status_tree, 0) is None:
+            app.slot_status_tree.get_selection().select_iter(first)
+            self.select_slot(app)
+        if app.log_slot.get_active_iter() is None:
+            app.log_slot.set_active_iter(first)
 
 
     def update_slots_ui(self, app):
@@ -461,83 +461,50 @@ class ClientConfig:
             slot.add_to_ui(app)
 
 
-    def scroll_log_to_end(self, app):
-        if not app.log_follow.get_active(): return
-        mark = app.log.get_mark('end')
-        app.log.move_mark(mark, app.log.get_end_iter())
-        app.log_view.scroll_mark_onscreen(mark)
-
-
     def log_clear(self, app):
-        app.log.set_text('')
-        self.log = []
-
+        app.log_viewer.clear()
+        self.log.clear()
+        self.log_lines.reset()
 
-    def log_filter_str(self, app):
-        f = []
 
-        # Severity
-        if app.log_severity.get_active():
-            f.append(r'((WARNING)|(W )|(ERROR)|(E ))')
+    def get_log_filter(self, app):
+        severity = app.log_severity.get_active()
 
-        # Unit
+        unit = None
         if app.log_unit_enable.get_active():
-            id = get_active_combo_column(app.log_unit, 1)
-            f.append(r'WU%s' % id)
+            unit = get_active_combo_column(app.log_unit, 1)
 
-        # Slot
+        slot = None
         if app.log_slot_enable.get_active():
-            id = get_active_combo_column(app.log_slot, 0)
-            f.append(r'FS%s' % id)
+            slot = get_active_combo_column(app.log_slot, 0)
 
-        if len(f):
-            f = map(lambda x: '.*(^|:)%s' % x, f)
-            return '(^\*)|(%s):' % ''.join(f)
+        return severity, unit, slot
 
-        return None
 
+    def log_add_lines(self, app, start = None):
+        severity, unit, slot = self.log_filter
+        lines = self.log.select(severity, unit, slot, start)
 
-    def log_filter(self, line):
-        return self.log_filter_re is None or \
-            self.log_filter_re.match(line) is not None
-
-
-    def log_add_lines(self, app, lines):
-        filtered = filter(self.log_filter, lines)
-
-        if len(filtered):
-            text = '\n'.join(filtered)
-            text = text.decode('utf-8', 'ignore')
-            app.log.insert(app.log.get_end_iter(), text + '\n')
-            self.scroll_log_to_end(app)
+        if start is None: app.log_viewer.set_lines(self.log, lines)
+        else: app.log_viewer.append(self.log, lines)
 
 
     def log_add(self, app, text):
-        # TODO deal with split lines
-        lines = []
-        for line in text.split('\n'):
-            if not line: continue
-            lines.append(line)
-            self.log.append(line)
-
-        self.log_add_lines(app, lines)
+        start = self.log.end
+        self.log.extend(self.log_lines.feed(text))
+        self.log_add_lines(app, start)
 
 
     def update_log(self, app):
         if self.updating: return # Don't refilter during updates
 
         # Check if filter has changed
-        log_filter = self.log_filter_str(app)
-        if log_filter == self.last_log_filter: return
-
-        # Update filter
-        self.last_log_filter = log_filter
-        if log_filter is not None: self.log_filter_re = re.compile(log_filter)
-        else: self.log_filter_re = None
+        log_filter = self.get_log_filter(app)
+        if log_filter == self.log_filter: return
+        self.log_filter = log_filter
 
         # Reload log
-        app.log.set_text('')
-        self.log_add_lines(app, self.log)
+        self.log_add_lines(app)
 
 
     def update_status_ui(self, app):
@@ -549,14 +516,14 @@ class ClientConfig:
 
     def reset_status_ui(self, app):
         self.reset_work_unit_info(app)
-        app.queue_list.clear()
-        app.slot_status_list.clear()
-        app.log.set_text('')
+        reset_list_model(app.queue_list)
+        reset_list_model(app.slot_status_list)
+        app.log_viewer.clear()
 
 
     def get_running(self):
         for unit in self.queue:
-            if unit['state'].upper() == 'RUNNING': return True
+            if unit.is_running(): return True
         return False
 
 
@@ -0,0 +1,125 @@
+################################################################################
+#                                                                              #
+#                    Folding@Home Client Control (FAHControl)                  #
+#                   Copyright (C) 2016-2020 foldingathome.org                  #
+#                  Copyright (C) 2010-2016 Stanford University                 #
+#                                                                              #
+#      This program is free software: you can redistribute it and/or modify    #
+#      it under the terms of the GNU General Public License as published by    #
+#       the Free Software Foundation, either version 3 of the License, or      #
+#                      (at your option) any later version.                     #
+#                                                                              #
+#        This program is distributed in the hope that it will be useful,       #
+#         but WITHOUT ANY WARRANTY; without even the implied warranty of       #
+#         MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the        #
+#                  GNU General Public License for more details.                #
+#                                                                              #
+#       You should have received a copy of the GNU General Public License      #
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.    #
+#                                                                              #
+################################################################################
+
+import time
+import random
+import threading
+import collections
+
+debug = False
+
+
+class HostState:
+    def __init__(self, history):
+        self.failures = 0     # Consecutive failures
+        self.next_attempt = 0 # Earliest time of the next connect
+        self.history = collections.deque(maxlen = history) # (time, reason)
+
+
+
+class ConnectScheduler:
+    '''Decides when Connections may (re)connect.
+
+    After each consecutive failure to reach a host the delay before the next
+    attempt doubles, up to max_delay, and is randomized so that many
+    FAHControls don't retry a rebooted host in lockstep.  A host only counts
+    as reached once it sends a message, so one which accepts and then drops
+    connections also backs off.  At most max_connecting connects are in
+    progress at once.
+    '''
+
+    def __init__(self, base_delay = 5, max_delay = 120, max_connecting = 16,
+                 connect_timeout = 10, history = 10):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_connecting = max_connecting
+        self.connect_timeout = connect_timeout
+        self.history = history
+        self.hosts = {} # address:port -> HostState
+        self.connects = set() # Connections with a connect in progress
+        self.lock = threading.Lock()
+
+
+    def get_host(self, conn):
+        key = '%s:%d' % (conn.address, conn.port)
+        host = self.hosts.get(key)
+        if host is None: host = self.hosts[key] = HostState(self.history)
+        return host
+
+
+    def get_delay(self, failures):
+        delay = min(self.max_delay, self.base_delay * 2 ** (failures - 1))
+        return random.uniform(delay / 2.0, delay)
+
+
+    def get_history(self, conn):
+        '''Returns the recent (time, fail reason) of the connection's host.'''
+        with self.lock: return list(self.get_host(conn).history)
+
+
+    def can_connect(self, conn):
+        with self.lock:
+            if self.max_connecting <= len(self.connects): return False
+            return self.get_host(conn).next_attempt <= time.time()
+
+
+    def get_next_attempt(self, conn):
+        '''Returns the earliest time conn may connect, if a connect slot is
+        free.'''
+        with self.lock: return self.get_host(conn).next_attempt
+
+
+    def connecting(self, conn):
+        with self.lock: self.connects.add(conn)
+
+
+    def connected(self, conn):
+        with self.lock: self.connects.discard(conn)
+
+
+    def succeeded(self, conn):
+        '''Records the first message received since conn connected.'''
+        with self.lock: self.get_host(conn).failures = 0
+
+
+    def closed(self, conn, reason = None):
+        '''Records the end of a connection or connect attempt.  A reason of
+        None is a deliberate close which may reconnect right away.'''
+        with self.lock:
+            self.connects.discard(conn)
+            host = self.get_host(conn)
+
+            if reason is None:
+                host.next_attempt = 0
+                return
+
+            now = time.time()
+            host.failures += 1
+            host.history.append((now, reason))
+            host.next_attempt = now + self.get_delay(host.failures)
+
+            if debug:
+                print('%s:%d %s, retry in %.1fs' % (
+                    conn.address, conn.port, reason, host.next_attempt - now))
+
+
+    def remove(self, conn):
+        with self.lock: self.connects.discard(conn)
@@ -26,11 +26,12 @@ import select
 import errno
 import time
 import sys
-import traceback
-import json
+import threading
 
-from fah.util import OrderedDict
-from fah.util import PYONDecoder
+from fah.util import pyon_loads
+from fah.util import FrameSplitter
+from fah.util import OutputBuffer
+from fah.Poller import POLL_READ, POLL_WRITE, POLL_ERROR
 
 if sys.platform == 'win32':
     from ctypes import windll
@@ -39,25 +40,113 @@ if sys.platform == 'win32':
 debug = False
 WSAEWOULDBLOCK = 10035
 
+# Give up on a peer which has stopped reading this much output
+MAX_OUTPUT = 16 * 1024 * 1024
+
+# Frames of these types which repeat the previous one are not decoded, the
+# client resends them on a timer whether they changed or not
+repeat_types = ('options', 'slots', 'units', 'info', 'ppd')
+
+
+def sum_frame_counts(conns):
+    '''Returns type -> [repeated, decoded] frames summed over conns.'''
+    totals = {}
+    for conn in conns:
+        for type, counts in conn.frame_counts.items():
+            total = totals.setdefault(type, [0, 0])
+            total[0] += counts[0]
+            total[1] += counts[1]
+    return totals
+
+
+def format_frame_counts(counts):
+    '''Returns the percentage of repeated frames of each type.'''
+    text = []
+    for type, (repeated, decoded) in sorted(counts.items()):
+        total = repeated + decoded
+        text.append('%s %d%% of %d' % (type, 100 * repeated / total, total))
+    return ', '.join(text)
+
+
+def synchronized(func):
+    def wrapper(self, *args, **kwargs):
+        with self.lock: return func(self, *args, **kwargs)
+
+    wrapper.__name__ = func.__name__
+    wrapper.__doc__ = func.__doc__
+    return wrapper
+
 
 class Connection:
     def __init__(self, address = 'localhost', port = 36330, password = None,
-                 retry_rate = 5):
+                 retry_rate = 5, poller = None, scheduler = None,
+                 resolver = None):
         self.address = address
         self.port = int(port)
         self.password = password
         self.init_commands = []
         self.retry_rate = retry_rate
+        self.timeout = 10 # Seconds without a message before reconnecting
+        self.poller = poller
+        self.scheduler = scheduler
+        self.resolver = resolver
+        if scheduler is not None:
+            self.connect_timeout = scheduler.connect_timeout
+        else: self.connect_timeout = 60
+        self.events = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.frame_counts = {} # Type -> [repeated, decoded]
+        self.stopped = False # Closed for good, never reopened
+
+        # Guards state shared between the GUI and the network thread
+        self.lock = threading.RLock()
 
         self.socket = None
         self.reset()
 
 
+    @synchronized
+    def set_timeout(self, timeout):
+        '''Sets the seconds without a message before reconnecting.'''
+        # Give a faster heartbeat time to start
+        if timeout < self.timeout and self.last_message:
+            self.last_message = time.time()
+
+        self.timeout = timeout
+        self.wake() # The deadline may be sooner
+
+
+    def wake(self):
+        '''Makes the thread polling this connection update it soon.'''
+        if self.poller is not None: self.poller.wakeup(self)
+
+
+    @synchronized
+    def get_deadline(self):
+        '''Returns when update() must next run if there are no socket
+        events, or None if only events matter.  A deadline which has passed
+        means the connection is waiting for a name lookup or connect slot.'''
+        if self.connected:
+            if self.last_message: return self.last_message + self.timeout
+            return None
+
+        if self.socket is not None:
+            return self.last_connect + self.connect_timeout
+
+        if self.stopped: return None
+
+        if self.scheduler is not None:
+            return self.scheduler.get_next_attempt(self)
+
+        return self.last_connect + self.retry_rate
+
+
+    @synchronized
     def set_init_commands(self, commands):
         self.init_commands = commands
 
-        if self.is_connected():
-            map(self.queue_command, self.init_commands)
+        if self.is_connected(): self.queue_commands(self.init_commands)
 
 
     def get_status(self):
@@ -66,63 +155,130 @@ class Connection:
         return 'Connecting'
 
 
+    @synchronized
     def is_connected(self):
         if self.socket is None: return False
         if self.connected: return True
 
-        rlist, wlist, xlist = select.select([], [self.socket], [self.socket], 0)
+        if self.poller is not None:
+            writable = self.events & POLL_WRITE
+            failed = self.events & POLL_ERROR
+
+        else:
+            rlist, wlist, xlist = \
+                select.select([], [self.socket], [self.socket], 0)
+            writable = len(wlist) != 0
+            failed = len(xlist) != 0
 
-        if len(wlist) != 0: self.connected = True
-        elif len(xlist) != 0:
+        if failed:
             self.fail_reason = 'refused'
             self.close()
 
+        elif writable:
+            self.connected = True
+            if self.scheduler is not None: self.scheduler.connected(self)
+
         return self.connected
 
 
     def can_write(self):
+        if self.poller is not None: return bool(self.events & POLL_WRITE)
         rlist, wlist, xlist = select.select([], [self.socket], [], 0)
         return len(wlist) != 0
 
 
     def can_read(self):
+        if self.poller is not None:
+            return bool(self.events & (POLL_READ | POLL_ERROR))
         rlist, wlist, xlist = select.select([self.socket], [], [], 0)
         return len(rlist) != 0
 
 
+    def get_poll_mask(self):
+        # Only wait for writability while connecting or with output pending
+        mask = POLL_READ
+        if not self.connected or len(self.writeBuf): mask |= POLL_WRITE
+        return mask
+
+
     def reset(self):
         self.close()
         self.messages = []
-        self.readBuf = ''
-        self.writeBuf = ''
+        self.readBuf = FrameSplitter()
+        self.writeBuf = OutputBuffer()
         self.fail_reason = None
         self.last_message = 0
         self.last_connect = 0
+        self.forget_frames()
+
+
+    @synchronized
+    def forget_frames(self):
+        '''Makes the next frame of each type be decoded even if it repeats
+        the last one.'''
+        self.last_frames = {} # Type -> raw frame
+
+
+    def resolve(self):
+        '''Returns the (family, sockaddr) to connect to or None if it is not
+        known yet.'''
+        if self.resolver is None:
+            return socket.AF_INET, (self.address, self.port)
+
+        try:
+            return self.resolver.lookup(self.address, self.port)
+
+        except socket.error as e:
+            self.fail_reason = 'resolve'
+            self.last_connect = time.time()
+            if self.scheduler is not None:
+                self.scheduler.closed(self, self.fail_reason)
+            raise Exception('Failed to resolve %s: %s' % (self.address, e))
 
 
     def open(self):
         if debug: print('Connection.open()')
 
+        # Another thread may have stopped the connection while it was due
+        if self.stopped: return
+
+        # Don't block on DNS, try again once the address is resolved
+        address = self.resolve()
+        if address is None: return
+        family, sockaddr = address
+
         self.reset()
         self.last_connect = time.time()
 
-        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket = socket.socket(family, socket.SOCK_STREAM)
         self.socket.setblocking(0)
-        err = self.socket.connect_ex((self.address, self.port))
+        err = self.socket.connect_ex(sockaddr)
+
+        if self.scheduler is not None: self.scheduler.connecting(self)
 
         if err != 0 and not err in [
             errno.EINPROGRESS, errno.EWOULDBLOCK, WSAEWOULDBLOCK]:
             self.fail_reason = 'connect'
+            if self.scheduler is not None: self.close()
             raise Exception('Connection failed: ' + errno.errorcode[err])
 
-        if self.password: self.queue_command('auth "%s"' % self.password)
-        map(self.queue_command, self.init_commands)
+        commands = self.init_commands
+        if self.password: commands = ['auth "%s"' % self.password] + commands
+        self.queue_commands(commands)
+
+        if self.poller is not None: self.poller.register(self)
 
 
-    def close(self):
+    @synchronized
+    def close(self, stop = False):
+        '''Closes the socket, a reconnect follows when due.  If stop is True
+        the connection is being discarded and is never reopened.'''
         if debug: print('Connection.close()')
+        if stop: self.stopped = True
 
         if self.socket is not None:
+            if self.poller is not None: self.poller.unregister(self)
+
             try:
                 self.socket.shutdown(socket.SHUT_RDWR)
             except: pass
@@ -131,23 +287,29 @@ class Connection:
             except: pass
             self.socket = None
 
+            if self.scheduler is not None:
+                self.scheduler.closed(self, self.fail_reason)
+
+            self.wake() # Reconnect when due
+
         self.connected = False
+        self.events = 0
 
 
     def connection_lost(self):
         print('Connection lost')
-        self.close()
         self.fail_reason = 'closed'
+        self.close()
         raise Exception('Lost connection')
 
 
     def connection_error(self, err, msg):
         print('Connection Error: %d: %s' % (err, msg))
-        self.close()
         if err == errno.ECONNREFUSED: self.fail_reason = 'refused'
         elif err in [errno.ETIMEDOUT, errno.ENETDOWN, errno.ENETUNREACH]:
             self.fail_reason = 'connect'
         else: self.fail_reason = 'error'
+        self.close()
 
 
     def read_some(self):
@@ -157,8 +319,9 @@ class Connection:
                 buffer = self.socket.recv(10 * 1024 * 1024)
                 if len(buffer):
                     #if debug: print 'BUFFER:', buffer
-                    self.readBuf += buffer
+                    self.readBuf.feed(buffer)
                     bytesRead += len(buffer)
+                    self.bytes_read += len(buffer)
                 else:
                     if bytesRead: return bytesRead
                     self.connection_lost()
@@ -179,11 +342,12 @@ class Connection:
 
         bytesWritten = 0
         try:
-            while True:
-                count = self.socket.send(self.writeBuf)
+            while len(self.writeBuf):
+                count = self.socket.send(self.writeBuf.peek())
                 if count:
-                    self.writeBuf = self.writeBuf[count:]
+                    self.writeBuf.consume(count)
                     bytesWritten += count
+                    self.bytes_written += count
                 else:
                     if bytesWritten: return bytesWritten
                     self.connection_lost()
@@ -199,16 +363,56 @@ class Connection:
         return bytesWritten
 
 
+    def is_congested(self):
+        '''True while too much output is waiting for the peer to read it.'''
+        return self.writeBuf.congested
+
+
+    @synchronized
     def queue_command(self, command):
-        if debug: print('command: ' + command)
-        self.writeBuf += command + '\n'
+        self.queue_commands([command])
+
+
+    @synchronized
+    def queue_commands(self, commands):
+        if not commands: return
+        if debug:
+            for command in commands: print('command: ' + command)
+
+        self.writeBuf.write('\n'.join(commands) + '\n')
+
+        if MAX_OUTPUT < len(self.writeBuf) and self.socket is not None:
+            print('ERROR: %s:%d is not reading commands' % (
+                self.address, self.port))
+            self.fail_reason = 'congested'
+            self.close()
+
+        # Wake the poller so the command is sent promptly
+        elif self.poller is not None: self.poller.update(self)
 
 
     def parse_message(self, version, type, data):
+        # A repeated frame only shows the client is alive
+        if type in repeat_types:
+            counts = self.frame_counts.setdefault(type, [0, 0])
+
+            if self.last_frames.get(type) == data:
+                counts[0] += 1
+                self.last_message = time.time()
+                return
+
+            counts[1] += 1
+            self.last_frames[type] = data
+
         try:
-            msg = json.loads(data, cls = PYONDecoder)
+            msg = pyon_loads(data)
             #if debug: print 'MSG:', type, msg
             self.messages.append((version, type, msg))
+
+            # Only a host which talks resets the connect backoff
+            if not self.last_message and self.scheduler is not None:
+                self.scheduler.succeeded(self)
+
             self.last_message = time.time()
         except Exception as e:
             print('ERROR parsing PyON message: %s: %s'
@@ -216,47 +420,44 @@ class Connection:
 
 
     def parse(self):
-        start = self.readBuf.find('\nPyON ')
-        if start != -1:
-            eol = self.readBuf.find('\n', start + 1)
-            if eol != -1:
-                line = self.readBuf[start + 1: eol]
-                tokens = line.split(None, 2)
-
-                if len(tokens) < 3:
-                    self.readBuf = self.readBuf[eol:]
-                    raise Exception('Invalid PyON line: ' +
-                                    line.encode('string_escape'))
-
-                version = int(tokens[1])
-                type = tokens[2]
+        try:
+            frame = self.readBuf.next()
+        except Exception as e:
+            print('ERROR: %s' % e)
+            return True # Skip the bad frame and continue
 
-                end = self.readBuf.find('\n---\n', start)
-                if end != -1:
-                    data = self.readBuf[eol + 1: end]
-                    self.parse_message(version, type, data)
-                    self.readBuf = self.readBuf[end + 4:]
-                    return True
+        if frame is None: return False
 
-        return False
+        self.parse_message(*frame)
+        return True
 
 
+    @synchronized
     def update(self):
         try:
             try:
                 if not self.is_connected():
                     if self.socket is None:
-                        if self.last_connect + self.retry_rate < time.time():
+                        if self.stopped: return
+
+                        if self.scheduler is not None:
+                            if self.scheduler.can_connect(self): self.open()
+
+                        elif self.last_connect + self.retry_rate < \
+                                time.time():
                             self.open()
 
-                    elif self.last_connect + 60 < time.time():
+                    elif self.last_connect + self.connect_timeout < \
+                            time.time():
+                        self.fail_reason = 'timeout'
                         self.close() # Retry connect
 
                 if not self.is_connected(): return
 
                 self.write_some()
-                if self.read_some():
-                    while self.parse(): continue
+                if self.poller is None or self.can_read():
+                    if self.read_some():
+                        while self.parse(): continue
 
             # Handle special case for OSX disconnect
             except socket.error as e:
@@ -270,10 +471,15 @@ class Connection:
             print('ERROR on connection to %s:%d: %s' % (
                 self.address, self.port, e))
 
+        # Events consumed, wait for writability only if output is pending
+        self.events = 0
+        if self.poller is not None: self.poller.update(self)
+
         # Timeout connection
         if self.connected and self.last_message and \
-                self.last_message + 10 < time.time():
+                self.last_message + self.timeout < time.time():
             print('Connection timed out')
+            self.fail_reason = 'timeout'
             self.close()
 
 
@@ -21,6 +21,7 @@
 
 import sys
 import time
+import math
 import re
 import traceback
 import platform
@@ -28,6 +29,7 @@ import urllib
 
 import gtk
 import glib
+import gobject
 import pygtk
 pygtk.require("2.0")
 import pango
@@ -46,7 +48,9 @@ if sys.platform == 'darwin':
         from gtkosx_application import gtkosx_application_get_resource_path \
             as quartz_application_get_resource_path
 
-from fah import *
+from fah import version, NetworkThread, BulkOperation, Client, SlotConfig
+from fah import FleetStats, TimerQueue, set_list_row
+from fah import WidgetMap, LogView, get_icon, get_viewer_icon
 from fah.db import *
 from fah.util import *
 
@@ -125,7 +129,8 @@ def load_fahcontrol_db():
 
 
 class FAHControl(SingleAppServer):
-    client_cols = 'name status status_color address'.split()
+    client_cols = ('name status status_color address rate ppd slots eta '
+                   'error').split()
 
     # NOTE: These URLs are here rather than in the Glade file because the
     #  Glade editor strips the '&'s on save.  Even if you use '&amp;' the
@@ -156,19 +161,31 @@ class FAHControl(SingleAppServer):
         # Vars
         self.clients = {}
         self.clientsByAddress = {}
+        self.client_rows = {} # name -> [client_list iter, row]
+        self.changed_clients = set() # Rows to update this tick
         self.active_client = None
         self.client_is_online = False
         self.selected_clients = set()
-        self.status_clear_time = None
+        self.status_timer = None
         self.window_visible = False
+        self.window_iconified = False
         self.viewer = None
-        self.last_db_flush = 0
+        self.db_flush_timer = None
         self.last_clients_update = 0
         self.error_dialog = None
         self.restore_dialogs = []
-        self.last_clock = None
+        self.viewer_timer = None
+        self.timers = TimerQueue() # All of the GUI's periodic work
         self.timer_id = None
+        self.timer_deadline = None
         self.folding_power_changing = False
+        self.bulk_ops = []
+        self.fleet = FleetStats()
+        self.fleet_version = None # Of the totals last shown
+
+        # Network I/O runs in its own thread
+        gobject.threads_init()
+        self.network = NetworkThread(self.on_network_activity)
 
         # Open database
         try:
@@ -388,18 +405,23 @@ class FAHControl(SingleAppServer):
         self.log_view = builder.get_object('log_text_view')
         self.log_view.modify_font(self.mono_font)
         self.log = builder.get_object('log_buffer')
-        self.log.create_mark('end', self.log.get_end_iter())
         self.log_severity = builder.get_object('log_severity')
         self.log_slot_enable = builder.get_object('log_slot_enable')
         self.log_slot = builder.get_object('log_slot')
         self.log_unit_enable = builder.get_object('log_unit_enable')
         self.log_unit = builder.get_object('log_unit')
         self.log_follow = builder.get_object('log_follow')
+        self.log_search = builder.get_object('log_search')
+        self.log_viewer = LogView(self.log_view, self.log_follow)
 
         # Widget maps
         self.client_entries = WidgetMap(self.client_dialog, '_entry')
         self.client_option_widgets = \
             WidgetMap(self.client_config_notebook, '_option')
+        self.client_option_setters = dict(
+            [(name.replace('_', '-'), get_widget_setter(w))
+             for name, w in self.client_option_widgets.items()])
+        self.shown_options = (None, {}) # ClientConfig and options shown
         self.client_config_tabs = WidgetMap(self.client_config_notebook, '_tab')
         self.slot_option_widgets = WidgetMap(self.slot_dialog, '_option')
         roots = [self.window, self.client_dialog]
@@ -510,12 +532,12 @@ class FAHControl(SingleAppServer):
 
         self.restore()
 
-        self.set_update_timer_interval(100)
+        # Messages are delivered by the network thread, the timers only do
+        # housekeeping
+        self.network.start()
+        self.add_repeating_timer(1, self.on_second)
 
         if sys.platform == 'darwin':
-            # reduce updates to 2Hz after 30 seconds
-            gobject.timeout_add(30000, self.set_update_timer_interval, 500)
-
             # OSX signals
             self.osx_app.connect('NSApplicationDidBecomeActive',
                                  self.app_did_become_active)
@@ -624,21 +646,55 @@ class FAHControl(SingleAppServer):
         return tree, model
 
     # Timer functions
-    def set_update_timer_interval(self, interval = None):
-        if self.timer_id is not None:
-            glib.source_remove(self.timer_id)
-            self.timer_id = None
-        if interval and int(interval) > 0:
-            self.timer_id = gobject.timeout_add(interval, self.on_timer)
-        return False # stop if timer callback
+    def add_timer(self, delay, callback, *args):
+        timer = self.timers.add(delay, callback, *args)
+        self.arm_timer()
+        return timer
+
+
+    def add_repeating_timer(self, period, callback, *args):
+        timer = self.timers.add_repeating(period, callback, *args)
+        self.arm_timer()
+        return timer
+
+
+    def arm_timer(self):
+        # One GTK timeout, set for the next deadline, so the main loop sleeps
+        # until something is due
+        deadline = self.timers.get_deadline()
+        if deadline == self.timer_deadline: return
+
+        if self.timer_id is not None: glib.source_remove(self.timer_id)
+        self.timer_id = None
+        self.timer_deadline = deadline
+
+        if deadline is not None:
+            delay = int(math.ceil(max(0, deadline - time.time()) * 1000))
+            self.timer_id = gobject.timeout_add(delay, self.on_timer)
+
+
+    def on_timer(self):
+        self.timer_id = None
+        self.timer_deadline = None
+
+        try:
+            self.timers.run()
+        except:
+            traceback.print_exc()
+
+        self.arm_timer()
+        return False # Rearmed above
 
 
-    def check_clients(self):
+    def check_clients(self, clients = None):
+        '''Updates clients, all of them if None, and what depends on them.'''
         # Make sure there is a selected client
         if not len(self.selected_clients): self.select_first_client()
 
         # Update clients
-        for client in self.clients.values(): client.update(self)
+        if clients is None: clients = self.clients.values()
+        for client in clients: client.update(self)
+        self.update_client_rows()
 
         # (De)activate client
         if self.active_client:
@@ -652,48 +708,82 @@ class FAHControl(SingleAppServer):
             self.client_notebook.set_sensitive(True)
         else: self.client_notebook.set_sensitive(False)
 
-        # Update status bar
-        if self.status_clear_time and self.status_clear_time < time.time():
-            self.status_bar.pop(0)
-            self.status_clear_time = None
+        self.update_bulk_ops()
 
+        # Update ppd and fleet totals, kept up to date by the clients
+        if self.fleet_version != self.fleet.version:
+            self.fleet_version = self.fleet.version
+            self.update_fleet_totals()
 
-    def on_timer(self):
-        try:
-            # Update clock
-            now = time.time()
-            if self.last_clock and self.last_clock != now:
-                s = time.strftime('UTC: %Y-%m-%dT%H:%M:%SZ', time.gmtime())
-                self.time_label.set_text(s)
 
-                # Update ppd
-                ppd = 0
-                for client in self.clients.values(): ppd += client.ppd
-                label = 'Total Estimated Points Per Day: '
-                if int(ppd): label += '%d' % int(ppd)
-                else: label += 'Unknown'
-                self.ppd_label.set_text(label)
+    def on_second(self):
+        # Update clock
+        s = time.strftime('UTC: %Y-%m-%dT%H:%M:%SZ', time.gmtime())
+        self.time_label.set_text(s)
+
+        # ETAs count down without new messages, repaint the rows which have
+        # one.  Only their changed ETA cells are set.
+        for client in self.clients.values():
+            if client.summary['eta'] is not None:
+                self.changed_clients.add(client)
+
+        # Byte rates, timeouts and bulk operations of every client, messages
+        # only check the clients they came from
+        self.check_clients()
+
 
-            self.last_clock = now
+    def on_request(self):
+        if self.exit_requested.isSet():
+            self.quit()
 
-            self.check_clients()
-            self.viewer_check()
+        if self.ping.isSet():
+            self.ping.clear()
+            self.restore()
 
-            if self.exit_requested.isSet():
-                self.quit()
+        return False # Once per request
 
-            if self.ping.isSet():
-                self.ping.clear()
-                self.restore()
 
-            if 2.5 < now - self.last_db_flush:
-                self.last_db_flush = time.time()
-                self.db.flush_queued()
+    def flush_db_later(self):
+        if self.db_flush_timer is None or \
+                not self.db_flush_timer.is_pending():
+            self.db_flush_timer = self.add_timer(2.5, self.db.flush_queued)
+
+
+    def update_fleet_totals(self):
+        label = 'Total Estimated Points Per Day: '
+        if int(self.fleet.ppd): label += '%d' % int(self.fleet.ppd)
+        else: label += 'Unknown'
+        if 1 < self.fleet.clients: label += '  (%s)' % self.fleet.get_text()
+        self.ppd_label.set_text(label)
+
+
+    def on_network_activity(self):
+        # Called from the network thread
+        gobject.idle_add(self.on_network_messages)
+
+
+    def on_network_messages(self):
+        try:
+            messages, more = self.network.get_messages(500)
+
+            # Group by client, keeping each client's messages in order
+            batches = OrderedDict()
+            for client, v, type, data in messages:
+                batches.setdefault(client, []).append((v, type, data))
+
+            clients = []
+            for client, batch in batches.items():
+                if self.clients.get(client.name) is client:
+                    client.process_messages(self, batch)
+                    clients.append(client)
+
+            self.check_clients(clients)
 
         except:
             traceback.print_exc()
+            more = False
 
-        return True # Keep running
+        return more # Keep going while messages remain
 
 
     # Actions
@@ -705,7 +795,9 @@ class FAHControl(SingleAppServer):
 
         self.viewer_close()
 
-        self.set_update_timer_interval(0)
+        if self.timer_id is not None: glib.source_remove(self.timer_id)
+        self.timer_id = None
+        self.network.stop()
 
         for client in self.clients.values(): client.close()
 
@@ -720,7 +812,9 @@ class FAHControl(SingleAppServer):
     def set_status(self, text):
         self.status_bar.pop(0)
         self.status_bar.push(0, text)
-        self.status_clear_time = time.time() + 10
+
+        if self.status_timer is not None: self.status_timer.cancel()
+        self.status_timer = self.add_timer(10, self.status_bar.pop, 0)
 
 
     # OSX signals
@@ -938,42 +1032,36 @@ class FAHControl(SingleAppServer):
         self.db.commit()
 
 
+    def set_client_row(self, client):
+        entry = self.client_rows.get(client.name)
+        if entry is not None:
+            set_list_row(self.client_list, entry, client.get_row(self))
+
+
+    def update_client_rows(self):
+        # One model change per changed client, however often it changed
+        for client in self.changed_clients: self.set_client_row(client)
+        self.changed_clients.clear()
+
+
     def update_client_list(self):
         # update all rows, whether selected/active or not
         try:
-            iter = self.client_list.get_iter_first()
-            while iter is not None:
-                name = self.client_list.get_value(iter, 0)
-                client = self.clients.get(name)
-                if client is not None:
-                    path = self.client_list.get_path(iter)
-                    row = client.get_row(self)
-                    for i in range(len(row)):
-                        self.client_list.set(iter, i, row[i])
-                    self.client_list.row_changed(path, iter)
-                iter = self.client_list.iter_next(iter)
+            for client in self.clients.values(): self.set_client_row(client)
         except Exception as e:
             print(e)
         return False # no timer repeat
 
 
     def resort_client_list(self):
-        ibyname_old = {}
-        iter = self.client_list.get_iter_first()
-        i = 0
-        while iter is not None:
-            name = self.client_list.get_value(iter, 0)
-            ibyname_old[name] = i
-            iter = self.client_list.iter_next(iter)
-            i += 1
         new_order = []
         for client in self.sorted_clients():
             name = client.name
-            i = ibyname_old.get(name)
-            if i is None:
+            entry = self.client_rows.get(name)
+            if entry is None:
                 print('unable to resort client list: unknown name %s' % name)
                 return
-            new_order.append(i)
+            new_order.append(self.client_list.get_path(entry[0])[0])
         self.client_list.reorder(new_order)
         return False # don't repeat if timer callback
 
@@ -1014,7 +1102,8 @@ class FAHControl(SingleAppServer):
         clients = []
         for row in self.db.select('clients', orderby = 'name'):
             client = Client(self,
-                row['name'], row['address'], int(row['port']), row['password'])
+                row['name'], row['address'], int(row['port']), row['password'],
+                row['tags'])
             clients.append(client)
 
         for client in self.sorted_clients(clients):
@@ -1022,9 +1111,7 @@ class FAHControl(SingleAppServer):
 
 
     def clear_clients(self):
-        for client in self.clients: client.close()
-        self.clients.clear()
-        self.clientsByName.clear()
+        for client in list(self.clients.values()): self.remove_client(client)
         self.client_list.clear()
 
 
@@ -1082,7 +1169,7 @@ class FAHControl(SingleAppServer):
         return False
 
 
-    def update_client(self, client, name, address, port, password):
+    def update_client(self, client, name, address, port, password, tags):
         reload = False
         old_name = client.name
 
@@ -1099,6 +1186,7 @@ class FAHControl(SingleAppServer):
             del self.clients[client.name]
             client.name = name
             self.clients[name] = client
+            self.client_rows[name] = self.client_rows.pop(old_name)
 
         if client.get_address() != new_address:
             del self.clientsByAddress[client.get_address()]
@@ -1110,22 +1198,10 @@ class FAHControl(SingleAppServer):
             client.set_password(password)
             reload = not client.conn.is_connected()
 
-        # Update client row
-        row = client.get_row(self)
-
-        # Find client in client_list
-        iter = self.client_list.get_iter_first()
-        while iter is not None:
-            if old_name == self.client_list.get_value(iter, 0):
-                path = self.client_list.get_path(iter)
-
-                for i in range(len(row)):
-                    self.client_list.set(iter, i, row[i])
-                self.client_list.row_changed(path, iter)
+        client.set_tags(tags)
 
-                break
-
-            iter = self.client_list.iter_next(iter)
+        # Update client row
+        self.set_client_row(client)
 
         # Reload
         if reload:
@@ -1146,15 +1222,20 @@ class FAHControl(SingleAppServer):
         # Add it
         self.clients[name] = client
         self.clientsByAddress[address] = client
-        self.client_list.append(client.get_row(self))
+        row = client.get_row(self)
+        self.client_rows[name] = [self.client_list.append(row), row]
 
         return True
 
 
     def remove_client(self, client):
+        self.network.remove(client.conn)
         client.close()
+        self.fleet.remove(client.summary)
         del self.clients[client.name]
         del self.clientsByAddress[client.get_address()]
+        del self.client_rows[client.name] # The caller removes the row
+        self.changed_clients.discard(client)
         if client is self.active_client: self.active_client = None
 
 
@@ -1163,6 +1244,16 @@ class FAHControl(SingleAppServer):
         self.remove_client(self.clients[name])
 
 
+    def get_tagged_clients(self, tag):
+        return [c for c in self.clients.values() if tag in c.tags]
+
+
+    def get_client_tags(self):
+        tags = set()
+        for client in self.clients.values(): tags.update(client.tags)
+        return sorted(tags)
+
+
     def get_selected_clients(self):
         selection = get_tree_selection(self.client_tree)
         names = map(lambda item: self.client_list.get(item[1], 0)[0], selection)
@@ -1194,6 +1285,78 @@ class FAHControl(SingleAppServer):
         dialog.resize(*dims)
 
 
+    # Bulk operations
+    def run_bulk_op(self, clients, action, value = None):
+        if not clients: return
+
+        if action == 'power': value = value.lower()
+
+        op = BulkOperation(clients, action, value)
+        op.start()
+        self.bulk_ops.append(op)
+        self.update_bulk_ops()
+        self.add_timer(op.timeout, self.update_bulk_ops) # Fail the stragglers
+
+
+    def set_folding_power(self):
+        '''Sends the slider's power to the selected clients not already at it.
+        The slider is also moved when the shown client's options change.'''
+        power = self.folding_power_levels[int(self.folding_power.get_value())]
+        clients = [c for c in self.selected_clients
+                   if (c.config.get('power') or '').lower() != power.lower()]
+        self.run_bulk_op(clients, 'power', power)
+
+
+    def update_bulk_ops(self):
+        for op in list(self.bulk_ops):
+            op.update()
+            self.set_status(op.get_status())
+            if not op.is_done(): continue
+
+            self.bulk_ops.remove(op)
+            failures = op.get_failures()
+            if not failures or len(op.clients) == 1: continue
+
+            names = ['%s (%s)' % failure for failure in failures[:20]]
+            if 20 < len(failures): names.append('...')
+            self.error('%s\n\nFailed clients: %s' % (
+                    op.get_status(), ', '.join(names)))
+
+
+    def make_client_menu(self):
+        menu = gtk.Menu()
+
+        targets = [('All Clients', self.clients.values())]
+        for tag in self.get_client_tags():
+            targets.append(('Tagged "%s"' % tag, self.get_tagged_clients(tag)))
+
+        actions = [('Fold', 'unpause', None), ('Pause', 'pause', None),
+                   ('Finish', 'finish', None), None]
+        for level in self.folding_power_levels:
+            actions.append(('%s Power' % level, 'power', level))
+
+        for label, clients in targets:
+            item = gtk.MenuItem('%s (%d)' % (label, len(clients)))
+            submenu = gtk.Menu()
+
+            for action in actions:
+                if action is None:
+                    submenu.append(gtk.SeparatorMenuItem())
+                    continue
+
+                name, action, value = action
+                child = gtk.MenuItem(name)
+                child.connect('activate', lambda widget, c = clients,
+                              a = action, v = value: self.run_bulk_op(c, a, v))
+                submenu.append(child)
+
+            item.set_submenu(submenu)
+            menu.append(item)
+
+        menu.show_all()
+        return menu
+
+
     # Slot methods
     def get_selected_slot_ids(self):
         selection = get_tree_selection(self.slot_status_tree)
@@ -1212,6 +1375,10 @@ class FAHControl(SingleAppServer):
         return dialogs
 
 
+    def is_window_shown(self):
+        return self.window_visible and not self.window_iconified
+
+
     def hide_all_windows(self):
         self.restore_dialogs = self.get_visible_dialogs()
         for dialog in self.restore_dialogs: dialog.hide()
@@ -1274,6 +1441,7 @@ class FAHControl(SingleAppServer):
     # Property signals
     def store_property(self, widget, property, name):
         self.db.set(name, widget.get_property(property.name), queue = True)
+        self.flush_db_later()
 
 
     def store_dimensions(self, widget, event, name):
@@ -1281,6 +1449,7 @@ class FAHControl(SingleAppServer):
         if 0 <= width and 0 <= height:
             self.db.set(name + '_width', width, queue = True);
             self.db.set(name + '_height', height, queue = True);
+            self.flush_db_later()
 
 
     # Action signals
@@ -1305,6 +1474,10 @@ class FAHControl(SingleAppServer):
                            self.viewer.stderr.read())
             self.viewer = None # Viewer exited
 
+        if self.viewer is None and self.viewer_timer is not None:
+            self.viewer_timer.cancel()
+            self.viewer_timer = None
+
 
     def viewer_close(self):
         if self.viewer is not None:
@@ -1362,6 +1535,11 @@ class FAHControl(SingleAppServer):
                                 bufsize = 4096, stderr=subprocess.PIPE)
             else:
                 self.viewer = subprocess.Popen(cmd, cwd = get_home_dir())
+
+            if self.viewer_timer is None:
+                self.viewer_timer = \
+                    self.add_repeating_timer(1, self.viewer_check)
+
         except Exception:
             self.error('Failed to launch viewer with command:\n\n' +
                        ' '.join(cmd))
@@ -1393,6 +1571,11 @@ class FAHControl(SingleAppServer):
         return self.on_window_destroy(widget)
 
 
+    def on_window_state_event(self, widget, event, data = None):
+        state = event.new_window_state
+        self.window_iconified = bool(state & gtk.gdk.WINDOW_STATE_ICONIFIED)
+
+
     def on_window_is_active(self, window, *args):
         try:
             if window.is_active(): self.update_client_list()
@@ -1441,6 +1624,7 @@ class FAHControl(SingleAppServer):
             if not name in self.clients: break
 
         self.client_entries['name'].set_text(name)
+        self.client_entries['tags'].set_text('')
 
         self.client_dialog.client = None
         text = 'Configure New Client Connection'
@@ -1479,6 +1663,14 @@ class FAHControl(SingleAppServer):
         self.edit_client(client)
 
 
+    def on_client_tree_view_button_release_event(self, widget, event,
+                                                  data = None):
+        if event.button != 3 or not len(self.clients): return
+        self.client_menu = self.make_client_menu()
+        self.client_menu.popup(None, None, None, button = event.button,
+                               activate_time = event.time)
+
+
     def on_client_selection_changed(self, widget, data = None):
         self.deactivate_client()
 
@@ -1493,12 +1685,7 @@ class FAHControl(SingleAppServer):
         if len(self.clients): self.activate_client()
 
         self.update_client_list()
-        gobject.timeout_add(5000, self.update_client_list)
-
-        # temporarily increase update rate for faster switch
-        if sys.platform == 'darwin':
-            self.set_update_timer_interval(100)
-            gobject.timeout_add(10000, self.set_update_timer_interval, 500)
+        self.add_timer(5, self.update_client_list)
 
 
     # Client options list signals
@@ -1542,6 +1729,7 @@ class FAHControl(SingleAppServer):
         address = self.client_entries['address'].get_text()
         port = self.client_entries['port'].get_text()
         password = self.client_entries['password'].get_text()
+        tags = self.client_entries['tags'].get_text()
 
         if not name:
             self.error('Invalid name')
@@ -1564,13 +1752,14 @@ class FAHControl(SingleAppServer):
             # Save client options
             if config_hidden or self.save_client_config(client):
                 # Save client connection
-                if self.update_client(client, name, address, port, password):
+                if self.update_client(client, name, address, port, password,
+                                      tags):
                     self.save_clients()
                     self.client_dialog.hide()
                     self.resort_client_list()
 
         else: # New client
-            client = Client(self, name, address, port, password)
+            client = Client(self, name, address, port, password, tags)
             if self.add_client(client):
                 self.save_clients()
                 self.client_dialog.hide()
@@ -1584,15 +1773,15 @@ class FAHControl(SingleAppServer):
 
     # Folding power signals
     def on_fold_button_clicked(self, widget, data = None):
-        self.active_client.unpause()
+        self.run_bulk_op(self.selected_clients, 'unpause')
 
 
     def on_pause_button_clicked(self, widget, data = None):
-        self.active_client.pause()
+        self.run_bulk_op(self.selected_clients, 'pause')
 
 
     def on_finish_button_clicked(self, widget, data = None):
-        self.active_client.finish()
+        self.run_bulk_op(self.selected_clients, 'finish')
 
 
     def on_folding_power_change_value(self, widget, scroll, value, data = None):
@@ -1605,8 +1794,7 @@ class FAHControl(SingleAppServer):
 
     def on_folding_power_value_changed(self, widget, data = None):
         if not self.folding_power_changing and self.active_client:
-            power = self.folding_power_levels[int(widget.get_value())]
-            self.active_client.set_power(power)
+            self.set_folding_power()
 
 
     def on_folding_power_button_press(self, widget, data = None):
@@ -1614,9 +1802,7 @@ class FAHControl(SingleAppServer):
 
 
     def on_folding_power_button_release(self, widget, data = None):
-        if self.active_client:
-            power = self.folding_power_levels[int(widget.get_value())]
-            self.active_client.set_power(power)
+        if self.active_client: self.set_folding_power()
 
         self.folding_power_changing = False
 
@@ -1806,13 +1992,23 @@ class FAHControl(SingleAppServer):
     # Log signals
     def on_download_log_clicked(self, widget, data = None):
         self.active_client.refresh_log()
-        self.log.set_text('')
+        self.log_viewer.clear()
 
 
     def on_copy_log_clicked(self, widget, data = None):
-        log = self.log
-        text = log.get_text(log.get_start_iter(), log.get_end_iter())
-        gtk.Clipboard().set_text(text)
+        gtk.Clipboard().set_text(self.log_viewer.get_all_text())
+
+
+    def on_log_follow_toggled(self, widget, data = None):
+        self.log_viewer.scroll_to_end()
+
+
+    def on_log_search_activate(self, widget, data = None):
+        if not self.log_viewer.find(widget.get_text()): gtk.gdk.beep()
+
+
+    def on_log_search_changed(self, widget, data = None):
+        self.log_viewer.search_pos = None
 
 
     def on_clear_log_clicked(self, widget, data = None):
@@ -0,0 +1,198 @@
+################################################################################
+#                                                                              #
+#                    Folding@Home Client Control (FAHControl)                  #
+#                   Copyright (C) 2016-2020 foldingathome.org                  #
+#                  Copyright (C) 2010-2016 Stanford University                 #
+#                                                                              #
+#      This program is free software: you can redistribute it and/or modify    #
+#      it under the terms of the GNU General Public License as published by    #
+#       the Free Software Foundation, either version 3 of the License, or      #
+#                      (at your option) any later version.                     #
+#                                                                              #
+#        This program is distributed in the hope that it will be useful,       #
+#         but WITHOUT ANY WARRANTY; without even the implied warranty of       #
+#         MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the        #
+#                  GNU General Public License for more details.                #
+#                                                                              #
+#       You should have received a copy of the GNU General Public License      #
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.    #
+#                                                                              #
+################################################################################
+
+import time
+
+# Seconds per unit in the client's time strings, e.g. '2 hours 13 mins'
+eta_units = {'sec': 1, 'secs': 1, 'min': 60, 'mins': 60, 'hour': 3600,
+             'hours': 3600, 'day': 86400, 'days': 86400}
+
+# Slot statuses in the order they are listed
+slot_order = ['RUNNING', 'FINISHING', 'READY', 'PAUSED', 'FAILED']
+
+
+def parse_eta(text):
+    '''Returns the seconds in a client time string or None if unknown.'''
+    words = str(text).split()
+    if not words or len(words) % 2: return None
+
+    seconds = 0
+    try:
+        for i in range(0, len(words), 2):
+            seconds += float(words[i]) * eta_units[words[i + 1]]
+    except (ValueError, KeyError): return None
+
+    if seconds <= 0: return None
+    return seconds
+
+
+def format_eta(seconds):
+    if seconds is None: return ''
+    seconds = max(0, int(seconds))
+    if 86400 <= seconds: return '%.2f days' % (seconds / 86400.0)
+    hours, seconds = divmod(seconds, 3600)
+    if hours: return '%d hours %02d mins' % (hours, seconds / 60)
+    return '%d mins %02d secs' % divmod(seconds, 60)
+
+
+def count_slots(slots):
+    '''Returns slot status -> count of a slots message.'''
+    counts = {}
+    for slot in slots:
+        status = str(slot.get('status', 'UNKNOWN')).upper()
+        counts[status] = counts.get(status, 0) + 1
+    return counts
+
+
+def format_slot_counts(counts):
+    def key(status):
+        if status in slot_order: return (slot_order.index(status), status)
+        return (len(slot_order), status)
+
+    return ', '.join(['%d %s' % (counts[status], status.lower())
+                      for status in sorted(counts, key = key)])
+
+
+def get_next_eta(units):
+    '''Returns the time the first running WorkUnit will finish or None.'''
+    etas = [unit.eta for unit in units
+            if unit.is_running() and unit.eta is not None]
+    if etas: return time.time() + min(etas)
+
+
+def get_unit_errors(units):
+    '''Returns the number of WorkUnits with an error.'''
+    return len([unit for unit in units if unit.error])
+
+
+def add_count(counts, name, count):
+    count += counts.get(name, 0)
+    if count: counts[name] = count
+    else: counts.pop(name, None)
+
+
+
+class FleetStats:
+    '''Totals over all clients, kept up to date as messages arrive.
+
+    Each client owns a summary from add().  update() changes a summary and
+    moves its old and new values out of and into the totals, so reading the
+    totals never scans the clients.  version changes with the totals.
+    '''
+
+    def __init__(self):
+        self.clients = 0
+        self.ppd = 0.0
+        self.status = {} # Client status -> count
+        self.slots = {}  # Slot status -> count
+        self.errors = 0  # Clients with an error
+        self.version = 0
+
+
+    def add(self):
+        summary = {'status': 'Connecting', 'ppd': 0.0, 'slots': {},
+                   'eta': None, 'error': ''}
+        self.apply(summary, 1)
+        return summary
+
+
+    def remove(self, summary): self.apply(summary, -1)
+
+
+    def update(self, summary, **values):
+        '''Returns True if the summary changed.'''
+        for name, value in values.items():
+            if summary[name] != value: break
+        else: return False
+
+        self.apply(summary, -1)
+        summary.update(values)
+        self.apply(summary, 1)
+        return True
+
+
+    def apply(self, summary, sign):
+        self.clients += sign
+        self.ppd += sign * summary['ppd']
+        add_count(self.status, summary['status'], sign)
+        for status, count in summary['slots'].items():
+            add_count(self.slots, status, sign * count)
+        if summary['error']: self.errors += sign
+        self.version += 1
+
+
+    def get_online(self):
+        return self.clients - self.status.get('Connecting', 0) - \
+            self.status.get('Offline', 0)
+
+
+    def get_text(self):
+        '''Returns a one line summary of the fleet.'''
+        text = '%d/%d clients online' % (self.get_online(), self.clients)
+        if self.slots: text += ', slots: ' + format_slot_counts(self.slots)
+        if self.errors:
+            text += ', %d error%s' % (self.errors, 's'[self.errors == 1:])
+        return text
+
+
+
+
+if __name__ == '__main__':
+    import random
+
+    # Compare with recomputing from the summaries after random updates
+    fleet = FleetStats()
+    summaries = [fleet.add() for i in range(1000)]
+    r = random.Random(1)
+
+    for i in range(100000):
+        summary = r.choice(summaries)
+        field = r.choice(['status', 'ppd', 'slots', 'error'])
+        if field == 'status':
+            value = r.choice(['Online', 'Connecting', 'Updating'])
+        elif field == 'ppd': value = float(r.randint(0, 10 ** 6))
+        elif field == 'slots':
+            value = count_slots([{'status': r.choice(slot_order)}
+                                 for j in range(r.randint(0, 4))])
+        else: value = r.choice(['', 'Failed'])
+        fleet.update(summary, **{field: value})
+
+    slots = {}
+    status = {}
+    for summary in summaries:
+        add_count(status, summary['status'], 1)
+        for name, count in summary['slots'].items():
+            add_count(slots, name, count)
+
+    assert fleet.clients == len(summaries)
+    assert fleet.ppd == sum([s['ppd'] for s in summaries])
+    assert fleet.status == status and fleet.slots == slots
+    assert fleet.errors == len([s for s in summaries if s['error']])
+
+    assert parse_eta('2 hours 13 mins') == 7980
+    assert parse_eta('1.50 days') == 129600
+    assert parse_eta('0.00 secs') is None and parse_eta('') is None
+    assert format_eta(7980) == '2 hours 13 mins'
+    assert format_slot_counts({'PAUSED': 1, 'RUNNING': 2}) == \
+        '2 running, 1 paused'
+
+    print('Tests OK')
+    print(fleet.get_text())
@@ -0,0 +1,265 @@
+################################################################################
+#                                                                              #
+#                    Folding@Home Client Control (FAHControl)                  #
+#                   Copyright (C) 2016-2020 foldingathome.org                  #
+#                  Copyright (C) 2010-2016 Stanford University                 #
+#                                                                              #
+#      This program is free software: you can redistribute it and/or modify    #
+#      it under the terms of the GNU General Public License as published by    #
+#       the Free Software Foundation, either version 3 of the License, or      #
+#                      (at your option) any later version.                     #
+#                                                                              #
+#        This program is distributed in the hope that it will be useful,       #
+#         but WITHOUT ANY WARRANTY; without even the implied warranty of       #
+#         MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the        #
+#                  GNU General Public License for more details.                #
+#                                                                              #
+#       You should have received a copy of the GNU General Public License      #
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.    #
+#                                                                              #
+################################################################################
+
+import bisect
+
+
+class LogView:
+    '''Shows the filtered lines of a LogStore in a gtk.TextView.
+
+    Only a window of lines around the visible ones is kept in the
+    gtk.TextBuffer.  More are loaded, and the far end of the window dropped,
+    as the view is scrolled near either end of the window.
+    '''
+
+    def __init__(self, view, follow, window = 2000, margin = 500):
+        self.view = view
+        self.buffer = view.get_buffer()
+        self.follow = follow
+        self.window = window
+        self.margin = margin
+
+        self.store = None
+        self.lines = [] # Numbers of the store lines which pass the filter
+        self.start = 0  # self.lines[start:end] are in the buffer
+        self.end = 0
+        self.loading = False
+        self.search_pos = None
+
+        self.end_mark = self.buffer.create_mark('end',
+                                                self.buffer.get_end_iter())
+        self.adjustment = view.get_parent().get_vadjustment()
+        self.adjustment.connect('value-changed', self.on_scroll)
+
+
+    def get_text(self, start, end):
+        if start == end: return ''
+        text = '\n'.join(self.store.get_lines(self.lines[start:end]))
+        return text.decode('utf-8', 'ignore') + '\n'
+
+
+    def get_all_text(self):
+        '''Returns every filtered line, not just those in the buffer.'''
+        if self.store is None: return ''
+        return self.get_text(0, len(self.lines))
+
+
+    def get_top_mark(self):
+        rect = self.view.get_visible_rect()
+        iter = self.view.get_iter_at_location(rect.x, rect.y)
+        return self.buffer.create_mark(None, iter, True)
+
+
+    def restore_top_mark(self, mark):
+        self.view.scroll_to_mark(mark, 0, True, 0, 0)
+        self.buffer.delete_mark(mark)
+
+
+    def remove_first(self, count):
+        '''Removes the first count lines from the buffer.'''
+        count = min(count, self.end - self.start)
+        if count <= 0: return
+        buffer = self.buffer
+        buffer.delete(buffer.get_start_iter(), buffer.get_iter_at_line(count))
+        self.start += count
+
+
+    def remove_last(self, count):
+        '''Removes the last count lines from the buffer.'''
+        count = min(count, self.end - self.start)
+        if count <= 0: return
+        buffer = self.buffer
+        line = self.end - self.start - count
+        buffer.delete(buffer.get_iter_at_line(line), buffer.get_end_iter())
+        self.end -= count
+
+
+    def load(self, start, end):
+        '''Replaces the buffer with self.lines[start:end].'''
+        self.loading = True
+        try:
+            self.start = max(0, start)
+            self.end = min(len(self.lines), end)
+            self.buffer.set_text(self.get_text(self.start, self.end))
+        finally:
+            self.loading = False
+
+
+    def load_before(self):
+        start = max(0, self.start - self.margin)
+        if start == self.start: return
+
+        self.loading = True
+        try:
+            mark = self.get_top_mark()
+            text = self.get_text(start, self.start)
+            self.buffer.insert(self.buffer.get_start_iter(), text)
+            self.start = start
+            self.remove_last(self.end - self.start - self.window - self.margin)
+            self.restore_top_mark(mark)
+        finally:
+            self.loading = False
+
+
+    def load_after(self):
+        end = min(len(self.lines), self.end + self.margin)
+        if end == self.end: return
+
+        self.loading = True
+        try:
+            mark = self.get_top_mark()
+            text = self.get_text(self.end, end)
+            self.buffer.insert(self.buffer.get_end_iter(), text)
+            self.end = end
+            self.remove_first(self.end - self.start - self.window - self.margin)
+            self.restore_top_mark(mark)
+        finally:
+            self.loading = False
+
+
+    def prune(self):
+        '''Forgets lines which were dropped from the store.'''
+        count = bisect.bisect_left(self.lines, self.store.first)
+        if not count: return
+
+        self.loading = True
+        try:
+            self.remove_first(min(self.end, count) - self.start)
+        finally:
+            self.loading = False
+
+        del self.lines[:count]
+        self.start = max(self.start, count) - count
+        self.end = max(self.end, count) - count
+        if self.search_pos is not None:
+            self.search_pos = max(self.search_pos, count) - count
+
+
+    def clear(self):
+        self.store = None
+        self.lines = []
+        self.start = self.end = 0
+        self.search_pos = None
+        self.load(0, 0)
+
+
+    def set_lines(self, store, lines):
+        '''Shows the given store line numbers.'''
+        self.store = store
+        self.lines = list(lines)
+        self.search_pos = None
+
+        if self.follow.get_active(): self.scroll_to_end(True)
+        else: self.load(0, self.window)
+
+
+    def append(self, store, lines):
+        '''Adds new store line numbers.'''
+        if not len(lines): return
+
+        self.store = store
+        self.prune()
+        at_end = self.end == len(self.lines)
+        self.lines.extend(lines)
+
+        following = self.follow.get_active()
+        if not at_end or (not following and
+                          self.window + self.margin <= self.end - self.start):
+            return # Loaded when scrolled to
+
+        self.loading = True
+        try:
+            text = self.get_text(self.end, len(self.lines))
+            self.buffer.insert(self.buffer.get_end_iter(), text)
+            self.end = len(self.lines)
+            if following: self.remove_first(self.end - self.start - self.window)
+        finally:
+            self.loading = False
+
+        self.scroll_to_end()
+
+
+    def scroll_to_end(self, force = False):
+        if not force and not self.follow.get_active(): return
+
+        if force or self.end != len(self.lines):
+            self.load(len(self.lines) - self.window, len(self.lines))
+
+        buffer = self.buffer
+        buffer.move_mark(self.end_mark, buffer.get_end_iter())
+        self.view.scroll_mark_onscreen(self.end_mark)
+
+
+    def show_line(self, i):
+        '''Loads the window around self.lines[i], returns its buffer line.'''
+        if i < self.start or self.end <= i:
+            start = max(0, i - self.window / 2)
+            self.load(start, start + self.window)
+
+        return i - self.start
+
+
+    def find(self, text, backward = False):
+        '''Selects the next line containing text, searching every filtered
+        line from the last match.  Returns False if there is none.'''
+        if not text or self.store is None or not self.lines: return False
+
+        text = text.encode('utf-8') if isinstance(text, unicode) else text
+        count = len(self.lines)
+        pos = self.search_pos
+        if pos is None: pos = count - 1 if backward else 0
+        else: pos += -1 if backward else 1
+
+        for i in range(count):
+            i = (pos - i if backward else pos + i) % count
+            line = self.store[self.lines[i]]
+            offset = line.find(text)
+            if offset == -1: continue
+
+            # Stop following so new lines don't scroll the match away
+            self.follow.set_active(False)
+            self.search_pos = i
+
+            line_start = self.buffer.get_iter_at_line(self.show_line(i))
+            offset = len(line[:offset].decode('utf-8', 'ignore'))
+            length = len(text.decode('utf-8', 'ignore'))
+            start = line_start.copy()
+            start.forward_chars(offset)
+            end = start.copy()
+            end.forward_chars(length)
+
+            self.buffer.select_range(start, end)
+            self.view.scroll_to_iter(start, 0.1)
+            return True
+
+        return False
+
+
+    def on_scroll(self, adjustment):
+        if self.loading or self.store is None: return
+
+        value = adjustment.value
+        page = adjustment.page_size
+
+        if value < page and 0 < self.start: self.load_before()
+        elif adjustment.upper - 2 * page < value and \
+                self.end < len(self.lines):
+            self.load_after()
@@ -0,0 +1,292 @@
+################################################################################
+#                                                                              #
+#                    Folding@Home Client Control (FAHControl)                  #
+#                   Copyright (C) 2016-2020 foldingathome.org                  #
+#                  Copyright (C) 2010-2016 Stanford University                 #
+#                                                                              #
+#      This program is free software: you can redistribute it and/or modify    #
+#      it under the terms of the GNU General Public License as published by    #
+#       the Free Software Foundation, either version 3 of the License, or      #
+#                      (at your option) any later version.                     #
+#                                                                              #
+#        This program is distributed in the hope that it will be useful,       #
+#         but WITHOUT ANY WARRANTY; without even the implied warranty of       #
+#         MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the        #
+#                  GNU General Public License for more details.                #
+#                                                                              #
+#       You should have received a copy of the GNU General Public License      #
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.    #
+#                                                                              #
+################################################################################
+
+import time
+import json
+import urllib
+import threading
+import traceback
+import BaseHTTPServer
+
+from fah.Connection import Connection, sum_frame_counts
+from fah.NetworkThread import NetworkThread
+
+debug = False
+
+# Seconds between updates of each monitored client
+monitor_rates = {'heartbeat': 10, 'ppd': 30, 'queue-info': 30, 'slot-info': 10}
+
+
+def get_monitor_cmds():
+    return [
+        'updates clear',
+        'updates add 0 %d $heartbeat' % monitor_rates['heartbeat'],
+        'updates add 1 %d $ppd' % monitor_rates['ppd'],
+        'updates add 2 %d $queue-info' % monitor_rates['queue-info'],
+        'updates add 3 %d $slot-info' % monitor_rates['slot-info'],
+        'info',
+        ]
+
+
+class MonitoredClient:
+    '''The latest units, slots, PPD and info of one client.
+
+    The JSON of the client is cached until the next message or status
+    change so polling many clients does not re-encode unchanged state.
+    '''
+
+    def __init__(self, network, name, address, port, password, tags = ''):
+        self.name = name
+        self.address = address
+        self.port = port
+        self.tags = tags.replace(',', ' ').split()
+
+        self.ppd = 0
+        self.units = []
+        self.slots = []
+        self.info = []
+        self.last_message = None
+        self.version = 0 # Incremented on every state change
+        self.cache = {}  # (full, version, status) -> JSON
+
+        self.conn = Connection(address, port, password,
+                               poller = network.poller,
+                               scheduler = network.scheduler,
+                               resolver = network.resolver)
+        self.conn.timeout = 2.5 * monitor_rates['heartbeat']
+        self.conn.set_init_commands(get_monitor_cmds())
+
+
+    def get_status(self):
+        status = self.conn.get_status()
+        if status == 'Online' and self.conn.is_congested(): return 'Congested'
+        return status
+
+
+    def get_slot_counts(self):
+        counts = {}
+        for slot in self.slots:
+            status = slot.get('status', 'UNKNOWN')
+            counts[status] = counts.get(status, 0) + 1
+        return counts
+
+
+    def get_summary(self):
+        return {
+            'name': self.name,
+            'address': '%s:%d' % (self.address, self.port),
+            'tags': self.tags,
+            'status': self.get_status(),
+            'ppd': self.ppd,
+            'slots': self.get_slot_counts(),
+            'units': len(self.units),
+            'last_message': self.last_message,
+            }
+
+
+    def get_state(self):
+        state = self.get_summary()
+        state.update(slots = self.slots, units = self.units, info = self.info)
+        return state
+
+
+    def get_json(self, full = False):
+        key = (full, self.version, self.get_status())
+        if key not in self.cache:
+            state = self.get_state() if full else self.get_summary()
+            self.cache = {key: json.dumps(state)}
+        return self.cache[key]
+
+
+    def process_message(self, type, data):
+        if debug: print('%s: %s' % (self.name, type))
+
+        if type == 'heartbeat': return
+
+        if type == 'ppd':
+            try:
+                self.ppd = float(data)
+            except: self.ppd = 0
+
+        elif type == 'units': self.units = data
+        elif type == 'slots': self.slots = data
+        elif type == 'info': self.info = data
+        else: return # Ignore other message types
+
+        self.last_message = time.time()
+        self.version += 1
+
+
+    def close(self): self.conn.close(stop = True)
+
+
+
+class MonitorRequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+    '''Serves the Monitor's state as JSON:
+
+      /                The fleet totals
+      /clients         A summary of each client
+      /clients/<name>  The full state of one client
+    '''
+
+    def do_GET(self):
+        monitor = self.server.monitor
+        path = urllib.unquote(self.path.split('?')[0]).rstrip('/')
+
+        if path == '': data = monitor.get_totals_json()
+        elif path == '/clients': data = monitor.get_clients_json()
+        elif path.startswith('/clients/'):
+            data = monitor.get_client_json(path[9:])
+        else: data = None
+
+        if data is None:
+            self.send_error(404)
+            return
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+    def log_message(self, format, *args):
+        if debug: BaseHTTPServer.BaseHTTPRequestHandler.log_message(
+            self, format, *args)
+
+
+
+class Monitor:
+    '''Keeps connections to many clients without a GUI and serves their
+    state over HTTP.
+
+    Networking and message decoding run on the NetworkThread as in
+    FAHControl, this thread only stores the decoded state.
+    '''
+
+    def __init__(self, address = '127.0.0.1', port = 36331,
+                 max_connecting = 256):
+        self.address = address
+        self.port = port
+        self.clients = {} # name -> MonitoredClient
+        self.lock = threading.Lock()
+        self.activity = threading.Event()
+        self.network = NetworkThread(on_activity = self.activity.set,
+                                     retry_delay = 1)
+        self.network.scheduler.max_connecting = max_connecting
+        self.server = None
+        self.running = False
+
+
+    def add_client(self, name, address, port, password, tags = ''):
+        client = MonitoredClient(self.network, name, address, port, password,
+                                 tags)
+        with self.lock: self.clients[name] = client
+        self.network.add(client.conn, client)
+
+
+    def load_clients(self, db):
+        for row in db.select('clients', orderby = 'name'):
+            self.add_client(row['name'], row['address'], int(row['port']),
+                            row['password'], row['tags'])
+
+
+    def process_messages(self):
+        while True:
+            messages, more = self.network.get_messages(1000)
+
+            with self.lock:
+                for client, version, type, data in messages:
+                    client.process_message(type, data)
+
+            if not more: break
+
+
+    def get_totals_json(self):
+        totals = {'clients': 0, 'ppd': 0, 'status': {}, 'slots': {}}
+
+        with self.lock:
+            for client in self.clients.values():
+                totals['clients'] += 1
+                totals['ppd'] += client.ppd
+
+                status = totals['status']
+                status[client.get_status()] = \
+                    status.get(client.get_status(), 0) + 1
+
+                for name, count in client.get_slot_counts().items():
+                    totals['slots'][name] = totals['slots'].get(name, 0) + count
+
+            conns = [client.conn for client in self.clients.values()]
+
+        # Frames not decoded because they repeated the previous one
+        counts = sum_frame_counts(conns)
+        totals['frames'] = dict([
+                (type, {'repeated': repeated, 'decoded': decoded})
+                for type, (repeated, decoded) in counts.items()])
+
+        return json.dumps(totals)
+
+
+    def get_clients_json(self):
+        with self.lock:
+            names = sorted(self.clients.keys())
+            return '[' + ','.join([self.clients[name].get_json()
+                                   for name in names]) + ']'
+
+
+    def get_client_json(self, name):
+        with self.lock:
+            client = self.clients.get(name)
+            if client is not None: return client.get_json(True)
+
+
+    def start_server(self):
+        self.server = BaseHTTPServer.HTTPServer((self.address, self.port),
+                                                MonitorRequestHandler)
+        self.server.monitor = self
+
+        thread = threading.Thread(target = self.server.serve_forever,
+                                  name = 'FAHMonitor http')
+        thread.setDaemon(True)
+        thread.start()
+
+
+    def run(self):
+        self.running = True
+        self.start_server()
+        self.network.start()
+
+        while self.running:
+            self.activity.wait(1)
+            self.activity.clear()
+
+            try:
+                self.process_messages()
+            except: traceback.print_exc()
+
+
+    def stop(self):
+        self.running = False
+        self.activity.set()
+        if self.server is not None: self.server.shutdown()
+        self.network.stop()
+        for client in self.clients.values(): client.close()
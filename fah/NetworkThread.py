@@ -0,0 +1,336 @@
+################################################################################
+#                                                                              #
+#                    Folding@Home Client Control (FAHControl)                  #
+#                   Copyright (C) 2016-2020 foldingathome.org                  #
+#                  Copyright (C) 2010-2016 Stanford University                 #
+#                                                                              #
+#      This program is free software: you can redistribute it and/or modify    #
+#      it under the terms of the GNU General Public License as published by    #
+#       the Free Software Foundation, either version 3 of the License, or      #
+#                      (at your option) any later version.                     #
+#                                                                              #
+#        This program is distributed in the hope that it will be useful,       #
+#         but WITHOUT ANY WARRANTY; without even the implied warranty of       #
+#         MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the        #
+#                  GNU General Public License for more details.                #
+#                                                                              #
+#       You should have received a copy of the GNU General Public License      #
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.    #
+#                                                                              #
+################################################################################
+
+import time
+import threading
+import traceback
+import collections
+
+from fah.Poller import Poller
+from fah.ConnectScheduler import ConnectScheduler
+from fah.Resolver import Resolver
+from fah.TimerQueue import TimerQueue
+
+debug = False
+
+# Each of these messages replaces the previous one of the same type
+snapshot_types = ('heartbeat', 'ppd', 'units', 'slots', 'options', 'info')
+
+
+def coalesce_messages(messages):
+    '''Reduces a batch of (version, type, data) messages from one client.
+
+    Only the last message of each snapshot type is kept.  Log updates are
+    joined into one, starting from the last log-restart if there is one.
+    '''
+    last = {}
+    restart = -1
+    for i in range(len(messages)):
+        type = messages[i][1]
+        if type in snapshot_types: last[type] = i
+        elif type == 'log-restart': restart = i
+
+    result = []
+    log = []
+    log_type = 'log-update'
+    log_version = 1
+
+    for i in range(len(messages)):
+        version, type, data = messages[i]
+
+        if type in snapshot_types:
+            if last[type] == i: result.append(messages[i])
+
+        elif type in ('log-restart', 'log-update'):
+            if i < restart: continue # Replaced by the restart
+            if type == 'log-restart': log_type = type
+            log_version = version
+            log.append(data)
+
+        else: result.append(messages[i])
+
+    if log: result.append((log_version, log_type, ''.join(log)))
+
+    return result
+
+
+class MessageQueue:
+    '''A bounded queue of (key, version, type, msg) messages.
+
+    A message whose type is in coalesce replaces any message of the same key
+    and type which is still waiting, so a slow consumer only sees the newest.
+    put() blocks while the queue is full.
+    '''
+
+    def __init__(self, maxlen = 10000, coalesce = snapshot_types,
+                 on_full = None):
+        self.maxlen = maxlen
+        self.coalesce = set(coalesce)
+        self.on_full = on_full
+        self.cond = threading.Condition()
+        self.items = collections.deque()
+        self.pending = {} # (key, type) -> waiting entry
+        self.closed = False
+
+
+    def __len__(self): return len(self.items)
+
+
+    def put(self, key, version, type, msg):
+        with self.cond:
+            if type in self.coalesce:
+                entry = self.pending.get((key, type))
+                if entry is not None:
+                    entry[1] = version
+                    entry[3] = msg
+                    return
+
+            while self.maxlen <= len(self.items) and not self.closed:
+                if self.on_full is not None: self.on_full()
+                self.cond.wait(1)
+
+            entry = [key, version, type, msg]
+            self.items.append(entry)
+            if type in self.coalesce: self.pending[(key, type)] = entry
+
+
+    def get(self, limit = None):
+        '''Returns a list of up to limit messages and whether more remain.'''
+        messages = []
+
+        with self.cond:
+            while self.items and (limit is None or len(messages) < limit):
+                entry = self.items.popleft()
+                key, version, type, msg = entry
+
+                if self.pending.get((key, type)) is entry:
+                    del self.pending[(key, type)]
+
+                messages.append((key, version, type, msg))
+
+            self.cond.notify_all()
+
+            return messages, len(self.items) != 0
+
+
+    def close(self):
+        with self.cond:
+            self.closed = True
+            self.cond.notify_all()
+
+
+
+class NetworkThread(threading.Thread):
+    '''Runs socket I/O, PyON framing and decoding for many Connections.
+
+    Decoded messages are delivered through queue, tagged with the key passed
+    to add().  on_activity is called from this thread when messages arrive or
+    a connection's status changes.  It is not called again until the consumer
+    has called get_messages().
+
+    A connection is updated when its socket has events, when another thread
+    wakes it and when its deadline passes, for a reconnect or timeout.  A
+    connection waiting for a name lookup or connect slot is retried every
+    retry_delay seconds.  Otherwise the thread sleeps.
+    '''
+
+    def __init__(self, on_activity = None, retry_delay = 0.25,
+                 maxlen = 10000):
+        threading.Thread.__init__(self, name = 'FAHControl network')
+        self.setDaemon(True)
+
+        self.on_activity = on_activity
+        self.retry_delay = retry_delay
+        self.timers = TimerQueue() # Only used by this thread
+        self.conn_timers = {} # Connection -> Timer
+        self.due = [] # Connections whose timers fired
+        self.poller = Poller(threaded = True)
+        self.scheduler = ConnectScheduler()
+        self.resolver = Resolver(on_resolved = self.poller.wakeup)
+        self.queue = MessageQueue(maxlen, on_full = self.notify)
+        self.lock = threading.Lock()
+        self.conns = {} # Connection -> key
+        self.notified = False
+        self.running = False
+
+
+    def add(self, conn, key):
+        with self.lock: self.conns[conn] = key
+        self.poller.wakeup(conn)
+
+
+    def remove(self, conn):
+        with self.lock: self.conns.pop(conn, None)
+        self.scheduler.remove(conn)
+        self.poller.wakeup(conn) # Drop its timer
+
+
+    def notify(self):
+        with self.lock:
+            if self.notified: return
+            self.notified = True
+
+        if self.on_activity is not None: self.on_activity()
+
+
+    def get_messages(self, limit = None):
+        with self.lock: self.notified = False
+        return self.queue.get(limit)
+
+
+    def update(self, conn, key):
+        status = conn.get_status()
+
+        with conn.lock:
+            conn.update()
+            messages = conn.messages
+            conn.messages = []
+
+        # Don't hold the connection lock while the queue may block
+        for version, type, msg in messages:
+            self.queue.put(key, version, type, msg)
+
+        if messages or status != conn.get_status(): self.notify()
+
+
+    def schedule(self, conn):
+        '''Sets the timer for the connection's next deadline.'''
+        deadline = conn.get_deadline()
+        if deadline is None: return
+
+        now = time.time()
+        if deadline <= now: deadline = now + self.retry_delay
+
+        # A timer which fires early reschedules, so deadlines which move
+        # later, such as on every message, don't touch the heap
+        timer = self.conn_timers.get(conn)
+        if timer is not None and timer.is_pending():
+            if timer.deadline <= deadline: return
+            timer.cancel()
+
+        self.conn_timers[conn] = \
+            self.timers.add_at(deadline, self.due.append, conn)
+
+
+    def run(self):
+        self.running = True
+
+        while self.running:
+            try:
+                ready = set(self.poller.poll(self.timers.get_timeout()))
+                self.timers.run()
+                ready.update(self.due)
+                del self.due[:]
+
+                for conn in ready:
+                    # Checked right before the update, conn may have been
+                    # removed by another thread since the poll
+                    with self.lock: key = self.conns.get(conn)
+
+                    if key is None: # Removed
+                        timer = self.conn_timers.pop(conn, None)
+                        if timer is not None: timer.cancel()
+
+                    elif self.running:
+                        self.update(conn, key)
+                        self.schedule(conn)
+
+            except:
+                traceback.print_exc()
+                time.sleep(self.retry_delay) # Don't spin on persistent errors
+
+
+    def stop(self, timeout = 5):
+        self.running = False
+        self.queue.close()
+        self.resolver.stop()
+        self.poller.wakeup()
+        if self.is_alive(): self.join(timeout)
+
+
+
+if __name__ == '__main__':
+    # Stress test: 200 clients streaming to a simulated GUI main loop which
+    # should keep ticking every 10ms while the network thread does the work
+    import socket
+    import sys
+
+    from fah.Connection import Connection
+
+    count = int(sys.argv[1]) if 1 < len(sys.argv) else 200
+    seconds = 10
+
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    listener.bind(('127.0.0.1', 0))
+    listener.listen(count)
+    port = listener.getsockname()[1]
+
+    unit = '{"id": "%02d", "state": "RUNNING", "percentdone": "%d.00%%", ' \
+        '"project": 1234, "run": 0, "clone": 0, "gen": 0, "slot": "00"}'
+    log = '"%s"' % ('12:00:00:WU00:FS00:0xa7:Completed 5 out of 100 steps'
+                    ' (5%)\\n' * 20)
+
+    def serve():
+        peers = []
+        while len(peers) < count:
+            peers.append(listener.accept()[0])
+
+        i = 0
+        while True:
+            units = '[%s]' % ', '.join([unit % (j, i % 100) for j in range(10)])
+            frames = '\nPyON 1 units\n%s\n---\n' % units
+            frames += '\nPyON 1 log-update\n%s\n---\n' % log
+            frames += '\nPyON 1 heartbeat\n%d\n---\n' % i
+            for peer in peers: peer.sendall(frames)
+            i += 1
+            time.sleep(0.05)
+
+    server = threading.Thread(target = serve)
+    server.setDaemon(True)
+    server.start()
+
+    network = NetworkThread()
+    for i in range(count):
+        conn = Connection('127.0.0.1', port, poller = network.poller,
+                          scheduler = network.scheduler,
+                          resolver = network.resolver)
+        network.add(conn, i)
+    network.start()
+
+    received = 0
+    worst = 0
+    ticks = 0
+    start = last = time.time()
+    while time.time() < start + seconds:
+        time.sleep(0.01)
+        now = time.time()
+        worst = max(worst, now - last - 0.01)
+        last = now
+        ticks += 1
+
+        messages, more = network.get_messages(1000)
+        received += len(messages)
+
+    network.stop()
+
+    print('%d clients, %d messages in %ds, %d ticks, worst tick latency '
+          '%.1fms' % (count, received, seconds, ticks, worst * 1000))
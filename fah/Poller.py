@@ -0,0 +1,235 @@
+################################################################################
+#                                                                              #
+#                    Folding@Home Client Control (FAHControl)                  #
+#                   Copyright (C) 2016-2020 foldingathome.org                  #
+#                  Copyright (C) 2010-2016 Stanford University                 #
+#                                                                              #
+#      This program is free software: you can redistribute it and/or modify    #
+#      it under the terms of the GNU General Public License as published by    #
+#       the Free Software Foundation, either version 3 of the License, or      #
+#                      (at your option) any later version.                     #
+#                                                                              #
+#        This program is distributed in the hope that it will be useful,       #
+#         but WITHOUT ANY WARRANTY; without even the implied warranty of       #
+#         MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the        #
+#                  GNU General Public License for more details.                #
+#                                                                              #
+#       You should have received a copy of the GNU General Public License      #
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.    #
+#                                                                              #
+################################################################################
+
+import select
+import socket
+import errno
+import sys
+import time
+import threading
+
+debug = False
+
+# Event bits, these match the poll()/epoll() values
+POLL_READ = 1
+POLL_WRITE = 4
+POLL_ERROR = 8 | 16 # ERR | HUP
+
+
+def make_socket_pair():
+    if hasattr(socket, 'socketpair'): return socket.socketpair()
+
+    # Windows has no socketpair(), connect over loopback instead
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        listener.bind(('127.0.0.1', 0))
+        listener.listen(1)
+        a = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        a.connect(listener.getsockname())
+        b = listener.accept()[0]
+    finally:
+        listener.close()
+
+    return a, b
+
+
+class Waker:
+    '''Interrupts a Poller waiting in another thread.'''
+
+    def __init__(self):
+        self.socket, self.writer = make_socket_pair()
+        self.socket.setblocking(0)
+        self.writer.setblocking(0)
+        self.events = 0
+
+
+    def get_poll_mask(self): return POLL_READ
+
+
+    def wakeup(self):
+        try:
+            self.writer.send('x')
+        except socket.error: pass # Already awake
+
+
+    def clear(self):
+        self.events = 0
+        try:
+            while self.socket.recv(1024): continue
+        except socket.error: pass
+
+
+class Poller:
+    '''Waits on the sockets of many Connections at once.
+
+    Uses epoll() where available, then poll() and finally select().  Readiness
+    is stored in Connection.events, which Connection.update() consumes.
+    '''
+
+    def __init__(self, threaded = False):
+        self.conns = {} # fd -> Connection
+        self.fds = {} # Connection -> fd
+        self.masks = {} # fd -> registered event mask
+        self.woken = set() # Connections to return from the next poll()
+        self.lock = threading.RLock()
+        self.poll_thread = None
+
+        if hasattr(select, 'epoll'): self.impl = select.epoll()
+        elif hasattr(select, 'poll') and sys.platform != 'darwin':
+            self.impl = select.poll()
+        else: self.impl = None # Use select()
+
+        # When polling in its own thread, changes made by other threads must
+        # interrupt the wait
+        if threaded:
+            self.waker = Waker()
+            self.register(self.waker)
+        else: self.waker = None
+
+
+    def fileno(self):
+        # Only epoll has a file descriptor which can be watched by the GUI
+        if hasattr(self.impl, 'fileno'): return self.impl.fileno()
+
+
+    def register(self, conn):
+        fd = conn.socket.fileno()
+        mask = conn.get_poll_mask()
+
+        if debug: print('Poller.register(%d, %d)' % (fd, mask))
+
+        with self.lock:
+            if self.fds.get(conn, fd) != fd: self.unregister(conn) # Reconnected
+
+            # A closed socket's fd may be reused before it was unregistered
+            old = self.conns.get(fd)
+            if old is not None and old is not conn: self.fds.pop(old, None)
+
+            self.conns[fd] = conn
+            self.fds[conn] = fd
+            self.masks[fd] = mask
+            if self.impl is not None: self.impl.register(fd, mask)
+
+        self.wakeup()
+
+
+    def update(self, conn):
+        if conn.socket is None: return
+
+        fd = conn.socket.fileno()
+        mask = conn.get_poll_mask()
+
+        with self.lock:
+            if self.conns.get(fd) is not conn or self.masks[fd] == mask:
+                return
+
+            self.masks[fd] = mask
+            if self.impl is not None: self.impl.modify(fd, mask)
+
+        self.wakeup()
+
+
+    def unregister(self, conn):
+        with self.lock:
+            fd = self.fds.pop(conn, None)
+            if fd is None or self.conns.get(fd) is not conn: return
+
+            del self.conns[fd]
+            del self.masks[fd]
+            if self.impl is not None:
+                try:
+                    self.impl.unregister(fd)
+                except: pass # Socket may already be closed
+
+
+    def wakeup(self, conn = None):
+        '''Interrupts a poll() in another thread.  conn, if given, is
+        returned by the next poll() even without events.'''
+        # Changes made by the polling thread itself are seen on the next poll
+        if self.waker is not None and \
+                threading.current_thread() is not self.poll_thread:
+            if conn is not None:
+                with self.lock: self.woken.add(conn)
+            self.waker.wakeup()
+
+
+    def poll_select(self, timeout):
+        rlist = []
+        wlist = []
+        with self.lock:
+            for fd, mask in self.masks.items():
+                if mask & POLL_READ: rlist.append(fd)
+                if mask & POLL_WRITE: wlist.append(fd)
+            xlist = self.masks.keys()
+
+        try:
+            rlist, wlist, xlist = select.select(rlist, wlist, xlist, timeout)
+        except (select.error, socket.error) as e:
+            # A socket closed by another thread, try again next time
+            if e.args[0] in (errno.EBADF, errno.EINTR, 10038): return []
+            raise
+
+        events = {}
+        for fd in rlist: events[fd] = events.get(fd, 0) | POLL_READ
+        for fd in wlist: events[fd] = events.get(fd, 0) | POLL_WRITE
+        for fd in xlist: events[fd] = events.get(fd, 0) | POLL_ERROR
+
+        return events.items()
+
+
+    def poll(self, timeout = 0):
+        '''Returns the list of Connections with pending events.  timeout is
+        in seconds, None waits forever.'''
+
+        self.poll_thread = threading.current_thread()
+
+        if not self.conns:
+            if timeout: time.sleep(timeout)
+            return []
+
+        try:
+            if self.impl is None: events = self.poll_select(timeout)
+            elif hasattr(self.impl, 'fileno'):
+                if timeout is None: timeout = -1
+                events = self.impl.poll(timeout)
+            else:
+                if timeout is not None: timeout = int(timeout * 1000)
+                events = self.impl.poll(timeout)
+
+        except (IOError, select.error) as e:
+            if e.args[0] == errno.EINTR: return []
+            raise
+
+        ready = []
+        with self.lock:
+            ready.extend(self.woken)
+            self.woken.clear()
+
+            for fd, mask in events:
+                conn = self.conns.get(fd)
+                if conn is None: continue
+
+                if conn is self.waker: conn.clear()
+                else:
+                    conn.events |= mask
+                    ready.append(conn)
+
+        return ready
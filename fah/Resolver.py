@@ -0,0 +1,121 @@
+################################################################################
+#                                                                              #
+#                    Folding@Home Client Control (FAHControl)                  #
+#                   Copyright (C) 2016-2020 foldingathome.org                  #
+#                  Copyright (C) 2010-2016 Stanford University                 #
+#                                                                              #
+#      This program is free software: you can redistribute it and/or modify    #
+#      it under the terms of the GNU General Public License as published by    #
+#       the Free Software Foundation, either version 3 of the License, or      #
+#                      (at your option) any later version.                     #
+#                                                                              #
+#        This program is distributed in the hope that it will be useful,       #
+#         but WITHOUT ANY WARRANTY; without even the implied warranty of       #
+#         MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the        #
+#                  GNU General Public License for more details.                #
+#                                                                              #
+#       You should have received a copy of the GNU General Public License      #
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.    #
+#                                                                              #
+################################################################################
+
+import time
+import socket
+import threading
+import traceback
+import Queue
+
+debug = False
+
+
+def get_address_info(host, port, flags = 0):
+    '''Returns the (family, sockaddr) to connect to host:port with.'''
+    infos = socket.getaddrinfo(host, port, socket.AF_UNSPEC,
+                               socket.SOCK_STREAM, 0, flags)
+    if not infos: raise socket.gaierror('No addresses for %s' % host)
+
+    # Prefer IPv4, which was all that was used before, when there is one
+    infos.sort(key = lambda info: info[0] != socket.AF_INET)
+    family, socktype, proto, canonname, sockaddr = infos[0]
+    return family, sockaddr
+
+
+class Resolver:
+    '''Looks up host names on worker threads and caches the results.
+
+    getaddrinfo() does not return TTLs so addresses are cached for ttl
+    seconds and failures for negative_ttl seconds.  An expired address is
+    still used while it is looked up again.  on_resolved is called from a
+    worker thread after each lookup.
+    '''
+
+    def __init__(self, workers = 2, ttl = 300, negative_ttl = 30,
+                 on_resolved = None):
+        self.workers = workers
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.on_resolved = on_resolved
+        self.cache = {} # (host, port) -> (expires, result or exception)
+        self.pending = set()
+        self.queue = Queue.Queue()
+        self.threads = []
+        self.lock = threading.Lock()
+
+
+    def lookup(self, host, port):
+        '''Returns (family, sockaddr) or None if the lookup has not finished.
+        Raises socket.error if host could not be resolved.'''
+        key = (host, port)
+
+        with self.lock:
+            entry = self.cache.get(key)
+            if entry is not None and time.time() < entry[0]:
+                if isinstance(entry[1], Exception): raise entry[1]
+                return entry[1]
+
+        # IP addresses don't need a lookup
+        try:
+            return get_address_info(host, port, socket.AI_NUMERICHOST)
+        except socket.error: pass
+
+        with self.lock:
+            if key not in self.pending:
+                self.pending.add(key)
+                self.queue.put(key)
+
+                if len(self.threads) < min(self.workers, len(self.pending)):
+                    thread = threading.Thread(target = self.run,
+                                              name = 'FAHControl resolver')
+                    thread.setDaemon(True)
+                    thread.start()
+                    self.threads.append(thread)
+
+        if entry is not None and not isinstance(entry[1], Exception):
+            return entry[1]
+
+
+    def run(self):
+        while True:
+            key = self.queue.get()
+            if key is None: break
+
+            try:
+                result = get_address_info(*key)
+                expires = time.time() + self.ttl
+            except socket.error as e:
+                result = e
+                expires = time.time() + self.negative_ttl
+
+            if debug: print('Resolved %s:%d: %s' % (key + (result,)))
+
+            with self.lock:
+                self.cache[key] = (expires, result)
+                self.pending.discard(key)
+
+            try:
+                if self.on_resolved is not None: self.on_resolved()
+            except: traceback.print_exc()
+
+
+    def stop(self):
+        for thread in self.threads: self.queue.put(None)
@@ -24,10 +24,14 @@ import gobject
 import copy
 
 from fah.util import parse_bool
-from fah.util import status_to_color
+from fah.util import get_span_markup
+from fah import get_state_style
 
 
-class SlotConfig:
+class SlotConfig(object):
+    __slots__ = ('id', 'status', 'description', 'reason', 'idle', 'options',
+                 'type', 'color', 'row')
+
     def __init__(
         self, id = -1, status = None, description = None, reason = None,
         idle = False, options = {}, **kw):
@@ -38,10 +42,21 @@ class SlotConfig:
         self.reason = reason
         self.idle = idle
         self.options = options
+        self.color = None
+        self.row = None # The slot status list row
 
-        if status is not None: self.status = status.title()
         if description is None: self.description = 'cpu'
 
+        if status is not None:
+            state, self.status, self.color, markup = get_state_style(status)
+            if self.status == 'Paused' and reason:
+                markup = get_span_markup(self.status + ':' + reason,
+                                         self.color)
+
+            id = '%02d' % self.id
+            self.row = [id, markup, self.color,
+                        self.description.replace('"', '')]
+
         # Type
         if self.description.startswith('cpu'): self.type = 'cpu'
         elif self.description.startswith('gpu'): self.type = 'gpu'
@@ -0,0 +1,156 @@
+################################################################################
+#                                                                              #
+#                    Folding@Home Client Control (FAHControl)                  #
+#                   Copyright (C) 2016-2020 foldingathome.org                  #
+#                  Copyright (C) 2010-2016 Stanford University                 #
+#                                                                              #
+#      This program is free software: you can redistribute it and/or modify    #
+#      it under the terms of the GNU General Public License as published by    #
+#       the Free Software Foundation, either version 3 of the License, or      #
+#                      (at your option) any later version.                     #
+#                                                                              #
+#        This program is distributed in the hope that it will be useful,       #
+#         but WITHOUT ANY WARRANTY; without even the implied warranty of       #
+#         MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the        #
+#                  GNU General Public License for more details.                #
+#                                                                              #
+#       You should have received a copy of the GNU General Public License      #
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.    #
+#                                                                              #
+################################################################################
+
+import math
+import time
+import heapq
+import itertools
+import traceback
+
+
+class Timer(object):
+    '''A callback waiting in a TimerQueue.  deadline is None once a one-shot
+    timer has fired.'''
+
+    __slots__ = ('deadline', 'period', 'callback', 'args', 'cancelled')
+
+    def __init__(self, deadline, period, callback, args):
+        self.deadline = deadline
+        self.period = period
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+
+    def cancel(self): self.cancelled = True
+    def is_pending(self):
+        return self.deadline is not None and not self.cancelled
+
+
+
+class TimerQueue:
+    '''Runs callbacks when their deadlines pass.
+
+    The loop which owns the queue waits up to get_timeout() for other events
+    and then calls run(), so it only wakes when something is due.  Cancelled
+    timers stay in the heap until they reach the top.  Not thread safe,
+    other threads must hand their work to the owning loop.
+    '''
+
+    def __init__(self):
+        self.heap = [] # (deadline, sequence, Timer)
+        self.sequence = itertools.count()
+
+
+    def push(self, timer):
+        heapq.heappush(self.heap, (timer.deadline, next(self.sequence), timer))
+        return timer
+
+
+    def add_at(self, deadline, callback, *args):
+        '''Runs callback(*args) once at deadline.'''
+        return self.push(Timer(deadline, None, callback, args))
+
+
+    def add(self, delay, callback, *args):
+        '''Runs callback(*args) once after delay seconds.'''
+        return self.add_at(time.time() + delay, callback, *args)
+
+
+    def add_repeating(self, period, callback, *args):
+        '''Runs callback(*args) every period seconds until cancelled.  It
+        runs at multiples of period, so timers with the same period share
+        wakeups.'''
+        deadline = math.ceil(time.time() / period) * period
+        return self.push(Timer(deadline, period, callback, args))
+
+
+    def get_deadline(self):
+        '''Returns the deadline of the next pending timer or None.'''
+        while self.heap and self.heap[0][2].cancelled: heapq.heappop(self.heap)
+        if self.heap: return self.heap[0][0]
+
+
+    def get_timeout(self, now = None):
+        '''Returns the seconds until the next timer is due or None.'''
+        deadline = self.get_deadline()
+        if deadline is None: return None
+        if now is None: now = time.time()
+        return max(0, deadline - now)
+
+
+    def run(self, now = None):
+        '''Runs the callbacks which are due.  Returns how many ran.'''
+        if now is None: now = time.time()
+        count = 0
+
+        while self.heap and self.heap[0][0] <= now:
+            timer = heapq.heappop(self.heap)[2]
+            if timer.cancelled: continue
+
+            if timer.period is None: timer.deadline = None
+            else:
+                # Skip the runs missed while the process was stopped
+                timer.deadline += timer.period
+                if timer.deadline <= now: timer.deadline = now + timer.period
+
+            try:
+                timer.callback(*timer.args)
+            except: traceback.print_exc()
+
+            if timer.is_pending(): self.push(timer)
+            count += 1
+
+        return count
+
+
+
+if __name__ == '__main__':
+    queue = TimerQueue()
+    fired = []
+
+    now = time.time()
+    queue.add_at(now + 2, fired.append, 'b')
+    queue.add_at(now + 1, fired.append, 'a')
+    queue.add_at(now + 1, fired.append, 'a2')
+    queue.add_at(now + 3, fired.append, 'c').cancel()
+
+    assert queue.get_timeout(now) == 1
+    assert queue.run(now) == 0
+    assert queue.run(now + 2) == 3 and fired == ['a', 'a2', 'b']
+    assert queue.get_deadline() is None
+
+    repeating = queue.add_repeating(10, fired.append, 'r')
+    first = repeating.deadline
+    assert queue.get_deadline() == first and first % 10 == 0
+    assert queue.run(first) == 1 and repeating.deadline == first + 10
+    assert queue.run(first + 35) == 1 and repeating.deadline == first + 45
+    repeating.cancel()
+    assert queue.get_deadline() is None and queue.get_timeout() is None
+
+    # Heap order over many timers
+    fired = []
+    for i in range(10000):
+        queue.add_at(now + (i * 7919) % 10000, fired.append, i)
+    queue.run(now + 10000)
+    assert fired == sorted(fired, key = lambda i: (i * 7919) % 10000)
+
+    print('Tests OK')
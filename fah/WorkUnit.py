@@ -0,0 +1,96 @@
+################################################################################
+#                                                                              #
+#                    Folding@Home Client Control (FAHControl)                  #
+#                   Copyright (C) 2016-2020 foldingathome.org                  #
+#                  Copyright (C) 2010-2016 Stanford University                 #
+#                                                                              #
+#      This program is free software: you can redistribute it and/or modify    #
+#      it under the terms of the GNU General Public License as published by    #
+#       the Free Software Foundation, either version 3 of the License, or      #
+#                      (at your option) any later version.                     #
+#                                                                              #
+#        This program is distributed in the hope that it will be useful,       #
+#         but WITHOUT ANY WARRANTY; without even the implied warranty of       #
+#         MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the        #
+#                  GNU General Public License for more details.                #
+#                                                                              #
+#       You should have received a copy of the GNU General Public License      #
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.    #
+#                                                                              #
+################################################################################
+
+from fah.util import status_to_color
+from fah.util import get_span_markup
+from fah.FleetStats import parse_eta
+
+# State as sent -> (upper case state, title, color, markup)
+state_styles = {}
+
+
+def get_state_style(state):
+    '''Returns the interned upper case state and its title, color and
+    markup, which are only worked out once per state.'''
+    style = state_styles.get(state)
+
+    if style is None:
+        upper = intern(str(state).upper())
+        title = upper.title()
+        color = status_to_color(title)
+        style = state_styles[state] = \
+            (upper, title, color, get_span_markup(title, color))
+
+    return style
+
+
+def parse_float(text, default = 0.0):
+    try:
+        return float(text)
+    except (TypeError, ValueError): return default
+
+
+class WorkUnit(object):
+    '''One entry of a units message with its fields parsed once.
+
+    values is the decoded entry, the other fields are what the queue list
+    and the fleet summary need.  row is the queue list row.
+    '''
+
+    __slots__ = ('values', 'id', 'unit', 'slot', 'state', 'title', 'color',
+                 'markup', 'percent', 'eta', 'credit', 'error', 'prcg', 'row')
+
+    def __init__(self, values):
+        self.values = values
+        self.id = values['id']
+        self.unit = values['unit']
+        self.slot = int(values['slot'])
+        self.state, self.title, self.color, self.markup = \
+            get_state_style(values['state'])
+
+        progress = values['percentdone']
+        self.percent = parse_float(progress[:-1])
+        eta = values['eta']
+        self.eta = parse_eta(eta)
+        credit = values['creditestimate']
+        self.credit = parse_float(credit)
+        self.error = values.get('error', 'NO_ERROR') not in ('NO_ERROR', '')
+        self.prcg = (values['project'], values['run'], values['clone'],
+                     values['gen'])
+
+        if eta == '0.00 secs': eta = 'Unknown'
+        if not self.credit: credit = 'Unknown'
+
+        self.row = [self.unit, self.id, self.markup, self.color, progress,
+                    self.percent, eta, credit, '%s (%s, %s, %s)' % self.prcg]
+
+
+    def get_prcg(self): return self.row[8]
+    def is_running(self): return self.state == 'RUNNING'
+    def is_active(self): return self.state in ('RUNNING', 'FINISHING')
+
+
+
+def make_work_units(data):
+    '''Returns the WorkUnits of a units message sorted by queue ID.'''
+    units = map(WorkUnit, data)
+    units.sort(key = lambda unit: unit.id)
+    return units
@@ -21,14 +21,32 @@
 
 # fah
 
+import sys
 import db
 import util
 
 from Version import *
-from Icon import *
-from SlotConfig import *
-from ClientConfig import *
+from Poller import *
+from ConnectScheduler import *
+from Resolver import *
+from TimerQueue import *
 from Connection import *
-from Client import *
-from WidgetMap import *
-from FAHControl import *
+from NetworkThread import *
+from BulkOperation import *
+from FleetStats import *
+from WorkUnit import *
+from Monitor import *
+
+
+# The GUI modules are imported on first use so the headless Monitor and the
+# protocol modules don't load gtk
+sys.modules[__name__] = util.LazyModule(sys.modules[__name__], {
+        'Icon': ['get_icon', 'get_icon_image', 'get_viewer_icon',
+                 'get_viewer_icon_image'],
+        'SlotConfig': ['SlotConfig'],
+        'ClientConfig': ['ClientConfig', 'set_list_row'],
+        'Client': ['Client'],
+        'WidgetMap': ['WidgetMap'],
+        'LogView': ['LogView'],
+        'FAHControl': ['FAHControl', 'load_fahcontrol_db'],
+        })
@@ -21,6 +21,7 @@
 
 from fah.db import Column, Table
 
+import os
 import sqlite3
 
 
@@ -39,15 +40,22 @@ class Database:
                 Column('address', 'Text', 'NOT NULL'),
                 Column('port', 'Integer', 'NOT NULL'),
                 Column('password', 'Text', 'NOT NULL'),
+                Column('tags', 'Text', "NOT NULL DEFAULT ''"),
                 ],
               'PRIMARY KEY (name)'),
         ]
 
 
-    def __init__(self, filename):
+    def __init__(self, filename, read_only = False):
         self.filename = filename
+
+        # Python 2's sqlite3 cannot open read-only, so refuse writes instead
+        if read_only and not os.path.exists(filename):
+            raise Exception('Configuration database "%s" not found' % filename)
+
         self.conn = sqlite3.connect(filename)
         self.conn.row_factory = sqlite3.Row
+        if read_only: self.conn.execute('PRAGMA query_only = ON')
         self.queue = {}
 
 
@@ -59,7 +67,7 @@ class Database:
 
 
     def get_version(self):
-        return 6
+        return 7
 
 
     def get_current_version(self):
@@ -152,6 +160,20 @@ class Database:
         self.commit()
 
 
+    def check_version(self):
+        '''Like validate() but never creates or upgrades the database.'''
+        current = self.get_current_version()
+        if current < self.get_version():
+            raise Exception('Configuration database "%s" version %d is older '
+                            'than supported %d, run FAHControl to upgrade it'
+                            % (self.filename, current, self.get_version()))
+
+        if self.get_version() < current:
+            raise Exception('Configuration database "%s" version %d is newer '
+                            'than is supported %d'
+                            % (self.filename, current, self.get_version()))
+
+
     def validate(self):
         current = self.get_current_version()
         if self.get_version() < current:
@@ -172,5 +194,8 @@ class Database:
                 if current <= 5:
                     self.execute('DROP TABLE IF EXISTS projects')
 
+                if 3 <= current <= 6:
+                    self.get_table('clients').add_column(self, 'tags')
+
             self.set_current_version(self.get_version())
             self.commit()
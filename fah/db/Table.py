@@ -53,6 +53,17 @@ class Table:
         db.execute(sql).close()
 
 
+    def add_column(self, db, name):
+        for col in self.cols:
+            if col.name == name:
+                sql = 'ALTER TABLE "%s" ADD COLUMN %s' % (
+                    self.name, col.get_sql())
+                db.execute(sql).close()
+                return
+
+        raise Exception('Table %s does not have column %s' % (self.name, name))
+
+
     def insert(self, db, **kwargs):
         cols = filter(lambda col: col.name in kwargs, self.cols)
 
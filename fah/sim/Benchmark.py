@@ -0,0 +1,218 @@
+################################################################################
+#                                                                              #
+#                    Folding@Home Client Control (FAHControl)                  #
+#                   Copyright (C) 2016-2020 foldingathome.org                  #
+#                  Copyright (C) 2010-2016 Stanford University                 #
+#                                                                              #
+#      This program is free software: you can redistribute it and/or modify    #
+#      it under the terms of the GNU General Public License as published by    #
+#       the Free Software Foundation, either version 3 of the License, or      #
+#                      (at your option) any later version.                     #
+#                                                                              #
+#        This program is distributed in the hope that it will be useful,       #
+#         but WITHOUT ANY WARRANTY; without even the implied warranty of       #
+#         MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the        #
+#                  GNU General Public License for more details.                #
+#                                                                              #
+#       You should have received a copy of the GNU General Public License      #
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.    #
+#                                                                              #
+################################################################################
+
+import os
+import sys
+import time
+import subprocess
+from optparse import OptionParser
+
+from fah.Connection import Connection, sum_frame_counts, format_frame_counts
+from fah.NetworkThread import NetworkThread
+from fah.BulkOperation import BulkOperation
+
+# The same subscriptions as a selected client in FAHControl, with a faster
+# heartbeat to sample latency
+active_cmds = [
+    'updates clear',
+    'updates add 0 1 $heartbeat',
+    'updates add 1 5 $ppd',
+    'updates add 2 1 $(options *)',
+    'updates add 3 4 $queue-info',
+    'updates add 4 1 $slot-info',
+    'info',
+    'log-updates start',
+    'configured',
+    ]
+
+# The subscriptions of an unselected client, as most of a fleet is
+idle_cmds = [
+    'updates clear',
+    'updates add 0 4 $heartbeat',
+    'updates add 1 5 $ppd',
+    ]
+
+
+def get_cpu_time():
+    times = os.times()
+    return times[0] + times[1]
+
+
+def percentile(values, p):
+    if not values: return 0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+class BulkClient:
+    '''Just enough of a Client for a BulkOperation.'''
+
+    def __init__(self, name, conn):
+        self.name = name
+        self.conn = conn
+        self.expected = {}
+
+
+    def __str__(self): return self.name
+    def is_online(self): return self.conn.get_status() == 'Online'
+    def get_options_cmd(self): return 'options power'
+
+
+    def expect(self, type, callback):
+        self.expected.setdefault(type, []).append(callback)
+
+
+    def process_message(self, type, data):
+        callbacks = self.expected.get(type, [])
+        self.expected[type] = [cb for cb in callbacks if not cb(data)]
+
+
+
+class Benchmark:
+    '''Runs FAHControl's protocol stack against a simulator subprocess.'''
+
+    def __init__(self, clients = 10, port = 36400, duration = 10,
+                 sim_args = [], bulk = None):
+        self.clients = clients
+        self.port = port
+        self.duration = duration
+        self.sim_args = sim_args
+        self.bulk = bulk # (action, value) to time instead of updates
+
+
+    def start_simulator(self):
+        cmd = [sys.executable, '-m', 'fah.sim.Simulator',
+               '--clients', str(self.clients), '--port', str(self.port)]
+        cmd += self.sim_args
+
+        sim = subprocess.Popen(cmd, stdout = subprocess.PIPE)
+        sim.stdout.readline() # Wait until it is listening
+        return sim
+
+
+    def run_bulk(self, network, clients):
+        action, value = self.bulk
+
+        # Wait for the connections
+        end = time.time() + self.duration
+        while time.time() < end:
+            if all([client.is_online() for client in clients]): break
+            time.sleep(0.01)
+            network.get_messages()
+
+        op = BulkOperation(clients, action, value, self.duration)
+        op.start()
+
+        while not op.is_done():
+            time.sleep(0.001)
+            messages, more = network.get_messages()
+            for client, version, type, data in messages:
+                client.process_message(type, data)
+            op.update()
+
+        print(op.get_status())
+        for name, reason in op.get_failures(): print('  %s %s' % (name, reason))
+
+
+    def run(self):
+        sim = self.start_simulator()
+
+        try:
+            network = NetworkThread()
+            conns = []
+            clients = []
+            for i in range(self.clients):
+                conn = Connection('127.0.0.1', self.port + i,
+                                  poller = network.poller)
+                if self.bulk is None: conn.set_init_commands(active_cmds)
+                else: conn.set_init_commands(idle_cmds)
+                clients.append(BulkClient('client%d' % i, conn))
+                network.add(conn, clients[-1])
+                conns.append(conn)
+
+            network.start()
+
+            if self.bulk is not None:
+                self.run_bulk(network, clients)
+                network.stop()
+                return
+
+            counts = {}
+            latencies = []
+            start_cpu = get_cpu_time()
+            start = time.time()
+
+            # Simulate the GUI draining messages at 100Hz
+            while time.time() < start + self.duration:
+                time.sleep(0.01)
+                messages, more = network.get_messages()
+                now = time.time()
+
+                for key, version, type, msg in messages:
+                    counts[type] = counts.get(type, 0) + 1
+                    if type == 'heartbeat': latencies.append(now - msg)
+
+            elapsed = time.time() - start
+            cpu = get_cpu_time() - start_cpu
+            network.stop()
+
+        finally:
+            sim.terminate()
+            sim.wait()
+
+        bytes_read = sum([c.bytes_read for c in conns])
+        online = len([c for c in conns if c.bytes_read])
+
+        print('Clients:          %d (%d online)' % (self.clients, online))
+        print('Duration:         %.1fs' % elapsed)
+        print('Messages:         %d (%s)' % (sum(counts.values()), ', '.join(
+            ['%s %d' % item for item in sorted(counts.items())])))
+        print('Bytes parsed:     %.1f KiB/s' % (bytes_read / elapsed / 1024))
+        print('CPU:              %.1f%% total, %.3fms/s per client' % (
+            cpu / elapsed * 100, cpu / elapsed / self.clients * 1000))
+        print('Update latency:   avg %.1fms, p95 %.1fms, max %.1fms' % (
+            sum(latencies) / max(1, len(latencies)) * 1000,
+            percentile(latencies, 0.95) * 1000,
+            max(latencies or [0]) * 1000))
+        print('Repeated frames:  %s' % format_frame_counts(
+                sum_frame_counts(conns)))
+
+
+
+if __name__ == '__main__':
+    parser = OptionParser(usage = 'Usage: %prog [options] [simulator options]')
+    parser.disable_interspersed_args()
+    parser.add_option('--clients', type = 'int', default = 10,
+                      help = 'Number of virtual clients')
+    parser.add_option('--port', type = 'int', default = 36400,
+                      help = 'First simulator port')
+    parser.add_option('--duration', type = 'float', default = 10,
+                      help = 'Seconds to run')
+    parser.add_option('--bulk', metavar = 'ACTION',
+                      help = 'Time a bulk pause, unpause, finish or '
+                      'power=<level> across all clients instead')
+    options, args = parser.parse_args()
+
+    bulk = None
+    if options.bulk: bulk = (options.bulk.split('=') + [None])[:2]
+
+    Benchmark(options.clients, options.port, options.duration, args,
+              bulk).run()
@@ -0,0 +1,151 @@
+################################################################################
+#                                                                              #
+#                    Folding@Home Client Control (FAHControl)                  #
+#                   Copyright (C) 2016-2020 foldingathome.org                  #
+#                  Copyright (C) 2010-2016 Stanford University                 #
+#                                                                              #
+#      This program is free software: you can redistribute it and/or modify    #
+#      it under the terms of the GNU General Public License as published by    #
+#       the Free Software Foundation, either version 3 of the License, or      #
+#                      (at your option) any later version.                     #
+#                                                                              #
+#        This program is distributed in the hope that it will be useful,       #
+#         but WITHOUT ANY WARRANTY; without even the implied warranty of       #
+#         MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the        #
+#                  GNU General Public License for more details.                #
+#                                                                              #
+#       You should have received a copy of the GNU General Public License      #
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.    #
+#                                                                              #
+################################################################################
+
+import os
+import sys
+import time
+import subprocess
+import __builtin__
+from optparse import OptionParser
+
+
+def count_modules():
+    # Python 2 caches failed implicit relative imports as None
+    return len(filter(None, sys.modules.values()))
+
+
+# What each startup path imports
+import_paths = {
+    'gui': 'from fah import FAHControl, load_fahcontrol_db\n'
+           'from fah.util import *',
+    'headless': 'from fah import Monitor\nfrom fah.db import Database',
+    }
+
+
+class ImportTimer:
+    '''Times every module import, like Python 3's -X importtime.
+
+    Records (depth, module, self us, cumulative us) in the order imports
+    finish.  Only imports which load new modules are recorded.
+    '''
+
+    def __init__(self):
+        self.records = []
+        self.stack = [] # Time spent in nested imports, per level
+        self.import_func = __builtin__.__import__
+
+
+    def __call__(self, name, globals = None, locals = None, fromlist = None,
+                 level = -1):
+        before = count_modules()
+        self.stack.append(0)
+        start = time.time()
+
+        try:
+            return self.import_func(name, globals, locals, fromlist, level)
+
+        finally:
+            delta = time.time() - start
+            nested = self.stack.pop()
+            if self.stack: self.stack[-1] += delta
+
+            if before != count_modules():
+                self.records.append((len(self.stack),
+                                     self.get_name(name, globals),
+                                     (delta - nested) * 1e6, delta * 1e6))
+
+
+    def get_name(self, name, globals):
+        # Resolve Python 2 implicit relative imports
+        globals = globals or {}
+        package = globals.get('__name__', '')
+        if '__path__' not in globals: package = package.rpartition('.')[0]
+        if package and sys.modules.get(package + '.' + name) is not None:
+            return package + '.' + name
+        return name
+
+
+    def install(self): __builtin__.__import__ = self
+    def uninstall(self): __builtin__.__import__ = self.import_func
+
+
+    def report(self):
+        print('import time: self [us] | cumulative | imported package')
+        for depth, name, self_us, cumulative in self.records:
+            print('import time: %9d | %10d | %s%s' % (
+                self_us, cumulative, '  ' * depth, name))
+
+
+
+def time_imports(path, tree = False):
+    '''Imports a startup path in this process, which must not have imported
+    fah yet, and prints the results.'''
+    timer = ImportTimer()
+    modules = count_modules()
+
+    timer.install()
+    start = time.time()
+    try:
+        exec import_paths[path] in {}
+        error = None
+    except ImportError as e: error = e
+    finally:
+        delta = time.time() - start
+        timer.uninstall()
+
+    if tree: timer.report()
+
+    gui = [name for name in ('gtk', 'gobject', 'glib', 'pango')
+           if name in sys.modules]
+    print('%-8s %7.1fms %4d modules, GUI toolkit: %s%s' % (
+            path, delta * 1000, count_modules() - modules,
+            ', '.join(gui) or 'none',
+            '' if error is None else ' (failed: %s)' % error))
+
+
+
+if __name__ == '__main__':
+    parser = OptionParser(usage = 'Usage: %prog [options] [gui|headless]...')
+    parser.add_option('--tree', action = 'store_true',
+                      help = 'Show the time of every import')
+    parser.add_option('--runs', type = 'int', default = 5,
+                      help = 'Fresh interpreters to run per path')
+    parser.add_option('--child', action = 'store_true',
+                      help = 'Internal, time one path in this process')
+    options, args = parser.parse_args()
+
+    if options.child: time_imports(args[0], options.tree)
+
+    else:
+        # Run as a script, so fah is not imported before it is timed
+        root = os.path.dirname(os.path.dirname(os.path.dirname(
+                    os.path.abspath(__file__))))
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(
+            [root] + filter(None, [env.get('PYTHONPATH')]))
+
+        for path in args or sorted(import_paths):
+            for i in range(options.runs):
+                cmd = [sys.executable, os.path.abspath(__file__), '--child',
+                       path]
+                if options.tree and not i: cmd.append('--tree')
+                sys.stdout.flush()
+                subprocess.call(cmd, env = env)
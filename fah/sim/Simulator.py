@@ -0,0 +1,356 @@
+################################################################################
+#                                                                              #
+#                    Folding@Home Client Control (FAHControl)                  #
+#                   Copyright (C) 2016-2020 foldingathome.org                  #
+#                  Copyright (C) 2010-2016 Stanford University                 #
+#                                                                              #
+#      This program is free software: you can redistribute it and/or modify    #
+#      it under the terms of the GNU General Public License as published by    #
+#       the Free Software Foundation, either version 3 of the License, or      #
+#                      (at your option) any later version.                     #
+#                                                                              #
+#        This program is distributed in the hope that it will be useful,       #
+#         but WITHOUT ANY WARRANTY; without even the implied warranty of       #
+#         MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the        #
+#                  GNU General Public License for more details.                #
+#                                                                              #
+#       You should have received a copy of the GNU General Public License      #
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.    #
+#                                                                              #
+################################################################################
+
+import sys
+import time
+import json
+import errno
+import socket
+import collections
+from optparse import OptionParser
+
+from fah.Poller import Poller, POLL_READ, POLL_WRITE, POLL_ERROR
+from fah.sim.VirtualClient import VirtualClient
+
+debug = False
+
+# Commands which produce a message and the message type
+message_types = {
+    'heartbeat': 'heartbeat',
+    'ppd': 'ppd',
+    'options': 'options',
+    'queue-info': 'units',
+    'slot-info': 'slots',
+    'info': 'info',
+    'configured': 'configured',
+    }
+
+
+def dump_pyon(obj):
+    if obj is None: return 'None'
+    if obj is True: return 'True'
+    if obj is False: return 'False'
+    if isinstance(obj, dict):
+        return '{%s}' % ', '.join(['%s: %s' % (dump_pyon(k), dump_pyon(v))
+                                   for k, v in obj.items()])
+    if isinstance(obj, (list, tuple)):
+        return '[%s]' % ', '.join(map(dump_pyon, obj))
+    if isinstance(obj, basestring): return json.dumps(obj)
+    return repr(obj)
+
+
+def make_frame(type, data):
+    return '\nPyON 1 %s\n%s\n---\n' % (type, dump_pyon(data))
+
+
+class Session:
+    '''One connection to a simulated client's command server.'''
+
+    def __init__(self, sim, client, sock):
+        self.sim = sim
+        self.client = client
+        self.socket = sock
+        self.socket.setblocking(0)
+        self.events = 0
+        self.inbuf = ''
+        self.outq = collections.deque() # (send time, data)
+        self.updates = {} # id -> [rate, command, next time]
+        self.log_updates = False
+        self.log_sent = 0
+        self.authed = not client.password
+        self.closed = False
+
+        self.send('Welcome to the Folding@home Client command server.\n')
+
+
+    def get_poll_mask(self):
+        if self.outq and self.outq[0][0] <= time.time():
+            return POLL_READ | POLL_WRITE
+        return POLL_READ
+
+
+    def send(self, data):
+        self.outq.append([time.time() + self.sim.delay, data])
+        self.sim.poller.update(self)
+
+
+    def send_message(self, type, data):
+        self.send(make_frame(type, data))
+
+
+    def close(self):
+        if self.closed: return
+        self.closed = True
+        self.sim.poller.unregister(self)
+        self.sim.sessions.discard(self)
+        try:
+            self.socket.close()
+        except: pass
+
+
+    def flush(self, now):
+        while self.outq and self.outq[0][0] <= now:
+            entry = self.outq[0]
+            try:
+                count = self.socket.send(entry[1])
+            except socket.error as e:
+                if e.args[0] in (errno.EAGAIN, errno.EWOULDBLOCK): break
+                return self.close()
+
+            self.sim.bytes_sent += count
+            if count < len(entry[1]):
+                entry[1] = entry[1][count:]
+                break
+
+            self.outq.popleft()
+
+        self.sim.poller.update(self)
+
+
+    def handle(self, now):
+        if self.events & (POLL_READ | POLL_ERROR):
+            try:
+                data = self.socket.recv(64 * 1024)
+            except socket.error as e:
+                if e.args[0] not in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    return self.close()
+                data = None
+
+            if data == '': return self.close()
+
+            if data:
+                self.inbuf += data
+                while '\n' in self.inbuf:
+                    line, self.inbuf = self.inbuf.split('\n', 1)
+                    line = line.strip()
+                    if line: self.process(line, now)
+
+        self.events = 0
+        if not self.closed: self.flush(now)
+
+
+    def run_command(self, command):
+        command = command.strip()
+        if command.startswith('$'): command = command[1:]
+        if command.startswith('(') and command.endswith(')'):
+            command = command[1:-1]
+
+        tokens = command.split()
+        if not tokens: return
+        name = tokens[0]
+        client = self.client
+
+        if name == 'heartbeat':
+            # Carries the send time so end-to-end latency can be measured
+            data = time.time()
+        elif name == 'ppd': data = client.get_ppd()
+        elif name == 'options':
+            for token in tokens[1:]:
+                if '=' in token:
+                    key, value = token.split('=', 1)
+                    client.options[key] = value.strip('\'"')
+                elif token.endswith('!'): client.options.pop(token[:-1], None)
+            data = client.options
+        elif name == 'queue-info': data = client.get_units()
+        elif name == 'slot-info': data = client.slots
+        elif name == 'info': data = client.get_info()
+        elif name == 'configured': data = True
+        else: return
+
+        self.send_message(message_types[name], data)
+
+
+    def process(self, line, now):
+        if debug: print('%d: %s' % (self.client.id, line))
+
+        tokens = line.split()
+        cmd = tokens[0]
+        args = tokens[1:]
+        client = self.client
+
+        if cmd in ('quit', 'exit'): return self.close()
+
+        if cmd == 'auth':
+            password = line[4:].strip().strip('"')
+            self.authed = password == client.password
+            if not self.authed: self.send_message('error', 'Invalid password')
+            return
+
+        if not self.authed:
+            self.send_message('error', 'Not authorized')
+            return
+
+        if cmd == 'updates' and args:
+            if args[0] == 'add' and 3 < len(args):
+                rate = int(args[2])
+                self.updates[int(args[1])] = [rate, ' '.join(args[3:]), now]
+            elif args[0] == 'del' and 1 < len(args):
+                self.updates.pop(int(args[1]), None)
+            elif args[0] == 'clear': self.updates.clear()
+            elif args[0] == 'reset':
+                for update in self.updates.values(): update[2] = now
+
+        elif cmd == 'log-updates' and args:
+            if args[0] in ('start', 'restart'):
+                self.log_updates = True
+                self.log_sent = len(client.log)
+                log = ''.join([l + '\n' for l in client.log])
+                self.send_message('log-restart', log)
+            elif args[0] == 'stop': self.log_updates = False
+
+        elif cmd == 'unpause': client.set_slot_status(''.join(args), 'RUNNING')
+        elif cmd == 'pause': client.set_slot_status(''.join(args), 'PAUSED')
+        elif cmd == 'finish':
+            client.set_slot_status(''.join(args), 'FINISHING')
+        elif cmd == 'option' and len(args) == 2:
+            client.options[args[0]] = args[1]
+        elif cmd in ('save', 'on_idle', 'always_on', 'slot-add', 'slot-delete',
+                     'slot-modify'): pass
+        else: self.run_command(line)
+
+
+    def update(self, now):
+        for update in self.updates.values():
+            rate, command, next = update
+            if next <= now:
+                update[2] = now + max(rate, 1)
+                self.run_command(command)
+
+        if self.log_updates and self.log_sent < len(self.client.log):
+            lines = self.client.log[self.log_sent:]
+            self.log_sent = len(self.client.log)
+            self.send_message('log-update',
+                              ''.join([l + '\n' for l in lines]))
+
+
+
+class Listener:
+    def __init__(self, sim, client, address, port):
+        self.sim = sim
+        self.client = client
+        self.events = 0
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.socket.bind((address, port))
+        self.socket.listen(16)
+        self.socket.setblocking(0)
+
+
+    def get_poll_mask(self): return POLL_READ
+
+
+    def handle(self, now):
+        self.events = 0
+        try:
+            sock, addr = self.socket.accept()
+        except socket.error: return
+
+        session = Session(self.sim, self.client, sock)
+        self.sim.sessions.add(session)
+        self.sim.poller.register(session)
+
+
+
+class Simulator:
+    '''Runs count virtual FAHClients on consecutive ports starting at port.
+
+    delay is the simulated one way network delay in seconds.  The remaining
+    keyword arguments are passed to VirtualClient.
+    '''
+
+    def __init__(self, count = 1, port = 36400, address = '127.0.0.1',
+                 delay = 0, tick_rate = 0.25, **kwargs):
+        self.delay = delay
+        self.tick_rate = tick_rate
+        self.poller = Poller()
+        self.sessions = set()
+        self.clients = []
+        self.bytes_sent = 0
+        self.running = False
+
+        for i in range(count):
+            client = VirtualClient(i, **kwargs)
+            self.clients.append(client)
+            self.poller.register(Listener(self, client, address, port + i))
+
+
+    def run(self, duration = None):
+        self.running = True
+        end = None if duration is None else time.time() + duration
+        last_tick = 0
+
+        while self.running and (end is None or time.time() < end):
+            timeout = self.tick_rate
+            if self.delay: timeout = min(timeout, self.delay / 2)
+
+            for conn in self.poller.poll(timeout):
+                conn.handle(time.time())
+
+            now = time.time()
+            if last_tick + self.tick_rate <= now:
+                last_tick = now
+                for client in self.clients: client.tick()
+                for session in list(self.sessions): session.update(now)
+
+            for session in list(self.sessions):
+                if session.outq: session.flush(now)
+
+
+    def stop(self):
+        self.running = False
+
+
+
+if __name__ == '__main__':
+    parser = OptionParser(usage = 'Usage: %prog [options]')
+    parser.add_option('--clients', type = 'int', default = 1,
+                      help = 'Number of virtual clients')
+    parser.add_option('--address', default = '127.0.0.1',
+                      help = 'Address to listen on')
+    parser.add_option('--port', type = 'int', default = 36400,
+                      help = 'Port of the first client, one port per client')
+    parser.add_option('--slots', type = 'int', default = 2,
+                      help = 'Slots per client')
+    parser.add_option('--queue', type = 'int', default = 4,
+                      help = 'Work units per client')
+    parser.add_option('--log-rate', type = 'float', default = 1,
+                      help = 'Log lines per second per client')
+    parser.add_option('--delay', type = 'float', default = 0,
+                      help = 'Network delay in milliseconds')
+    parser.add_option('--password', default = '',
+                      help = 'Command server password')
+    parser.add_option('--duration', type = 'float',
+                      help = 'Exit after this many seconds')
+    options, args = parser.parse_args()
+
+    sim = Simulator(options.clients, options.port, options.address,
+                    options.delay / 1000.0, slots = options.slots,
+                    queue = options.queue, log_rate = options.log_rate,
+                    password = options.password)
+
+    print('Simulating %d clients on %s ports %d-%d' % (
+        options.clients, options.address, options.port,
+        options.port + options.clients - 1))
+    sys.stdout.flush()
+
+    try:
+        sim.run(options.duration)
+    except KeyboardInterrupt: pass
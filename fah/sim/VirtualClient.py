@@ -0,0 +1,162 @@
+################################################################################
+#                                                                              #
+#                    Folding@Home Client Control (FAHControl)                  #
+#                   Copyright (C) 2016-2020 foldingathome.org                  #
+#                  Copyright (C) 2010-2016 Stanford University                 #
+#                                                                              #
+#      This program is free software: you can redistribute it and/or modify    #
+#      it under the terms of the GNU General Public License as published by    #
+#       the Free Software Foundation, either version 3 of the License, or      #
+#                      (at your option) any later version.                     #
+#                                                                              #
+#        This program is distributed in the hope that it will be useful,       #
+#         but WITHOUT ANY WARRANTY; without even the implied warranty of       #
+#         MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the        #
+#                  GNU General Public License for more details.                #
+#                                                                              #
+#       You should have received a copy of the GNU General Public License      #
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.    #
+#                                                                              #
+################################################################################
+
+import time
+import random
+
+
+def format_eta(seconds):
+    if seconds <= 0: return '0.00 secs'
+    hours, seconds = divmod(int(seconds), 3600)
+    if hours: return '%d hours %02d mins' % (hours, seconds / 60)
+    return '%d mins %02d secs' % divmod(seconds, 60)
+
+
+class VirtualClient:
+    '''The folding state of one simulated FAHClient.'''
+
+    def __init__(self, id, slots = 2, queue = 4, log_rate = 1.0,
+                 password = '', seed = None):
+        self.id = id
+        self.password = password
+        self.log_rate = log_rate
+        self.random = random.Random(id if seed is None else seed)
+        self.start = time.time()
+        self.last_tick = self.start
+        self.log_carry = 0.0
+        self.log = []
+
+        self.options = {
+            'user': 'Simulated%d' % id, 'team': '0', 'passkey': '',
+            'power': 'full', 'fold-anon': 'false', 'idle': 'false',
+            'proxy-enable': 'false', 'proxy': ':8080', 'next-unit-percentage':
+            '99', 'max-packet-size': 'normal', 'core-priority': 'idle',
+            'checkpoint': '15', 'cause': 'ANY', 'client-type': 'normal',
+            }
+
+        self.slots = []
+        for i in range(slots):
+            if i: description = 'gpu:%d:Simulated GPU %d' % (i - 1, i - 1)
+            else: description = 'cpu:8'
+            self.slots.append({
+                'id': '%02d' % i, 'status': 'RUNNING', 'description':
+                description, 'options': {'paused': False}, 'reason': '',
+                'idle': False})
+
+        self.units = []
+        for i in range(queue): self.units.append(self.make_unit(i, i % slots))
+
+        self.add_log('Simulated FAHClient %d started' % id)
+
+
+    def make_unit(self, id, slot):
+        r = self.random
+        running = id < len(self.slots)
+        return {
+            'id': '%02d' % id, 'state': 'RUNNING' if running else 'READY',
+            'error': 'NO_ERROR', 'project': r.randint(10000, 17999),
+            'run': r.randint(0, 999), 'clone': r.randint(0, 99),
+            'gen': r.randint(0, 200), 'core': '0xa7',
+            'unit': '0x%032x' % r.getrandbits(128),
+            'percentdone': '0.00%', 'progress': 0.0,
+            'speed': r.uniform(0.01, 0.1) if running else 0.0,
+            'eta': '0.00 secs', 'ppd': '0', 'creditestimate': '%d' %
+            r.randint(1000, 90000), 'waitingon': '', 'nextattempt':
+            '0.00 secs', 'timeremaining': '1.00 days', 'totalframes': 100,
+            'framesdone': 0, 'assigned': '2020-04-01T08:02:52Z', 'timeout':
+            '2020-04-02T08:02:52Z', 'deadline': '2020-04-03T08:02:52Z',
+            'ws': '128.252.203.10', 'cs': '0.0.0.0', 'attempts': 0,
+            'slot': '%02d' % slot, 'tpf': '1 mins 26 secs',
+            'basecredit': '%d' % r.randint(500, 20000)}
+
+
+    def add_log(self, text, unit = 0, slot = 0):
+        self.log.append(time.strftime('%H:%M:%S:', time.gmtime()) +
+                        'WU%02d:FS%02d:%s' % (unit, slot, text))
+
+
+    def tick(self):
+        '''Advances the simulation, returns the new log lines.'''
+        now = time.time()
+        delta = now - self.last_tick
+        self.last_tick = now
+        first = len(self.log)
+
+        for unit in self.units:
+            if unit['state'] != 'RUNNING': continue
+            slot = self.slots[int(unit['slot'])]
+            if slot['status'] == 'PAUSED': continue
+
+            progress = unit['progress'] + unit['speed'] * delta
+            unit['progress'] = min(100, progress)
+            unit['percentdone'] = '%.2f%%' % unit['progress']
+            unit['framesdone'] = int(unit['progress'])
+            remaining = (100 - unit['progress']) / unit['speed']
+            unit['eta'] = format_eta(remaining)
+            unit['ppd'] = '%d' % (float(unit['creditestimate']) *
+                                  unit['speed'] * 864)
+
+            if unit['progress'] == 100:
+                unit['state'] = 'READY'
+                unit['progress'] = unit['speed'] = 0
+                self.add_log('Unit finished', int(unit['id']),
+                             int(unit['slot']))
+
+        # Generate log lines at the configured rate
+        self.log_carry += self.log_rate * delta
+        while 1 <= self.log_carry:
+            self.log_carry -= 1
+            unit = self.random.choice(self.units)
+            self.add_log('0x%s:Completed %d out of 250000 steps (%d%%)' % (
+                unit['core'][2:], unit['progress'] * 2500, unit['progress']),
+                int(unit['id']), int(unit['slot']))
+
+        return self.log[first:]
+
+
+    def get_ppd(self):
+        return sum([float(unit['ppd']) for unit in self.units])
+
+
+    def get_units(self):
+        units = []
+        for unit in self.units:
+            unit = unit.copy()
+            del unit['progress'], unit['speed']
+            units.append(unit)
+        return units
+
+
+    def get_info(self):
+        return [
+            ['FAHClient', ['Version', '7.6.21'], ['Author', 'Simulator'],
+             ['Args', '--sim %d' % self.id]],
+            ['System', ['CPUs', '8'], ['Memory', '15.55GiB'],
+             ['OS', 'Linux'], ['Has Battery', 'false']],
+            ]
+
+
+    def set_slot_status(self, slot, status):
+        for s in self.slots:
+            if slot in ('', None) or int(s['id']) == int(slot):
+                s['status'] = status
+                s['options']['paused'] = status == 'PAUSED'
+                s['reason'] = 'by user' if status == 'PAUSED' else ''
@@ -0,0 +1,183 @@
+################################################################################
+#                                                                              #
+#                    Folding@Home Client Control (FAHControl)                  #
+#                   Copyright (C) 2016-2020 foldingathome.org                  #
+#                  Copyright (C) 2010-2016 Stanford University                 #
+#                                                                              #
+#      This program is free software: you can redistribute it and/or modify    #
+#      it under the terms of the GNU General Public License as published by    #
+#       the Free Software Foundation, either version 3 of the License, or      #
+#                      (at your option) any later version.                     #
+#                                                                              #
+#        This program is distributed in the hope that it will be useful,       #
+#         but WITHOUT ANY WARRANTY; without even the implied warranty of       #
+#         MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the        #
+#                  GNU General Public License for more details.                #
+#                                                                              #
+#       You should have received a copy of the GNU General Public License      #
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.    #
+#                                                                              #
+################################################################################
+
+PYON_HEADER = '\nPyON '
+PYON_TRAILER = '\n---\n'
+
+# Don't compact the buffer for less than this many consumed bytes
+COMPACT_MIN = 64 * 1024
+
+
+class FrameSplitter:
+    '''Splits a stream of PyON messages into (version, type, data) frames.
+
+    Each byte is scanned at most once no matter how the stream is chunked and
+    consumed data is only discarded once it makes up half of the buffer, so
+    splitting n bytes takes O(n) time overall.
+    '''
+
+    def __init__(self):
+        self.buf = bytearray()
+        self.pos = 0       # Start of unconsumed data
+        self.scan = 0      # Where to resume searching
+        self.header = None # (version, type, data start) of the current frame
+
+
+    def __len__(self): return len(self.buf) - self.pos
+
+
+    def feed(self, data):
+        self.buf.extend(data)
+
+
+    def compact(self):
+        if self.pos < COMPACT_MIN or self.pos * 2 < len(self.buf): return
+
+        offset = self.pos
+        del self.buf[:offset]
+        self.pos = 0
+        self.scan -= offset
+
+        if self.header is not None:
+            version, type, start = self.header
+            self.header = (version, type, start - offset)
+
+
+    def next(self):
+        '''Returns the next complete frame or None.'''
+        buf = self.buf
+
+        if self.header is None:
+            start = buf.find(PYON_HEADER, self.scan)
+            if start == -1:
+                # Keep the tail in case the header is split
+                self.scan = max(self.pos, len(buf) - len(PYON_HEADER) + 1)
+                return None
+
+            eol = buf.find('\n', start + 1)
+            if eol == -1:
+                self.scan = start
+                return None
+
+            line = str(buf[start + 1:eol])
+            tokens = line.split(None, 2)
+
+            if len(tokens) < 3 or not tokens[1].isdigit():
+                self.pos = self.scan = eol
+                self.compact()
+                raise Exception('Invalid PyON line: ' +
+                                line.encode('string_escape'))
+
+            self.header = (int(tokens[1]), tokens[2], eol + 1)
+            self.scan = eol
+
+        version, type, start = self.header
+
+        end = buf.find(PYON_TRAILER, self.scan)
+        if end == -1:
+            self.scan = max(start - 1, len(buf) - len(PYON_TRAILER) + 1)
+            return None
+
+        data = str(buf[start:end])
+
+        # Leave the trailing '\n' as the start of the next header
+        self.pos = self.scan = end + len(PYON_TRAILER) - 1
+        self.header = None
+        self.compact()
+
+        return version, type, data
+
+
+    def __iter__(self):
+        while True:
+            frame = self.next()
+            if frame is None: break
+            yield frame
+
+
+
+if __name__ == '__main__':
+    import random
+    import time
+
+    def legacy_split(chunks):
+        frames = []
+        readBuf = ''
+        for chunk in chunks:
+            readBuf += chunk
+            while True:
+                start = readBuf.find('\nPyON ')
+                if start == -1: break
+                eol = readBuf.find('\n', start + 1)
+                if eol == -1: break
+                tokens = readBuf[start + 1: eol].split(None, 2)
+                end = readBuf.find('\n---\n', start)
+                if end == -1: break
+                frames.append((int(tokens[1]), tokens[2],
+                               readBuf[eol + 1: end]))
+                readBuf = readBuf[end + 4:]
+        return frames
+
+    def split(chunks):
+        frames = []
+        splitter = FrameSplitter()
+        for chunk in chunks:
+            splitter.feed(chunk)
+            frames.extend(splitter)
+        return frames
+
+    def make_stream(count, size):
+        stream = 'Welcome to the Folding@home Client command server.\n'
+        for i in range(count):
+            line = '"%08d:WU%02d:FS%02d:' % (i, i % 4, i % 2)
+            stream += 'PyON 1 log-update\n%s%s"\n---\n' % (
+                line, 'x' * (size - len(line)))
+        return stream
+
+    def chunk(stream, size):
+        return [stream[i:i + size] for i in range(0, len(stream), size)]
+
+    # Fuzz against the old parser with random chunk boundaries
+    random.seed(1)
+    stream = make_stream(200, 300)
+    for i in range(200):
+        chunks = []
+        pos = 0
+        while pos < len(stream):
+            size = random.randint(1, 64)
+            chunks.append(stream[pos:pos + size])
+            pos += size
+
+        assert split(chunks) == legacy_split(chunks)
+
+    print('Fuzz OK')
+
+    # Benchmark multi-megabyte bursts of small messages arriving in 1MiB reads
+    for mb in [1, 4, 16]:
+        stream = make_stream(mb * 4096, 256)
+        chunks = chunk(stream, 1024 * 1024)
+
+        for name, func in [('legacy', legacy_split), ('splitter', split)]:
+            start = time.time()
+            frames = func(chunks)
+            delta = time.time() - start
+            print('%-8s %3dMiB %6d frames %8.3fs %8.1f MiB/s' % (
+                name, mb, len(frames), delta, len(stream) / delta / 2 ** 20))
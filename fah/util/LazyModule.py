@@ -0,0 +1,75 @@
+################################################################################
+#                                                                              #
+#                    Folding@Home Client Control (FAHControl)                  #
+#                   Copyright (C) 2016-2020 foldingathome.org                  #
+#                  Copyright (C) 2010-2016 Stanford University                 #
+#                                                                              #
+#      This program is free software: you can redistribute it and/or modify    #
+#      it under the terms of the GNU General Public License as published by    #
+#       the Free Software Foundation, either version 3 of the License, or      #
+#                      (at your option) any later version.                     #
+#                                                                              #
+#        This program is distributed in the hope that it will be useful,       #
+#         but WITHOUT ANY WARRANTY; without even the implied warranty of       #
+#         MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the        #
+#                  GNU General Public License for more details.                #
+#                                                                              #
+#       You should have received a copy of the GNU General Public License      #
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.    #
+#                                                                              #
+################################################################################
+
+import types
+import importlib
+
+
+class LazyModule(types.ModuleType):
+    '''A package whose listed names are imported from its submodules on
+    first access.
+
+    lazy maps submodule names to the names they provide.  The package
+    replaces itself in sys.modules at the end of its __init__:
+
+      sys.modules[__name__] = LazyModule(sys.modules[__name__], {...})
+
+    "from package import *" imports every lazy name, as the star imports of
+    the submodules used to.
+    '''
+
+    def __init__(self, module, lazy):
+        types.ModuleType.__init__(self, module.__name__, module.__doc__)
+        self.__dict__.update(module.__dict__)
+
+        # Python 2 clears a module's globals when it is freed
+        self.__dict__['_LazyModule__module'] = module
+
+        names = {}
+        for submodule, provides in lazy.items():
+            for name in provides: names[name] = submodule
+        self.__dict__['_LazyModule__lazy'] = names
+
+
+    @property
+    def __all__(self):
+        names = [name for name in self.__dict__ if not name.startswith('_')]
+        return sorted(set(names + self.__lazy.keys()))
+
+
+    def __getattr__(self, name):
+        submodule = self.__lazy.get(name)
+        if submodule is None:
+            raise AttributeError("'module' object has no attribute '%s'" % name)
+
+        module = importlib.import_module(self.__name__ + '.' + submodule)
+        value = getattr(module, name)
+        self.__dict__[name] = value
+        return value
+
+
+    def __setattr__(self, name, value):
+        # Importing a submodule binds it in the package, don't let that hide
+        # a lazy name, such as the class ClientConfig in fah.ClientConfig
+        if isinstance(value, types.ModuleType) and name in self.__lazy and \
+                value.__name__ == '%s.%s' % (self.__name__, name): return
+
+        types.ModuleType.__setattr__(self, name, value)
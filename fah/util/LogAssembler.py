@@ -0,0 +1,133 @@
+################################################################################
+#                                                                              #
+#                    Folding@Home Client Control (FAHControl)                  #
+#                   Copyright (C) 2016-2020 foldingathome.org                  #
+#                  Copyright (C) 2010-2016 Stanford University                 #
+#                                                                              #
+#      This program is free software: you can redistribute it and/or modify    #
+#      it under the terms of the GNU General Public License as published by    #
+#       the Free Software Foundation, either version 3 of the License, or      #
+#                      (at your option) any later version.                     #
+#                                                                              #
+#        This program is distributed in the hope that it will be useful,       #
+#         but WITHOUT ANY WARRANTY; without even the implied warranty of       #
+#         MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the        #
+#                  GNU General Public License for more details.                #
+#                                                                              #
+#       You should have received a copy of the GNU General Public License      #
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.    #
+#                                                                              #
+################################################################################
+
+import re
+
+ANSI_COLOR_RE = re.compile(r'\033\[\d\d?m')
+
+
+class LogAssembler:
+    '''Turns the chunks of log-update messages into complete log lines.
+
+    A chunk need not end on a line boundary, the unfinished line is carried
+    over to the next chunk.  Color codes are removed as lines are completed,
+    they never span lines so they are never split.
+    '''
+
+    def __init__(self):
+        self.parts = [] # Pieces of the unfinished line
+
+
+    def reset(self):
+        self.parts = []
+
+
+    def feed(self, data):
+        '''Returns the non-empty lines completed by data.'''
+        if isinstance(data, unicode): data = data.encode('utf-8')
+
+        end = data.rfind('\n')
+        if end == -1:
+            if data: self.parts.append(data)
+            return []
+
+        if self.parts:
+            self.parts.append(data[:end])
+            text = ''.join(self.parts)
+        else: text = data[:end]
+
+        rest = data[end + 1:]
+        self.parts = [rest] if rest else []
+
+        if '\033' in text: text = ANSI_COLOR_RE.sub('', text)
+
+        lines = text.split('\n')
+        if '' in lines: lines = filter(None, lines)
+        return lines
+
+
+    def flush(self):
+        '''Returns the unfinished line, if any, as a complete line.'''
+        text = ''.join(self.parts)
+        self.parts = []
+        if '\033' in text: text = ANSI_COLOR_RE.sub('', text)
+        return [text] if text else []
+
+
+
+if __name__ == '__main__':
+    import random
+    import time
+
+    def assemble(chunks):
+        a = LogAssembler()
+        lines = []
+        for chunk in chunks: lines += a.feed(chunk)
+        return lines + a.flush()
+
+    # Boundary cases
+    assert assemble(['abc']) == ['abc']
+    assert assemble(['ab', 'c\n']) == ['abc']
+    assert assemble(['abc\n', 'def']) == ['abc', 'def']
+    assert assemble(['abc', '\n', '\n\n', 'def\n']) == ['abc', 'def']
+    assert assemble(['a', 'b', 'c', '\nd']) == ['abc', 'd']
+    assert assemble(['\033[9', '3mred\033[0', 'm\n']) == ['red']
+    assert assemble(['x\033[1mbold\033[0m\ny\n']) == ['xbold', 'y']
+    assert assemble([u'caf\xe9\n']) == ['caf\xc3\xa9']
+    assert LogAssembler().feed('partial') == []
+
+    # Fuzz against splitting the whole text at once
+    random.seed(1)
+    text = ''
+    for i in range(2000):
+        color = random.choice(['', '\033[93m', '\033[91m'])
+        text += '12:00:00:WU%02d:FS%02d:%sLine %d\033[0m\n' % (
+            i % 4, i % 2, color, i)
+    expected = [l for l in re.sub(r'\033\[\d\d?m', '', text).split('\n') if l]
+
+    for i in range(100):
+        chunks = []
+        pos = 0
+        while pos < len(text):
+            size = random.randint(1, 200)
+            chunks.append(text[pos:pos + size])
+            pos += size
+
+        assert assemble(chunks) == expected
+
+    print('Tests OK')
+
+    # Throughput, compared to the old per chunk regex and split
+    def legacy(chunks):
+        lines = []
+        for chunk in chunks:
+            chunk = re.sub(r'\033\[\d\d?m', '', chunk)
+            lines += [line for line in chunk.split('\n') if line]
+        return lines
+
+    text *= 50
+    chunks = [text[i:i + 4096] for i in range(0, len(text), 4096)]
+    for name, func in [('legacy', legacy), ('assembler', assemble)]:
+        start = time.time()
+        lines = func(chunks)
+        delta = time.time() - start
+        print('%-9s %7d lines %6.3fs %6.1f MiB/s' % (
+            name, len(lines), delta, len(text) / delta / 2 ** 20))
@@ -0,0 +1,298 @@
+################################################################################
+#                                                                              #
+#                    Folding@Home Client Control (FAHControl)                  #
+#                   Copyright (C) 2016-2020 foldingathome.org                  #
+#                  Copyright (C) 2010-2016 Stanford University                 #
+#                                                                              #
+#      This program is free software: you can redistribute it and/or modify    #
+#      it under the terms of the GNU General Public License as published by    #
+#       the Free Software Foundation, either version 3 of the License, or      #
+#                      (at your option) any later version.                     #
+#                                                                              #
+#        This program is distributed in the hope that it will be useful,       #
+#         but WITHOUT ANY WARRANTY; without even the implied warranty of       #
+#         MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the        #
+#                  GNU General Public License for more details.                #
+#                                                                              #
+#       You should have received a copy of the GNU General Public License      #
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.    #
+#                                                                              #
+################################################################################
+
+import re
+import bisect
+import itertools
+from array import array
+
+LOG_MAX_LINES = 100000
+LOG_MAX_BYTES = 16 * 1024 * 1024
+
+# Fields used to index log lines, e.g. "12:00:00:WARNING:WU01:FS00:..."
+LOG_TAG_RE = re.compile(r'(?:^|:)(WU\d+(?=:)|FS\d+(?=:)|WARNING|ERROR|W |E )')
+LOG_SEVERITY_TAGS = ('WARNING', 'ERROR', 'W ', 'E ')
+
+
+def get_index_tags(found):
+    '''Returns the index keys for the LOG_TAG_RE matches of a line.'''
+    tags = set()
+    for tag in found:
+        if tag in LOG_SEVERITY_TAGS: tags.add('severity')
+        else: tags.add(tag)
+    return tags
+
+
+def get_log_tags(line):
+    '''Returns the index keys of a log line.'''
+    tags = get_index_tags(LOG_TAG_RE.findall(line))
+    if line.startswith('*'): tags.add('*') # Banners always pass filters
+    return tags
+
+
+def intersect_sorted(lists):
+    '''Returns the values found in all of the sorted lists.  The shortest is
+    walked and the others are bisected if much longer, else hashed.'''
+    if not lists: return []
+    lists = sorted(lists, key = len)
+    result = lists[0]
+
+    for other in lists[1:]:
+        if len(result) * 16 < len(other):
+            found = []
+            i = 0
+            for x in result:
+                i = bisect.bisect_left(other, x, i)
+                if i == len(other): break
+                if other[i] == x: found.append(x)
+
+        else:
+            other = set(other)
+            found = [x for x in result if x in other]
+
+        result = found
+
+    return list(result)
+
+
+def merge_sorted(a, b):
+    result = []
+    i = j = 0
+    while i < len(a) and j < len(b):
+        if a[i] < b[j]: result.append(a[i]); i += 1
+        elif b[j] < a[i]: result.append(b[j]); j += 1
+        else: result.append(a[i]); i += 1; j += 1
+
+    result.extend(a[i:])
+    result.extend(b[j:])
+    return result
+
+
+class LogStore:
+    '''A bounded store of log lines.
+
+    Lines are kept back to back in a bytearray with an offset per line.
+    Lines are numbered in arrival order; once there are more than max_lines
+    or max_bytes the oldest are dropped.  Line numbers are also indexed by
+    WU, FS and severity so filters do not have to scan every line.  The
+    indexes may still hold dropped lines until the next compact().
+    '''
+
+    def __init__(self, max_lines = LOG_MAX_LINES, max_bytes = LOG_MAX_BYTES):
+        self.max_lines = max_lines
+        self.max_bytes = max_bytes
+        self.clear()
+
+
+    def clear(self):
+        self.data = bytearray()
+        self.offsets = array('L') # Start of each line in data
+        self.head = 0  # Index in offsets of the oldest line
+        self.first = 0 # Number of the oldest line
+        self.index = {} # tag -> array('L') of line numbers
+
+
+    def __len__(self): return len(self.offsets) - self.head
+
+
+    @property
+    def end(self):
+        '''The number the next line will get.'''
+        return self.first + len(self)
+
+
+    def get_size(self):
+        '''Returns the bytes used by the stored lines.'''
+        if not len(self): return 0
+        return len(self.data) - self.offsets[self.head]
+
+
+    def get_span(self, n):
+        i = n - self.first + self.head
+        start = self.offsets[i]
+        if i + 1 < len(self.offsets): return start, self.offsets[i + 1]
+        return start, len(self.data)
+
+
+    def __getitem__(self, n):
+        if n < 0: n += self.end
+        if n < self.first or self.end <= n: raise IndexError(n)
+        start, end = self.get_span(n)
+        return str(self.data[start:end])
+
+
+    def add(self, line): self.extend([line])
+
+
+    def extend(self, lines):
+        lines = [line.encode('utf-8') if isinstance(line, unicode) else line
+                 for line in lines]
+        if not lines: return
+
+        # Lines past the last max_lines would be dropped at once
+        skip = len(lines) - self.max_lines
+        if 0 < skip:
+            first = self.end + skip
+            self.clear()
+            self.first = first
+            lines = lines[skip:]
+
+        # Group the new line numbers by the tags found in each line, so the
+        # tags are only interpreted once per distinct combination
+        groups = {}
+        findall = LOG_TAG_RE.findall
+        offsets = self.offsets
+        size = len(self.data)
+        n = self.end
+
+        for line in lines:
+            offsets.append(size)
+            size += len(line)
+
+            key = tuple(findall(line))
+            if line.startswith('*'): key += ('*',) # Banners pass filters
+
+            numbers = groups.get(key)
+            if numbers is None: groups[key] = [n]
+            else: numbers.append(n)
+            n += 1
+
+        self.data.extend(''.join(lines))
+
+        # Append to each tag's index in line order
+        new = {} # tag -> lists of line numbers
+        for key, numbers in groups.items():
+            for tag in get_index_tags(key):
+                new.setdefault(tag, []).append(numbers)
+
+        for tag, lists in new.items():
+            if len(lists) == 1: numbers = lists[0]
+            else: numbers = sorted(itertools.chain(*lists))
+
+            index = self.index.get(tag)
+            if index is None: self.index[tag] = array('L', numbers)
+            else: index.extend(numbers)
+
+        self.trim()
+
+
+    def trim(self):
+        '''Drops the oldest lines while there are more than max_lines or
+        max_bytes, but keeps at least one.'''
+        if not len(self): return
+
+        head = max(self.head, len(self.offsets) - self.max_lines)
+        if self.max_bytes < len(self.data) - self.offsets[head]:
+            head = bisect.bisect_left(self.offsets,
+                                      len(self.data) - self.max_bytes, head)
+            head = min(head, len(self.offsets) - 1)
+
+        # The indexes are left as is, select() never looks before first
+        self.first += head - self.head
+        self.head = head
+        self.compact()
+
+
+    def compact(self):
+        # Free dropped lines once they are at least half the store
+        if self.head < 1024 or self.head * 2 < len(self.offsets): return
+
+        offset = self.offsets[self.head]
+        del self.data[:offset]
+        self.offsets = array('L', [x - offset
+                                   for x in self.offsets[self.head:]])
+        self.head = 0
+
+        for tag, index in self.index.items():
+            i = bisect.bisect_left(index, self.first)
+            if i == len(index): del self.index[tag]
+            elif i: self.index[tag] = index[i:]
+
+
+    def select(self, severity = False, unit = None, slot = None,
+               start = None):
+        '''Returns the sorted numbers of lines from start on which match all
+        of the given filters.  unit and slot are two digit ids.'''
+        if start is None or start < self.first: start = self.first
+
+        tags = []
+        if severity: tags.append('severity')
+        if unit is not None: tags.append('WU' + unit)
+        if slot is not None: tags.append('FS' + slot)
+
+        if not tags: return range(start, self.end)
+
+        def lines(tag):
+            # The numbers from start on, found by bisecting the index
+            index = self.index.get(tag, ())
+            return index[bisect.bisect_left(index, start):]
+
+        return merge_sorted(intersect_sorted(map(lines, tags)), lines('*'))
+
+
+    def get_lines(self, numbers):
+        return [self[n] for n in numbers]
+
+
+    def __iter__(self):
+        for n in range(self.first, self.end): yield self[n]
+
+
+
+if __name__ == '__main__':
+    import random
+    import time
+
+    random.seed(1)
+    lines = []
+    for i in range(200000):
+        severity = random.choice(['', '', '', 'WARNING:', 'ERROR:'])
+        lines.append('12:00:00:%sWU%02d:FS%02d:0xa7:Completed %d steps' % (
+            severity, random.randint(0, 9), random.randint(0, 3), i))
+
+    start = time.time()
+    store = LogStore(max_lines = 100000)
+    store.extend(lines)
+    print('add    %6d lines %8.3fs %6.1f MiB' % (
+        len(lines), time.time() - start, store.get_size() / 2.0 ** 20))
+
+    # The old filter, a regex over every line
+    regex = re.compile('(^\*)|(.*(^|:)WU03.*(^|:)FS01):')
+    start = time.time()
+    expected = [line for line in lines[-100000:] if regex.match(line)]
+    print('regex  %6d lines %8.3fs' % (len(expected), time.time() - start))
+
+    start = time.time()
+    selected = store.get_lines(store.select(unit = '03', slot = '01'))
+    print('select %6d lines %8.3fs' % (len(selected), time.time() - start))
+
+    assert selected == expected
+
+    # Only the lines added since the last select, as the log viewer does
+    numbers = store.select(severity = True, slot = '01')
+    tail = store.end - 100
+    start = time.time()
+    for i in range(1000): selected = store.select(severity = True,
+                                                 slot = '01', start = tail)
+    print('tail   %6d lines %8.3fs for 1000' % (
+        len(selected), time.time() - start))
+
+    assert selected == [n for n in numbers if tail <= n]
@@ -0,0 +1,155 @@
+################################################################################
+#                                                                              #
+#                    Folding@Home Client Control (FAHControl)                  #
+#                   Copyright (C) 2016-2020 foldingathome.org                  #
+#                  Copyright (C) 2010-2016 Stanford University                 #
+#                                                                              #
+#      This program is free software: you can redistribute it and/or modify    #
+#      it under the terms of the GNU General Public License as published by    #
+#       the Free Software Foundation, either version 3 of the License, or      #
+#                      (at your option) any later version.                     #
+#                                                                              #
+#        This program is distributed in the hope that it will be useful,       #
+#         but WITHOUT ANY WARRANTY; without even the implied warranty of       #
+#         MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the        #
+#                  GNU General Public License for more details.                #
+#                                                                              #
+#       You should have received a copy of the GNU General Public License      #
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.    #
+#                                                                              #
+################################################################################
+
+import collections
+
+# Small chunks are joined into sends of up to this many bytes
+GATHER_SIZE = 64 * 1024
+
+
+class OutputBuffer:
+    '''Data waiting to be sent, kept as a queue of chunks.
+
+    Writing and sending are linear in the amount of data.  Small chunks are
+    gathered into one send and a partly sent chunk is resent through a
+    memoryview rather than copied.
+
+    The buffer becomes congested when it holds more than high_water bytes
+    and stays so until it drains below low_water.
+    '''
+
+    def __init__(self, high_water = 256 * 1024, low_water = None):
+        self.high_water = high_water
+        if low_water is None: low_water = high_water / 4
+        self.low_water = low_water
+        self.clear()
+
+
+    def clear(self):
+        self.chunks = collections.deque()
+        self.offset = 0 # Bytes of the first chunk already sent
+        self.size = 0
+        self.congested = False
+
+
+    def __len__(self): return self.size
+
+
+    def write(self, data):
+        if not data: return
+        if isinstance(data, unicode): data = data.encode('utf-8')
+        self.chunks.append(data)
+        self.size += len(data)
+        if self.high_water < self.size: self.congested = True
+
+
+    def peek(self):
+        '''Returns the next data to send.'''
+        chunks = self.chunks
+        first = chunks[0]
+
+        if GATHER_SIZE <= len(first) - self.offset or len(chunks) == 1:
+            if not self.offset: return first
+            return memoryview(first)[self.offset:]
+
+        # Join small chunks and keep the result in case of a partial send
+        parts = [first[self.offset:]]
+        size = len(parts[0])
+        chunks.popleft()
+        while chunks and size + len(chunks[0]) <= GATHER_SIZE:
+            size += len(chunks[0])
+            parts.append(chunks.popleft())
+
+        data = ''.join(parts)
+        chunks.appendleft(data)
+        self.offset = 0
+        return data
+
+
+    def consume(self, count):
+        '''Removes count sent bytes.'''
+        self.size -= count
+        chunks = self.chunks
+
+        while count:
+            remaining = len(chunks[0]) - self.offset
+            if count < remaining:
+                self.offset += count
+                break
+
+            count -= remaining
+            chunks.popleft()
+            self.offset = 0
+
+        if self.size < self.low_water: self.congested = False
+
+
+
+
+if __name__ == '__main__':
+    import time
+
+    def send(buf, sock):
+        while len(buf): buf.consume(sock.send(buf.peek()))
+
+    class Sink:
+        def __init__(self, limit): self.data = []; self.limit = limit
+        def send(self, data):
+            data = data[:self.limit]
+            if isinstance(data, memoryview): data = data.tobytes()
+            self.data.append(data)
+            return len(data)
+
+    # Compare with sending from one string, with partial sends
+    commands = ['slot-modify %d cpu cpus=%d\n' % (i, i % 32)
+                for i in range(50000)]
+    expected = ''.join(commands)
+    for limit in [7, 1000, 100000]:
+        sink = Sink(limit)
+        buf = OutputBuffer()
+        for i in range(0, len(commands), 1000):
+            map(buf.write, commands[i:i + 1000])
+            send(buf, sink)
+        assert ''.join(sink.data) == expected and not len(buf)
+
+    print('Tests OK')
+
+    # Benchmark queueing many commands then sending them to a socket which
+    # takes 4KiB at a time, the old way was Connection.writeBuf
+    class Legacy: writeBuf = ''
+
+    for count in [10000, 50000, 100000]:
+        commands = ['pause %d\n' % i for i in range(count)]
+
+        start = time.time()
+        legacy = Legacy()
+        for command in commands: legacy.writeBuf += command
+        while legacy.writeBuf: legacy.writeBuf = legacy.writeBuf[4096:]
+        legacy = time.time() - start
+
+        start = time.time()
+        buf = OutputBuffer()
+        map(buf.write, commands)
+        send(buf, Sink(4096))
+        delta = time.time() - start
+
+        print('%6d commands: string %.3fs, OutputBuffer %.3fs' % (
+            count, legacy, delta))
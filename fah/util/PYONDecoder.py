@@ -214,3 +214,92 @@ class PYONDecoder(json.JSONDecoder):
     json.JSONDecoder.__init__(self, *args, **kwargs)
     self.parse_string = pyon_scanstring
     self.scan_once = make_pyon_scanner(self)
+
+
+PYON_STRING = re.compile(r'("[^"\\]*(?:\\.[^"\\]*)*")', re.DOTALL)
+PYON_ESCAPE = re.compile(r'\\(?:x([0-9a-fA-F]{2})|.)', re.DOTALL)
+
+
+def _json_escape(match):
+  code = match.group(1)
+  if code is None: return match.group()
+  return '\\u00' + code
+
+
+def pyon_to_json(s):
+  """Rewrite the PyON only tokens None, True, False and hex escapes as JSON.
+  The string literals and the text between them are each processed as one
+  joined block so no Python code runs per token."""
+  if '\0' in s: raise ValueError('NUL in PyON message')
+
+  # Even parts are outside string literals, odd parts are string literals
+  parts = PYON_STRING.split(s)
+
+  other = '\0'.join(parts[0::2])
+  other = other.replace('None', 'null').replace('True', 'true')
+  other = other.replace('False', 'false')
+  parts[0::2] = other.split('\0')
+
+  if '\\x' in s:
+    strings = PYON_ESCAPE.sub(_json_escape, '\0'.join(parts[1::2]))
+    parts[1::2] = strings.split('\0')
+
+  return ''.join(parts)
+
+
+def pyon_loads(s):
+  """Decode a PyON message with the C accelerated json decoder, falling back
+  to the slower PYONDecoder for anything the fast path rejects."""
+  try:
+    if 'None' in s or 'True' in s or 'False' in s or '\\x' in s:
+      return json.loads(pyon_to_json(s))
+
+    return json.loads(s)
+
+  except ValueError:
+    return json.loads(s, cls = PYONDecoder)
+
+
+
+if __name__ == '__main__':
+  import time
+
+  slot = '{"id": "%02d", "status": "RUNNING", "description": "cpu:%d", ' \
+      '"options": {"idle": False, "paused": None}, "reason": "", ' \
+      '"idle": False}'
+  unit = '{"id": "%02d", "state": "RUNNING", "error": "NO_ERROR", ' \
+      '"project": 16403, "run": 1, "clone": 2, "gen": 3, "core": "0xa7", ' \
+      '"unit": "0x0000000%d0002894c5d6dd0e9f7ff73", "percentdone": "34.50%%",' \
+      ' "eta": "2 hours 01 mins", "ppd": "91234", "creditestimate": "8123",' \
+      ' "waitingon": "", "nextattempt": "0.00 secs", "timeremaining": ' \
+      '"2.45 days", "totalframes": 100, "framesdone": 34, "assigned": ' \
+      '"2020-04-01T08:02:52Z", "timeout": "2020-04-02T08:02:52Z", ' \
+      '"deadline": "2020-04-03T08:02:52Z", "ws": "128.252.203.10", ' \
+      '"cs": "0.0.0.0", "attempts": 0, "slot": "%02d", "tpf": "1 mins 26 ' \
+      'secs", "basecredit": "4680", "note": "caf\\xe9 None"}'
+
+  messages = [
+    ('slots', '[%s]' % ', '.join([slot % (i, i) for i in range(4)])),
+    ('units', '[%s]' % ', '.join([unit % (i, i, i) for i in range(8)])),
+    ('options', '{"user": "Anonymous", "team": "0", "passkey": "", ' \
+       '"power": "full", "proxy-enable": "false", "next-unit-percentage": ' \
+       '"99", "idle": "false", "fold-anon": True, "extra": None}'),
+    ('log', '"' + '15:41:07:WU01:FS01:0xa7:Completed 1250000 out of ' \
+       '2500000 steps (50%)\\n' * 50 + '"'),
+    ]
+
+  count = 2000
+  for type, data in messages:
+    assert pyon_loads(data) == json.loads(data, cls = PYONDecoder)
+
+    start = time.time()
+    for i in range(count): json.loads(data, cls = PYONDecoder)
+    slow = time.time() - start
+
+    start = time.time()
+    for i in range(count): pyon_loads(data)
+    fast = time.time() - start
+
+    print('%-8s %6d bytes  PYONDecoder %6.3fs  pyon_loads %6.3fs  %5.1fx' % (
+      type, len(data), slow, fast, slow / fast))
+
@@ -25,6 +25,7 @@ import threading
 import SocketServer
 
 import gtk
+import gobject
 
 from fah.Icon import get_icon
 
@@ -45,6 +46,11 @@ class SingleAppRequestHandler(SocketServer.BaseRequestHandler):
             self.server.exit_requested.set()
             self.request.send('OK\r\n')
 
+        else: return
+
+        # Handle it in the GUI thread
+        gobject.idle_add(self.server.on_request)
+
 
 
 class SingleAppServer(SocketServer.ThreadingMixIn, SocketServer.TCPServer):
@@ -66,6 +72,11 @@ class SingleAppServer(SocketServer.ThreadingMixIn, SocketServer.TCPServer):
         thread.start()
 
 
+    def on_request(self):
+        '''Called in the GUI thread after a PING or EXIT request.'''
+        return False # Don't repeat
+
+
     def check_for_instance(self):
         sock = None
         try:
@@ -0,0 +1,181 @@
+################################################################################
+#                                                                              #
+#                    Folding@Home Client Control (FAHControl)                  #
+#                   Copyright (C) 2016-2020 foldingathome.org                  #
+#                  Copyright (C) 2010-2016 Stanford University                 #
+#                                                                              #
+#      This program is free software: you can redistribute it and/or modify    #
+#      it under the terms of the GNU General Public License as published by    #
+#       the Free Software Foundation, either version 3 of the License, or      #
+#                      (at your option) any later version.                     #
+#                                                                              #
+#        This program is distributed in the hope that it will be useful,       #
+#         but WITHOUT ANY WARRANTY; without even the implied warranty of       #
+#         MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the        #
+#                  GNU General Public License for more details.                #
+#                                                                              #
+#       You should have received a copy of the GNU General Public License      #
+#     along with this program.  If not, see <http://www.gnu.org/licenses/>.    #
+#                                                                              #
+################################################################################
+
+import os
+import sys
+import gtk
+
+if sys.platform == 'darwin':
+    try:
+        from gtk_osxapplication import *
+    except:
+        from gtkosx_application import gtkosx_application_get_resource_path \
+            as quartz_application_get_resource_path
+
+from fah.util import parse_bool, get_home_dir
+
+
+def iterate_container(widget):
+    yield widget
+
+    if isinstance(widget, gtk.Container):
+        for child in widget.get_children():
+            for x in iterate_container(child): yield x
+
+
+def get_combo_items(widget):
+    items = []
+    def iterate_list(model, path, iter, data = None):
+        items.append(model.get_value(iter, 0))
+
+    widget.get_model().foreach(iterate_list, None)
+
+    return items
+
+
+def get_widget_str_value(widget):
+    if isinstance(widget, (gtk.SpinButton, gtk.Range)):
+        # Must come before gtk.Entry for gtk.SpinButton
+
+        # Clean up float formatting
+        value = '%.2f' % widget.get_value()
+        if value.endswith('.00'): value = value[0:-3]
+        elif value.endswith('.0'): value = value[0:-2]
+        return value
+
+    elif isinstance(widget, gtk.Entry): return widget.get_text()
+
+    elif isinstance(widget, gtk.RadioButton):
+        # TODO interpret as a number? or name?
+        pass
+
+    elif isinstance(widget, gtk.ToggleButton):
+        if widget.get_active(): return 'true'
+        else: return 'false'
+
+    elif isinstance(widget, gtk.ComboBox):
+        # NOTE This does not always get the displayed text
+        return widget.get_active_text()
+
+    else:
+        print ('ERROR: unsupported widget type %s' % type(widget))
+
+
+def set_range_value(widget, value):
+    if value == '': value = 0
+    else:
+        try: value = float(value)
+        except: value = 0
+    widget.set_value(value)
+
+
+def set_text_value(widget, value):
+    if widget.get_text() != value: widget.set_text(value)
+
+
+def set_toggle_value(widget, value): widget.set_active(parse_bool(value))
+
+
+def set_button_value(widget, value):
+    # NOTE: For some reason setting Button labels causes tooltips to hide.
+    # Only set when it has actually changed.
+    if widget.get_label() != value: widget.set_label(value)
+
+
+def set_combo_value(widget, value):
+    items = get_combo_items(widget)
+    length = len(items)
+    for i in range(length):
+        if items[i].lower() == value.lower():
+            widget.set_active(i)
+            return
+
+    print ('ERROR: Invalid value "%s"' % value)
+
+
+def set_progress_value(widget, value):
+    widget.set_text(value)
+
+    if value == '': value = '0'
+
+    if value.endswith('%'): fraction = float(value[:-1]) / 100.0
+    else: fraction = float(value)
+
+    widget.set_fraction(fraction)
+
+
+def set_unsupported_value(widget, value):
+    print ('ERROR: unsupported option widget type %s' % type(widget))
+
+
+def get_widget_setter(widget):
+    '''Returns a function which sets the widget from a string value, so the
+    widget type is only looked up once.'''
+    if isinstance(widget, (gtk.SpinButton, gtk.Range)):
+        # Must come before gtk.Entry for gtk.SpinButton
+        func = set_range_value
+    elif isinstance(widget, (gtk.Entry, gtk.Label)): func = set_text_value
+    elif isinstance(widget, gtk.RadioButton):
+        return lambda value: None # Ignore for now
+    elif isinstance(widget, gtk.ToggleButton): func = set_toggle_value
+    elif isinstance(widget, gtk.Button): func = set_button_value
+    elif isinstance(widget, gtk.ComboBox): func = set_combo_value
+    elif isinstance(widget, gtk.ProgressBar): func = set_progress_value
+    else: func = set_unsupported_value
+
+    def setter(value):
+        if value is None: value = ''
+        func(widget, str(value))
+
+    return setter
+
+
+def set_widget_str_value(widget, value):
+    get_widget_setter(widget)(value)
+
+
+def set_widget_change_action(widget, action):
+    if isinstance(widget, (gtk.Editable, gtk.ComboBox)):
+        widget.connect('changed', action)
+
+    elif isinstance(widget, gtk.Range):
+        widget.connect('value_changed', action)
+
+    elif isinstance(widget, gtk.ToggleButton):
+        widget.connect('toggled', action)
+
+    elif isinstance(widget, gtk.TreeModel):
+        widget.connect('row_changed', action)
+        widget.connect('row_inserted', action)
+        widget.connect('row_deleted', action)
+        widget.connect('rows_reordered', action)
+
+    else:
+        print ('ERROR: unsupported option widget type %s' % type(widget))
+
+
+def get_theme_dirs():
+    if sys.platform == 'darwin':
+        resources = quartz_application_get_resource_path()
+        path = os.path.join(resources, 'themes')
+        return [get_home_dir() + '/themes', path]
+    return [get_home_dir() + '/themes', gtk.rc_get_theme_dir(),
+            '/usr/share/themes']
@@ -23,20 +23,14 @@
 # fah.util
 import sys
 import os
-import gtk
-
-if sys.platform == 'darwin':
-    try:
-        from gtk_osxapplication import *
-    except:
-        from gtkosx_application import gtkosx_application_get_resource_path \
-            as quartz_application_get_resource_path
-
-from SingleApp import *
-from EntryValidator import *
-from PasswordValidator import *
+
 from OrderedDict import *
 from PYONDecoder import *
+from FrameSplitter import *
+from OutputBuffer import *
+from LogStore import *
+from LogAssembler import *
+from LazyModule import *
 
 
 def parse_bool(x):
@@ -57,7 +51,8 @@ def status_to_color(status):
         return '#7AD980'
     elif status == 'FAILED' or status == 'ERROR' or status == 'FAULTY':
         return '#ff0000'
-    elif status == 'SHUTDOWN' or status == 'CONNECTING':
+    elif status == 'SHUTDOWN' or status == 'CONNECTING' or \
+            status == 'CONGESTED':
         return '#ff8b00'
     elif status == 'OFFLINE':
         return '#dddddd'
@@ -76,125 +71,12 @@ def get_span_markup(text, bg = None, fg = 'black'):
     return markup
 
 
-def iterate_container(widget):
-    yield widget
-
-    if isinstance(widget, gtk.Container):
-        for child in widget.get_children():
-            for x in iterate_container(child): yield x
-
-
 def make_row(cols, keys):
     for col in cols:
         if col in keys: yield keys[col]
         else: yield ''
 
 
-def get_combo_items(widget):
-    items = []
-    def iterate_list(model, path, iter, data = None):
-        items.append(model.get_value(iter, 0))
-
-    widget.get_model().foreach(iterate_list, None)
-
-    return items
-
-
-def get_widget_str_value(widget):
-    if isinstance(widget, (gtk.SpinButton, gtk.Range)):
-        # Must come before gtk.Entry for gtk.SpinButton
-
-        # Clean up float formatting
-        value = '%.2f' % widget.get_value()
-        if value.endswith('.00'): value = value[0:-3]
-        elif value.endswith('.0'): value = value[0:-2]
-        return value
-
-    elif isinstance(widget, gtk.Entry): return widget.get_text()
-
-    elif isinstance(widget, gtk.RadioButton):
-        # TODO interpret as a number? or name?
-        pass
-
-    elif isinstance(widget, gtk.ToggleButton):
-        if widget.get_active(): return 'true'
-        else: return 'false'
-
-    elif isinstance(widget, gtk.ComboBox):
-        # NOTE This does not always get the displayed text
-        return widget.get_active_text()
-
-    else:
-        print ('ERROR: unsupported widget type %s' % type(widget))
-
-
-def set_widget_str_value(widget, value):
-    if value is None: value = ''
-    value = str(value)
-
-    if isinstance(widget, (gtk.SpinButton, gtk.Range)):
-        # Must come before gtk.Entry for gtk.SpinButton
-        if value == '': value = 0
-        else:
-            try: value = float(value)
-            except: value = 0
-        widget.set_value(value)
-
-    elif isinstance(widget, (gtk.Entry, gtk.Label)):
-        if widget.get_text() != value: widget.set_text(value)
-    elif isinstance(widget, gtk.RadioButton): pass # Ignore for now
-    elif isinstance(widget, gtk.ToggleButton):
-        widget.set_active(parse_bool(value))
-    elif isinstance(widget, gtk.Button):
-        # NOTE: For some reason setting Button labels causes tooltips to hide.
-        # Only set when it has actually changed.
-        if widget.get_label() != value:
-            widget.set_label(value)
-
-    elif isinstance(widget, gtk.ComboBox):
-        items = get_combo_items(widget)
-        length = len(items)
-        for i in range(length):
-            if items[i].lower() == value.lower():
-                widget.set_active(i)
-                return
-
-        print ('ERROR: Invalid value "%s"' % value)
-
-    elif isinstance(widget, gtk.ProgressBar):
-        widget.set_text(value)
-
-        if value == '': value = '0'
-
-        if value.endswith('%'): fraction = float(value[:-1]) / 100.0
-        else: fraction = float(value)
-
-        widget.set_fraction(fraction)
-
-    else:
-        print ('ERROR: unsupported option widget type %s' % type(widget))
-
-
-def set_widget_change_action(widget, action):
-    if isinstance(widget, (gtk.Editable, gtk.ComboBox)):
-        widget.connect('changed', action)
-
-    elif isinstance(widget, gtk.Range):
-        widget.connect('value_changed', action)
-
-    elif isinstance(widget, gtk.ToggleButton):
-        widget.connect('toggled', action)
-
-    elif isinstance(widget, gtk.TreeModel):
-        widget.connect('row_changed', action)
-        widget.connect('row_inserted', action)
-        widget.connect('row_deleted', action)
-        widget.connect('rows_reordered', action)
-
-    else:
-        print ('ERROR: unsupported option widget type %s' % type(widget))
-
-
 def get_home_dir():
     if sys.platform == 'win32': return '.'
 
@@ -210,10 +92,15 @@ def get_home_dir():
     return path
 
 
-def get_theme_dirs():
-    if sys.platform == 'darwin':
-        resources = quartz_application_get_resource_path()
-        path = os.path.join(resources, 'themes')
-        return [get_home_dir() + '/themes', path]
-    return [get_home_dir() + '/themes', gtk.rc_get_theme_dir(),
-            '/usr/share/themes']
+
+# The gtk helpers are imported on first use so the rest doesn't need gtk
+sys.modules[__name__] = LazyModule(sys.modules[__name__], {
+        'SingleApp': ['single_app_host', 'single_app_port', 'single_app_addr',
+                      'SingleAppRequestHandler', 'SingleAppServer'],
+        'EntryValidator': ['EntryValidator'],
+        'PasswordValidator': ['PasswordValidator'],
+        'WidgetUtil': ['iterate_container', 'get_combo_items',
+                       'get_widget_str_value', 'set_widget_str_value',
+                       'get_widget_setter', 'set_widget_change_action',
+                       'get_theme_dirs'],
+        })
@@ -82,7 +82,7 @@ else:
 
     extra_opts = dict(
         packages = find_packages(),
-        scripts = [app],
+        scripts = [app, 'FAHMonitor'],
         data_files = [('/usr/share/pixmaps', ['images/FAHControl.png'])],
         install_requires = 'gtk2 >= 2.14.0',
         include_package_data = True,